@@ -0,0 +1,89 @@
+import click
+from app import db
+from app.models.vehicle import Vehicle
+from app.models.inspection import Inspection
+from app.models.reservation import Reservation
+from app.models.purchase import Purchase
+from app.models.review import Review
+from app.models.admin import AdminLog
+from app.utils.reservation_sweeper import reservation_sweeper
+from datetime import datetime, timedelta
+
+def _hot_queries():
+    """Consultas dos caminhos mais acessados, na forma em que os controladores as executam."""
+    now = datetime.utcnow().replace(minute=0, second=0, microsecond=0)
+    return [
+        ("Vistoria por horário", db.select(Inspection).where(Inspection.inspection_date == now)),
+        ("Reserva ativa do veículo", db.select(Reservation).where(
+            Reservation.vehicle_id == 1, Reservation.status == 'active')),
+        ("Reservas do usuário", db.select(Reservation).where(Reservation.user_id == 1)),
+        ("Compras do usuário", db.select(Purchase).where(Purchase.user_id == 1)),
+        ("Compra da reserva", db.select(Purchase).where(Purchase.reservation_id == 1)),
+        ("Vendas por período", db.select(Purchase).where(
+            Purchase.created_at >= now - timedelta(days=30), Purchase.created_at <= now)),
+        ("Avaliação da compra", db.select(Review).where(Review.purchase_id == 1)),
+        ("Avaliações recentes", db.select(Review).order_by(Review.created_at.desc()).limit(10)),
+        ("Logs recentes", db.select(AdminLog).order_by(AdminLog.created_at.desc()).limit(50)),
+        ("Veículos disponíveis por marca", db.select(Vehicle).where(
+            Vehicle.is_reserved == False, Vehicle.marca == 'Fiat')),
+        ("Veículos por marca e ano", db.select(Vehicle).where(Vehicle.marca == 'Fiat', Vehicle.ano == 2020)),
+        ("Veículos ordenados por preço", db.select(Vehicle).order_by(Vehicle.preco, Vehicle.id).limit(50)),
+    ]
+
+def _explain(statement):
+    """Executa EXPLAIN no dialeto atual e indica se houve varredura completa."""
+    dialect = db.engine.dialect
+    sql = str(statement.compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
+
+    if dialect.name == 'sqlite':
+        rows = db.session.execute(db.text(f"EXPLAIN QUERY PLAN {sql}")).all()
+        plan = [row[-1] for row in rows]
+        full_scan = any(
+            detail.startswith('SCAN') and 'INDEX' not in detail
+            for detail in plan
+        )
+        return plan, full_scan
+
+    result = db.session.execute(db.text(f"EXPLAIN {sql}"))
+    columns = list(result.keys())
+    rows = [dict(zip(columns, row)) for row in result.all()]
+    plan = [
+        ", ".join(f"{key}={value}" for key, value in row.items() if value is not None)
+        for row in rows
+    ]
+    # MySQL informa type=ALL quando lê a tabela inteira
+    full_scan = any(str(row.get('type', '')).upper() == 'ALL' for row in rows)
+    return plan, full_scan
+
+def register_commands(app):
+    """Registra os comandos de linha de comando da aplicação."""
+
+    @app.cli.command('explain-hot-queries')
+    def explain_hot_queries():
+        """Mostra o plano de execução das consultas mais acessadas."""
+        failures = 0
+        for name, statement in _hot_queries():
+            plan, full_scan = _explain(statement)
+            status = "FULL SCAN" if full_scan else "OK"
+            click.echo(f"[{status}] {name}")
+            for line in plan:
+                click.echo(f"    {line}")
+            if full_scan:
+                failures += 1
+
+        if failures:
+            click.echo(f"{failures} consulta(s) com varredura completa.")
+            raise SystemExit(1)
+        click.echo("Nenhuma consulta faz varredura completa.")
+
+    @app.cli.command('expire-reservations')
+    @click.option('--ttl-hours', type=float, default=None, help='Validade das reservas (padrão: RESERVATION_TTL_HOURS).')
+    @click.option('--batch-size', type=int, default=None, help='Reservas por transação (padrão: RESERVATION_SWEEP_BATCH_SIZE).')
+    def expire_reservations(ttl_hours, batch_size):
+        """Expira as reservas ativas vencidas e libera os veículos (para uso em cron)."""
+        ttl = timedelta(hours=ttl_hours) if ttl_hours is not None else None
+        result = reservation_sweeper.sweep(ttl=ttl, batch_size=batch_size)
+        click.echo(
+            f"{result['expired']} reserva(s) expirada(s), {result['released']} veículo(s) liberado(s) "
+            f"em {result['duration_ms']:.1f} ms ({result['batches']} lote(s))."
+        )
\ No newline at end of file
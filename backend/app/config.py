@@ -1,14 +1,98 @@
-import os
-from dotenv import load_dotenv
-
-# Carrega as variáveis do arquivo .env
-load_dotenv()
-
-class Config:
-    """Class de configuração da aplicação Flask"""
-
-    SQLALCHEMY_DATABASE_URI = os.getenv("DATABASE_URL")
-
-    SQLALCHEMY_TRACK_MODIFICATIONS = False
-
-    SECRET_KEY = os.getenv("SECRET_KEY")
\ No newline at end of file
+import os
+from dotenv import load_dotenv
+
+# Carrega as variáveis do arquivo .env
+load_dotenv()
+
+class Config:
+    """Class de configuração da aplicação Flask"""
+
+    SQLALCHEMY_DATABASE_URI = os.getenv("DATABASE_URL")
+
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+
+    SECRET_KEY = os.getenv("SECRET_KEY")
+
+    # Paginação por cursor das listagens
+    PAGINATION_DEFAULT_LIMIT = int(os.getenv("PAGINATION_DEFAULT_LIMIT", 50))
+    PAGINATION_MAX_LIMIT = int(os.getenv("PAGINATION_MAX_LIMIT", 200))
+
+    # Sugestões de marca/modelo (autocomplete)
+    SUGGEST_MAX_LIMIT = int(os.getenv("SUGGEST_MAX_LIMIT", 20))
+    SUGGEST_MIN_SIMILARITY = float(os.getenv("SUGGEST_MIN_SIMILARITY", 0.3))
+    SUGGEST_REFRESH_SECONDS = int(os.getenv("SUGGEST_REFRESH_SECONDS", 300))
+
+    # Limites das faixas de preço usadas nas facetas da busca
+    VEHICLE_PRICE_BUCKETS = os.getenv("VEHICLE_PRICE_BUCKETS", "20000,50000,100000,200000")
+
+    # Cache dos resultados da busca de veículos (por processo: com vários workers, até SEARCH_CACHE_TTL segundos desatualizado)
+    SEARCH_CACHE_ENABLED = os.getenv("SEARCH_CACHE_ENABLED", "true").lower() == "true"
+    SEARCH_CACHE_MAX_BYTES = int(os.getenv("SEARCH_CACHE_MAX_BYTES", 32 * 1024 * 1024))
+    SEARCH_CACHE_TTL = int(os.getenv("SEARCH_CACHE_TTL", 30))
+
+    # Snapshot colunar (NumPy) do catálogo para a busca; opcional
+    VEHICLE_SNAPSHOT_ENABLED = os.getenv("VEHICLE_SNAPSHOT_ENABLED", "false").lower() == "true"
+    VEHICLE_SNAPSHOT_REFRESH_SECONDS = int(os.getenv("VEHICLE_SNAPSHOT_REFRESH_SECONDS", 300))
+
+    # Importação de veículos em lote
+    VEHICLE_IMPORT_BATCH_SIZE = int(os.getenv("VEHICLE_IMPORT_BATCH_SIZE", 1000))
+    VEHICLE_IMPORT_MAX_BATCH_SIZE = int(os.getenv("VEHICLE_IMPORT_MAX_BATCH_SIZE", 5000))
+    VEHICLE_IMPORT_MAX_ERRORS = int(os.getenv("VEHICLE_IMPORT_MAX_ERRORS", 1000))
+
+    # Armazenamento local das fotos de veículos (padrão: instance/photos)
+    PHOTO_STORAGE_DIR = os.getenv("PHOTO_STORAGE_DIR")
+    PHOTO_MAX_BYTES = int(os.getenv("PHOTO_MAX_BYTES", 10 * 1024 * 1024))
+    PHOTO_THUMBNAIL_SIZE = os.getenv("PHOTO_THUMBNAIL_SIZE", "320x240")
+    PHOTO_THUMBNAIL_WORKERS = int(os.getenv("PHOTO_THUMBNAIL_WORKERS", 2))
+    # Profundidade máxima de ?expand= na serialização
+    SERIALIZE_MAX_DEPTH = int(os.getenv("SERIALIZE_MAX_DEPTH", 3))
+    # Serialização JSON com orjson (se instalado); false força a biblioteca padrão
+    JSON_USE_ORJSON = os.getenv("JSON_USE_ORJSON", "true").lower() == "true"
+    # Exportação em streaming: linhas lidas do banco por lote
+    EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", 1000))
+    # Compressão das respostas (zstd/brotli exigem os pacotes zstandard/brotli)
+    COMPRESS_ENABLED = os.getenv("COMPRESS_ENABLED", "true").lower() == "true"
+    COMPRESS_MIN_SIZE = int(os.getenv("COMPRESS_MIN_SIZE", 1024))
+    COMPRESS_ALGORITHMS = os.getenv("COMPRESS_ALGORITHMS", "zstd,br,gzip")
+    COMPRESS_LEVEL_GZIP = int(os.getenv("COMPRESS_LEVEL_GZIP", 6))
+    COMPRESS_LEVEL_BR = int(os.getenv("COMPRESS_LEVEL_BR", 4))
+    COMPRESS_LEVEL_ZSTD = int(os.getenv("COMPRESS_LEVEL_ZSTD", 3))
+    # Calendário de vistorias (datas bloqueadas: AAAA-MM-DD separadas por vírgula; dias fechados: 0=segunda ... 6=domingo)
+    INSPECTION_OPENING_TIME = os.getenv("INSPECTION_OPENING_TIME", "09:00")
+    INSPECTION_CLOSING_TIME = os.getenv("INSPECTION_CLOSING_TIME", "17:00")
+    INSPECTION_SLOT_MINUTES = int(os.getenv("INSPECTION_SLOT_MINUTES", 60))
+    INSPECTION_BAYS = int(os.getenv("INSPECTION_BAYS", 1))
+    INSPECTION_DAYS_AHEAD = int(os.getenv("INSPECTION_DAYS_AHEAD", 7))
+    INSPECTION_MAX_DAYS_AHEAD = int(os.getenv("INSPECTION_MAX_DAYS_AHEAD", 90))
+    INSPECTION_BLACKOUT_DATES = os.getenv("INSPECTION_BLACKOUT_DATES", "")
+    INSPECTION_CLOSED_WEEKDAYS = os.getenv("INSPECTION_CLOSED_WEEKDAYS", "")
+    # Feed de eventos (SSE): fila por cliente, histórico para Last-Event-ID e keepalive
+    EVENTS_QUEUE_SIZE = int(os.getenv("EVENTS_QUEUE_SIZE", 100))
+    EVENTS_HISTORY_SIZE = int(os.getenv("EVENTS_HISTORY_SIZE", 1000))
+    EVENTS_HEARTBEAT_SECONDS = int(os.getenv("EVENTS_HEARTBEAT_SECONDS", 15))
+    EVENTS_RETRY_MS = int(os.getenv("EVENTS_RETRY_MS", 3000))
+    # Validade das reservas ativas; a varredura roda a cada N segundos (0: apenas pelo comando flask expire-reservations)
+    RESERVATION_TTL_HOURS = float(os.getenv("RESERVATION_TTL_HOURS", 48))
+    RESERVATION_SWEEP_INTERVAL_SECONDS = int(os.getenv("RESERVATION_SWEEP_INTERVAL_SECONDS", 300))
+    RESERVATION_SWEEP_BATCH_SIZE = int(os.getenv("RESERVATION_SWEEP_BATCH_SIZE", 500))
+    # Cache dos tokens de administrador verificados e dos administradores autenticados
+    ADMIN_CACHE_ENABLED = os.getenv("ADMIN_CACHE_ENABLED", "true").lower() == "true"
+    ADMIN_CACHE_TTL = int(os.getenv("ADMIN_CACHE_TTL", 60))
+    ADMIN_CACHE_MAX_ENTRIES = int(os.getenv("ADMIN_CACHE_MAX_ENTRIES", 10000))
+    # Cache dos usuários autenticados consultado pelo user_loader do Flask-Login
+    USER_CACHE_ENABLED = os.getenv("USER_CACHE_ENABLED", "true").lower() == "true"
+    USER_CACHE_TTL = int(os.getenv("USER_CACHE_TTL", 300))
+    USER_CACHE_MAX_ENTRIES = int(os.getenv("USER_CACHE_MAX_ENTRIES", 10000))
+    # Hash de senhas (formato do Werkzeug, ex.: scrypt:32768:8:1 ou pbkdf2:sha256:600000); hashes antigos são
+    # regravados no login. Pool de processos com fila limitada: acima de MAX_PENDING a requisição recebe 503
+    PASSWORD_HASH_METHOD = os.getenv("PASSWORD_HASH_METHOD", "scrypt:32768:8:1")
+    PASSWORD_HASH_SALT_LENGTH = int(os.getenv("PASSWORD_HASH_SALT_LENGTH", 16))
+    PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", 2))
+    PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", 32))
+    PASSWORD_HASH_TIMEOUT = float(os.getenv("PASSWORD_HASH_TIMEOUT", 10))
+    # Logs de auditoria e last_login dos administradores gravados em lote por uma thread (false grava na hora)
+    AUDIT_LOG_ASYNC = os.getenv("AUDIT_LOG_ASYNC", "true").lower() == "true"
+    AUDIT_LOG_BATCH_SIZE = int(os.getenv("AUDIT_LOG_BATCH_SIZE", 100))
+    AUDIT_LOG_FLUSH_SECONDS = float(os.getenv("AUDIT_LOG_FLUSH_SECONDS", 1.0))
+    AUDIT_LOG_QUEUE_SIZE = int(os.getenv("AUDIT_LOG_QUEUE_SIZE", 10000))
+    AUDIT_LOG_RETRIES = int(os.getenv("AUDIT_LOG_RETRIES", 3))
\ No newline at end of file
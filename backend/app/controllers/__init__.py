@@ -1,23 +1,27 @@
-from app.controllers.user_controller import UserController
-from app.controllers.vehicle_controller import VehicleController
-from app.controllers.inspection_controller import InspectionController
-from app.controllers.reservation_controller import ReservationController
-from app.controllers.admin_auth_controller import AdminAuthController
-from app.controllers.admin_management_controller import AdminManagementController
-from app.controllers.admin_system_controller import AdminSystemController
-from app.controllers.purchase_controller import PurchaseController
-from app.controllers.review_controller import ReviewController
-from app.controllers.sales_report_controller import SalesReportController
-
-__all__ = [
-    "UserController", 
-    "VehicleController", 
-    "InspectionController", 
-    "ReservationController",
-    "AdminAuthController",
-    "AdminManagementController", 
-    "AdminSystemController",
-    "PurchaseController",
-    "ReviewController",
-    "SalesReportController"
+from app.controllers.user_controller import UserController
+from app.controllers.vehicle_controller import VehicleController
+from app.controllers.inspection_controller import InspectionController
+from app.controllers.reservation_controller import ReservationController
+from app.controllers.admin_auth_controller import AdminAuthController
+from app.controllers.admin_management_controller import AdminManagementController
+from app.controllers.admin_system_controller import AdminSystemController
+from app.controllers.purchase_controller import PurchaseController
+from app.controllers.review_controller import ReviewController
+from app.controllers.sales_report_controller import SalesReportController
+from app.controllers.photo_controller import PhotoController
+from app.controllers.event_controller import EventController
+
+__all__ = [
+    "UserController", 
+    "VehicleController", 
+    "InspectionController", 
+    "ReservationController",
+    "AdminAuthController",
+    "AdminManagementController", 
+    "AdminSystemController",
+    "PurchaseController",
+    "ReviewController",
+    "SalesReportController",
+    "PhotoController",
+    "EventController"
 ]
\ No newline at end of file
@@ -1,199 +1,486 @@
-from flask import jsonify, request
-from app.models.user import User
-from app.models.vehicle import Vehicle
-from app.models.inspection import Inspection
-from app.models.reservation import Reservation
-from app.models.admin import Admin
-from app import db
-from app.controllers.admin_auth_controller import token_required, permission_required, log_admin_action
-
-class AdminManagementController:
-    """Controlador para gestão de entidades do sistema."""
-
-    # Gestão de Usuários
-    @staticmethod
-    @token_required
-    @permission_required('manage_users')
-    def get_users(admin):
-        """Retorna lista de todos os usuários cadastrados."""
-        try:
-            users = User.query.all()
-            return jsonify({
-                "users": [user.to_dict() for user in users],
-                "total": len(users)
-            }), 200
-        except Exception as e:
-            return jsonify({"error": str(e)}), 500
-
-    @staticmethod
-    @token_required
-    @permission_required('manage_users')
-    def get_user(admin, user_id):
-        """Retorna detalhes de um usuário específico."""
-        user = User.query.get(user_id)
-        if not user:
-            return jsonify({"error": "Usuário não encontrado."}), 404
-        
-        return jsonify({"user": user.to_dict()}), 200
-
-    @staticmethod
-    @token_required
-    @permission_required('manage_users')
-    def update_user(admin, user_id):
-        """Atualiza os dados de um usuário."""
-        user = User.query.get(user_id)
-        if not user:
-            return jsonify({"error": "Usuário não encontrado."}), 404
-        
-        data = request.get_json()
-        if not data:
-            return jsonify({"error": "Dados inválidos."}), 400
-        
-        if 'username' in data:
-            if User.query.filter_by(username=data['username']).first() and data['username'] != user.username:
-                return jsonify({"error": "Username já em uso."}), 400
-            user.username = data['username']
-        
-        if 'email' in data:
-            if User.query.filter_by(email=data['email']).first() and data['email'] != user.email:
-                return jsonify({"error": "Email já em uso."}), 400
-            user.email = data['email']
-        
-        try:
-            db.session.commit()
-            log_admin_action(admin, "UPDATE_USER", f"Administrador atualizou usuário ID: {user_id}")
-            return jsonify({
-                "message": "Usuário atualizado com sucesso.",
-                "user": user.to_dict()
-            }), 200
-        except Exception as e:
-            db.session.rollback()
-            return jsonify({"error": str(e)}), 500
-
-    # Gestão de Veículos
-    @staticmethod
-    @token_required
-    @permission_required('manage_vehicles')
-    def get_vehicles(admin):
-        """Retorna lista de todos os veículos."""
-        try:
-            vehicles = Vehicle.query.all()
-            return jsonify({
-                "vehicles": [vehicle.to_dict() for vehicle in vehicles],
-                "total": len(vehicles)
-            }), 200
-        except Exception as e:
-            return jsonify({"error": str(e)}), 500
-
-    @staticmethod
-    @token_required
-    @permission_required('manage_vehicles')
-    def create_vehicle(admin):
-        """Cria um novo veículo."""
-        data = request.get_json()
-        
-        required_fields = ['marca', 'modelo', 'ano', 'preco']
-        if not data or not all(field in data for field in required_fields):
-            return jsonify({"error": "Marca, modelo, ano e preço são obrigatórios."}), 400
-        
-        new_vehicle = Vehicle(
-            marca=data['marca'],
-            modelo=data['modelo'],
-            ano=data['ano'],
-            preco=data['preco'],
-            photo_url=data.get('photo_url'),
-            is_reserved=False
-        )
-        
-        try:
-            db.session.add(new_vehicle)
-            db.session.commit()
-            
-            log_admin_action(admin, "CREATE_VEHICLE", f"Administrador criou veículo: {data['marca']} {data['modelo']}")
-            
-            return jsonify({
-                "message": "Veículo criado com sucesso.",
-                "vehicle": new_vehicle.to_dict()
-            }), 201
-        except Exception as e:
-            db.session.rollback()
-            return jsonify({"error": str(e)}), 500
-
-    @staticmethod
-    @token_required
-    @permission_required('manage_vehicles')
-    def update_vehicle(admin, vehicle_id):
-        """Atualiza um veículo."""
-        vehicle = Vehicle.query.get(vehicle_id)
-        if not vehicle:
-            return jsonify({"error": "Veículo não encontrado."}), 404
-        
-        data = request.get_json()
-        if not data:
-            return jsonify({"error": "Dados inválidos."}), 400
-        
-        updatable_fields = ['marca', 'modelo', 'ano', 'preco', 'photo_url', 'is_reserved']
-        for field in updatable_fields:
-            if field in data:
-                setattr(vehicle, field, data[field])
-        
-        try:
-            db.session.commit()
-            log_admin_action(admin, "UPDATE_VEHICLE", f"Administrador atualizou veículo ID: {vehicle_id}")
-            return jsonify({
-                "message": "Veículo atualizado com sucesso.",
-                "vehicle": vehicle.to_dict()
-            }), 200
-        except Exception as e:
-            db.session.rollback()
-            return jsonify({"error": str(e)}), 500
-
-    @staticmethod
-    @token_required
-    @permission_required('manage_vehicles')
-    def delete_vehicle(admin, vehicle_id):
-        """Deleta um veículo."""
-        vehicle = Vehicle.query.get(vehicle_id)
-        if not vehicle:
-            return jsonify({"error": "Veículo não encontrado."}), 404
-        
-        try:
-            db.session.delete(vehicle)
-            db.session.commit()
-            
-            log_admin_action(admin, "DELETE_VEHICLE", f"Administrador deletou veículo ID: {vehicle_id}")
-            
-            return jsonify({"message": "Veículo deletado com sucesso."}), 200
-        except Exception as e:
-            db.session.rollback()
-            return jsonify({"error": str(e)}), 500
-
-    # Gestão de Vistorias
-    @staticmethod
-    @token_required
-    @permission_required('manage_inspections')
-    def get_inspections(admin):
-        """Retorna lista de todas as vistorias."""
-        try:
-            inspections = Inspection.query.all()
-            return jsonify({
-                "inspections": [inspection.to_dict() for inspection in inspections],
-                "total": len(inspections)
-            }), 200
-        except Exception as e:
-            return jsonify({"error": str(e)}), 500
-
-    # Gestão de Reservas
-    @staticmethod
-    @token_required
-    @permission_required('manage_reservations')
-    def get_reservations(admin):
-        """Retorna lista de todas as reservas."""
-        try:
-            reservations = Reservation.query.all()
-            return jsonify({
-                "reservations": [reservation.to_dict() for reservation in reservations],
-                "total": len(reservations)
-            }), 200
-        except Exception as e:
-            return jsonify({"error": str(e)}), 500
\ No newline at end of file
+from flask import jsonify, request, current_app, url_for
+from app.models.user import User
+from app.models.vehicle import Vehicle
+from app.models.inspection import Inspection
+from app.models.reservation import Reservation
+from app.models.admin import Admin
+from app import db
+from app.utils.pagination import paginate_keyset
+from app.utils.conditional import conditional_response
+from app.utils.vehicle_import import import_vehicles, iter_csv_rows, iter_ndjson_rows
+from app.utils.vehicle_events import record_vehicle_change
+from app.utils.table_versions import record_table_change
+from app.utils.photo_storage import photo_storage
+from app.utils.serialization import read_serialization_params, eager_options
+from app.utils.export import export_response
+from app.controllers.vehicle_controller import validate_vehicle_data
+from app.controllers.admin_auth_controller import token_required, permission_required, log_admin_action
+import csv
+
+PRICE_RULES = ('absolute', 'percent', 'set')
+
+# Colunas disponíveis nas exportações (?columns=); a senha nunca é exportada
+USER_EXPORT_COLUMNS = ('id', 'username', 'email', 'created_at')
+VEHICLE_EXPORT_COLUMNS = ('id', 'marca', 'modelo', 'ano', 'preco', 'is_reserved', 'photo_url', 'created_at')
+INSPECTION_EXPORT_COLUMNS = ('id', 'user_id', 'vehicle_id', 'inspection_date', 'bay', 'status', 'report', 'created_at')
+RESERVATION_EXPORT_COLUMNS = ('id', 'user_id', 'vehicle_id', 'inspection_id', 'amount', 'status', 'created_at')
+
+def _bulk_vehicle_conditions(criteria):
+    """Monta as condições WHERE do filtro de uma atualização em lote; lança ValueError se inválido."""
+    if not isinstance(criteria, dict):
+        raise ValueError("O filtro deve ser um objeto.")
+
+    conditions = []
+    for field in ('marca', 'modelo'):
+        if field in criteria:
+            if not isinstance(criteria[field], str) or not criteria[field]:
+                raise ValueError(f"O filtro '{field}' deve ser um texto.")
+            conditions.append(getattr(Vehicle, field) == criteria[field])
+    for field, operator in (('ano_min', '__ge__'), ('ano_max', '__le__')):
+        if field in criteria:
+            if not isinstance(criteria[field], int) or isinstance(criteria[field], bool):
+                raise ValueError(f"O filtro '{field}' deve ser um número inteiro.")
+            conditions.append(getattr(Vehicle.ano, operator)(criteria[field]))
+    if 'ids' in criteria:
+        if not isinstance(criteria['ids'], list) or not all(
+            isinstance(i, int) and not isinstance(i, bool) for i in criteria['ids']
+        ):
+            raise ValueError("O filtro 'ids' deve ser uma lista de inteiros.")
+        conditions.append(Vehicle.id.in_(criteria['ids']))
+
+    if not conditions and criteria.get('all') is not True:
+        raise ValueError("Informe ao menos um filtro (marca, modelo, ano_min, ano_max, ids) ou 'all': true.")
+    return conditions
+
+def _price_values(rule):
+    """Converte a regra de preço em (expressão do novo preço, condições extras)."""
+    if not isinstance(rule, dict) or rule.get('mode') not in PRICE_RULES:
+        raise ValueError("A regra de preço deve ter 'mode' igual a absolute, percent ou set.")
+    value = rule.get('value')
+    if not isinstance(value, (int, float)) or isinstance(value, bool):
+        raise ValueError("A regra de preço deve ter um 'value' numérico.")
+
+    if rule['mode'] == 'set':
+        if value <= 0:
+            raise ValueError("Preço deve ser um número positivo.")
+        return value, []
+    if rule['mode'] == 'percent':
+        if value <= -100:
+            raise ValueError("O percentual deve ser maior que -100.")
+        new_price = db.func.round(Vehicle.preco * (1 + value / 100.0), 2)
+        # Descontos próximos de -100% arredondariam preços baixos para zero: esses veículos ficam de fora
+        return new_price, [new_price >= 0.01]
+    # Variação absoluta: ignora veículos cujo preço ficaria não positivo
+    return Vehicle.preco + value, [Vehicle.preco + value > 0]
+
+class AdminManagementController:
+    """Controlador para gestão de entidades do sistema."""
+
+    # Gestão de Usuários
+    @staticmethod
+    @token_required
+    @permission_required('manage_users')
+    @conditional_response('user')
+    def get_users(admin):
+        """Retorna lista de todos os usuários cadastrados."""
+        try:
+            serialization = read_serialization_params()
+            page = paginate_keyset(User.query.options(*eager_options(User, **serialization)), User, sort_fields=('created_at',))
+            return jsonify({
+                "users": [user.to_dict(**serialization) for user in page['items']],
+                "next_cursor": page['next_cursor'],
+                "limit": page['limit'],
+                "total": page['total']
+            }), 200
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+
+    @staticmethod
+    @token_required
+    @permission_required('manage_users')
+    def export_users(admin):
+        """Exporta todos os usuários em NDJSON ou CSV (streaming, ?format= e ?columns=)."""
+        try:
+            response = export_response(User, USER_EXPORT_COLUMNS, 'usuarios')
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        log_admin_action(admin, "EXPORT_USERS", "Administrador exportou os usuários")
+        return response
+
+    @staticmethod
+    @token_required
+    @permission_required('manage_users')
+    def get_user(admin, user_id):
+        """Retorna detalhes de um usuário específico."""
+        user = User.query.get(user_id)
+        if not user:
+            return jsonify({"error": "Usuário não encontrado."}), 404
+        
+        return jsonify({"user": user.to_dict()}), 200
+
+    @staticmethod
+    @token_required
+    @permission_required('manage_users')
+    def update_user(admin, user_id):
+        """Atualiza os dados de um usuário."""
+        user = User.query.get(user_id)
+        if not user:
+            return jsonify({"error": "Usuário não encontrado."}), 404
+        
+        data = request.get_json()
+        if not data:
+            return jsonify({"error": "Dados inválidos."}), 400
+        
+        if 'username' in data:
+            if User.query.filter_by(username=data['username']).first() and data['username'] != user.username:
+                return jsonify({"error": "Username já em uso."}), 400
+            user.username = data['username']
+        
+        if 'email' in data:
+            if User.query.filter_by(email=data['email']).first() and data['email'] != user.email:
+                return jsonify({"error": "Email já em uso."}), 400
+            user.email = data['email']
+        
+        try:
+            db.session.commit()
+            log_admin_action(admin, "UPDATE_USER", f"Administrador atualizou usuário ID: {user_id}")
+            return jsonify({
+                "message": "Usuário atualizado com sucesso.",
+                "user": user.to_dict()
+            }), 200
+        except Exception as e:
+            db.session.rollback()
+            return jsonify({"error": str(e)}), 500
+
+    # Gestão de Veículos
+    @staticmethod
+    @token_required
+    @permission_required('manage_vehicles')
+    @conditional_response('vehicle')
+    def get_vehicles(admin):
+        """Retorna lista de todos os veículos."""
+        try:
+            serialization = read_serialization_params()
+            page = paginate_keyset(Vehicle.query.options(*eager_options(Vehicle, **serialization)), Vehicle, sort_fields=('preco', 'ano', 'created_at'))
+            return jsonify({
+                "vehicles": [vehicle.to_dict(**serialization) for vehicle in page['items']],
+                "next_cursor": page['next_cursor'],
+                "limit": page['limit'],
+                "total": page['total']
+            }), 200
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+
+    @staticmethod
+    @token_required
+    @permission_required('manage_vehicles')
+    def export_vehicles(admin):
+        """Exporta todos os veículos em NDJSON ou CSV (streaming, ?format= e ?columns=)."""
+        try:
+            response = export_response(Vehicle, VEHICLE_EXPORT_COLUMNS, 'veiculos')
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        log_admin_action(admin, "EXPORT_VEHICLES", "Administrador exportou os veículos")
+        return response
+
+    @staticmethod
+    @token_required
+    @permission_required('manage_vehicles')
+    def create_vehicle(admin):
+        """Cria um novo veículo."""
+        data = request.get_json()
+        
+        required_fields = ['marca', 'modelo', 'ano', 'preco']
+        if not data or not all(field in data for field in required_fields):
+            return jsonify({"error": "Marca, modelo, ano e preço são obrigatórios."}), 400
+        
+        new_vehicle = Vehicle(
+            marca=data['marca'],
+            modelo=data['modelo'],
+            ano=data['ano'],
+            preco=data['preco'],
+            photo_url=data.get('photo_url'),
+            is_reserved=False
+        )
+        
+        try:
+            db.session.add(new_vehicle)
+            db.session.commit()
+            
+            log_admin_action(admin, "CREATE_VEHICLE", f"Administrador criou veículo: {data['marca']} {data['modelo']}")
+            
+            return jsonify({
+                "message": "Veículo criado com sucesso.",
+                "vehicle": new_vehicle.to_dict()
+            }), 201
+        except Exception as e:
+            db.session.rollback()
+            return jsonify({"error": str(e)}), 500
+
+    @staticmethod
+    @token_required
+    @permission_required('manage_vehicles')
+    def bulk_create_vehicles(admin):
+        """Importa veículos em lote a partir de CSV ou NDJSON, lendo o corpo como stream."""
+        content_type = (request.mimetype or '').lower()
+        file_format = request.args.get('format')
+        if not file_format:
+            if content_type in ('text/csv', 'application/csv'):
+                file_format = 'csv'
+            elif content_type in ('application/x-ndjson', 'application/ndjson', 'application/jsonl'):
+                file_format = 'ndjson'
+        if file_format not in ('csv', 'ndjson'):
+            return jsonify({"error": "Envie text/csv ou application/x-ndjson (ou use ?format=csv|ndjson)."}), 415
+
+        batch_size = request.args.get(
+            'batch_size', current_app.config.get('VEHICLE_IMPORT_BATCH_SIZE', 1000), type=int
+        )
+        if batch_size < 1:
+            return jsonify({"error": "O parâmetro batch_size deve ser positivo."}), 400
+        batch_size = min(batch_size, current_app.config.get('VEHICLE_IMPORT_MAX_BATCH_SIZE', 5000))
+
+        rows = iter_csv_rows(request.stream) if file_format == 'csv' else iter_ndjson_rows(request.stream)
+        try:
+            summary = import_vehicles(
+                rows,
+                validate=validate_vehicle_data,
+                batch_size=batch_size,
+                max_errors=current_app.config.get('VEHICLE_IMPORT_MAX_ERRORS', 1000)
+            )
+        except (UnicodeDecodeError, csv.Error) as e:
+            db.session.rollback()
+            return jsonify({"error": f"Arquivo inválido: {e}"}), 400
+
+        log_admin_action(
+            admin, "BULK_CREATE_VEHICLES",
+            f"Administrador importou {summary['inserted']} veículo(s) via {file_format.upper()} "
+            f"({summary['failed']} linha(s) com erro)"
+        )
+
+        status = 201 if summary['inserted'] else 400
+        return jsonify({
+            "message": f"{summary['inserted']} veículo(s) importado(s).",
+            **summary
+        }), status
+
+    @staticmethod
+    @token_required
+    @permission_required('manage_vehicles')
+    def bulk_update_vehicles(admin):
+        """Reprecifica ou altera o status de veículos em lote com um único UPDATE.
+
+        Corpo: {"filter": {...}, "price": {"mode": ..., "value": ...}} ou
+        {"filter": {...}, "is_reserved": bool}, com "dry_run": true opcional.
+        """
+        data = request.get_json()
+        if not data:
+            return jsonify({"error": "Dados inválidos."}), 400
+        if ('price' in data) == ('is_reserved' in data):
+            return jsonify({"error": "Informe exatamente uma operação: 'price' ou 'is_reserved'."}), 400
+
+        try:
+            conditions = _bulk_vehicle_conditions(data.get('filter', {}))
+            if 'price' in data:
+                new_price, extra_conditions = _price_values(data['price'])
+                # Assim como na atualização individual, veículos reservados não são alterados
+                conditions += extra_conditions + [Vehicle.is_reserved == False]
+                values = {'preco': new_price}
+                operation = f"preço ({data['price']['mode']} {data['price']['value']})"
+            else:
+                if not isinstance(data['is_reserved'], bool):
+                    raise ValueError("O campo 'is_reserved' deve ser booleano.")
+                # Veículos com reserva ativa mantêm o status controlado pelo fluxo de reservas
+                active_reservation = db.exists().where(
+                    Reservation.vehicle_id == Vehicle.id, Reservation.status == 'active'
+                )
+                conditions += [~active_reservation, Vehicle.is_reserved != data['is_reserved']]
+                values = {'is_reserved': data['is_reserved']}
+                operation = f"status (is_reserved={data['is_reserved']})"
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        try:
+            if data.get('dry_run'):
+                matched = db.session.query(db.func.count(Vehicle.id)).filter(*conditions).scalar()
+                return jsonify({
+                    "message": "Simulação concluída. Nenhum veículo foi alterado.",
+                    "dry_run": True,
+                    "matched": matched
+                }), 200
+
+            result = db.session.execute(
+                db.update(Vehicle).where(*conditions).values(**values)
+                .execution_options(synchronize_session=False)
+            )
+            updated = result.rowcount
+            if updated:
+                record_table_change(db.session, Vehicle.__tablename__)
+                record_vehicle_change(db.session, 'bulk', None)
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            return jsonify({"error": str(e)}), 500
+
+        log_admin_action(
+            admin, "BULK_UPDATE_VEHICLES",
+            f"Administrador alterou {operation} de {updated} veículo(s) em lote"
+        )
+        return jsonify({
+            "message": f"{updated} veículo(s) atualizado(s).",
+            "dry_run": False,
+            "updated": updated
+        }), 200
+
+    @staticmethod
+    @token_required
+    @permission_required('manage_vehicles')
+    def update_vehicle(admin, vehicle_id):
+        """Atualiza um veículo."""
+        vehicle = Vehicle.query.get(vehicle_id)
+        if not vehicle:
+            return jsonify({"error": "Veículo não encontrado."}), 404
+        
+        data = request.get_json()
+        if not data:
+            return jsonify({"error": "Dados inválidos."}), 400
+        
+        updatable_fields = ['marca', 'modelo', 'ano', 'preco', 'photo_url', 'is_reserved']
+        for field in updatable_fields:
+            if field in data:
+                setattr(vehicle, field, data[field])
+        
+        try:
+            db.session.commit()
+            log_admin_action(admin, "UPDATE_VEHICLE", f"Administrador atualizou veículo ID: {vehicle_id}")
+            return jsonify({
+                "message": "Veículo atualizado com sucesso.",
+                "vehicle": vehicle.to_dict()
+            }), 200
+        except Exception as e:
+            db.session.rollback()
+            return jsonify({"error": str(e)}), 500
+
+    @staticmethod
+    @token_required
+    @permission_required('manage_vehicles')
+    def upload_vehicle_photo(admin, vehicle_id):
+        """Armazena a foto do veículo localmente (deduplicada pelo conteúdo) e agenda a miniatura."""
+        vehicle = Vehicle.query.get(vehicle_id)
+        if not vehicle:
+            return jsonify({"error": "Veículo não encontrado."}), 404
+
+        photo = request.files.get('photo')
+        if photo is None:
+            return jsonify({"error": "Envie a imagem no campo 'photo' (multipart/form-data)."}), 400
+
+        try:
+            digest, ext, created = photo_storage.save(photo.stream)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        vehicle.photo_url = url_for('photo.get_photo', digest=digest, ext=ext, _external=True)
+
+        try:
+            db.session.commit()
+            photo_storage.request_thumbnail(digest)
+            log_admin_action(admin, "UPLOAD_VEHICLE_PHOTO", f"Administrador enviou foto do veículo ID: {vehicle_id}")
+            return jsonify({
+                "message": "Foto enviada com sucesso.",
+                "deduplicated": not created,
+                "vehicle": vehicle.to_dict()
+            }), 200
+        except Exception as e:
+            db.session.rollback()
+            return jsonify({"error": str(e)}), 500
+
+    @staticmethod
+    @token_required
+    @permission_required('manage_vehicles')
+    def delete_vehicle(admin, vehicle_id):
+        """Deleta um veículo."""
+        vehicle = Vehicle.query.get(vehicle_id)
+        if not vehicle:
+            return jsonify({"error": "Veículo não encontrado."}), 404
+        
+        try:
+            db.session.delete(vehicle)
+            db.session.commit()
+            
+            log_admin_action(admin, "DELETE_VEHICLE", f"Administrador deletou veículo ID: {vehicle_id}")
+            
+            return jsonify({"message": "Veículo deletado com sucesso."}), 200
+        except Exception as e:
+            db.session.rollback()
+            return jsonify({"error": str(e)}), 500
+
+    # Gestão de Vistorias
+    @staticmethod
+    @token_required
+    @permission_required('manage_inspections')
+    def get_inspections(admin):
+        """Retorna lista de todas as vistorias."""
+        try:
+            serialization = read_serialization_params()
+            page = paginate_keyset(Inspection.query.options(*eager_options(Inspection, **serialization)), Inspection, sort_fields=('inspection_date', 'created_at'))
+            return jsonify({
+                "inspections": [inspection.to_dict(**serialization) for inspection in page['items']],
+                "next_cursor": page['next_cursor'],
+                "limit": page['limit'],
+                "total": page['total']
+            }), 200
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+
+    @staticmethod
+    @token_required
+    @permission_required('manage_inspections')
+    def export_inspections(admin):
+        """Exporta todas as vistorias em NDJSON ou CSV (streaming, ?format= e ?columns=)."""
+        try:
+            response = export_response(Inspection, INSPECTION_EXPORT_COLUMNS, 'vistorias')
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        log_admin_action(admin, "EXPORT_INSPECTIONS", "Administrador exportou as vistorias")
+        return response
+
+    # Gestão de Reservas
+    @staticmethod
+    @token_required
+    @permission_required('manage_reservations')
+    def get_reservations(admin):
+        """Retorna lista de todas as reservas."""
+        try:
+            serialization = read_serialization_params()
+            page = paginate_keyset(Reservation.query.options(*eager_options(Reservation, **serialization)), Reservation, sort_fields=('created_at',))
+            return jsonify({
+                "reservations": [reservation.to_dict(**serialization) for reservation in page['items']],
+                "next_cursor": page['next_cursor'],
+                "limit": page['limit'],
+                "total": page['total']
+            }), 200
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+
+    @staticmethod
+    @token_required
+    @permission_required('manage_reservations')
+    def export_reservations(admin):
+        """Exporta todas as reservas em NDJSON ou CSV (streaming, ?format= e ?columns=)."""
+        try:
+            response = export_response(Reservation, RESERVATION_EXPORT_COLUMNS, 'reservas')
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        log_admin_action(admin, "EXPORT_RESERVATIONS", "Administrador exportou as reservas")
+        return response
\ No newline at end of file
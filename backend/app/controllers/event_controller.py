@@ -0,0 +1,44 @@
+from flask import current_app, request, stream_with_context
+from app import db
+from app.utils.event_bus import event_bus
+from flask_login import login_required
+import queue
+
+EVENT_TOPICS = ('vehicle', 'slot')
+
+class EventController:
+    """Controlador do feed de eventos (Server-Sent Events) de veículos e horários de vistoria."""
+
+    @staticmethod
+    @login_required
+    def stream():
+        """Envia as alterações de veículos e horários assim que são confirmadas (?topics=vehicle,slot)."""
+        topics = None
+        if request.args.get('topics'):
+            topics = frozenset(topic.strip() for topic in request.args['topics'].split(',')) & frozenset(EVENT_TOPICS)
+
+        last_event_id = request.headers.get('Last-Event-ID') or request.args.get('last_event_id')
+        subscriber = event_bus.subscribe(last_event_id, topics)
+        heartbeat = current_app.config.get('EVENTS_HEARTBEAT_SECONDS', 15)
+        dumps = current_app.json.dumps
+        # A conexão fica aberta por muito tempo: devolve a conexão do banco ao pool agora
+        db.session.remove()
+
+        def generate():
+            try:
+                yield f"retry: {current_app.config.get('EVENTS_RETRY_MS', 3000)}\n\n"
+                while not subscriber.overflowed:
+                    try:
+                        event_id, event_type, data = subscriber.queue.get(timeout=heartbeat)
+                    except queue.Empty:
+                        yield ": keepalive\n\n"
+                        continue
+                    yield f"id: {event_id}\nevent: {event_type}\ndata: {dumps(data)}\n\n"
+            finally:
+                event_bus.unsubscribe(subscriber)
+
+        return current_app.response_class(
+            stream_with_context(generate()),
+            mimetype='text/event-stream',
+            headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+        )
\ No newline at end of file
@@ -0,0 +1,50 @@
+from flask import jsonify, send_file
+from app.utils.photo_storage import photo_storage, PHOTO_TYPES
+import os
+import re
+
+_DIGEST = re.compile(r'^[0-9a-f]{64}$')
+
+# Fotos são endereçadas pelo conteúdo, então nunca mudam para a mesma URL
+ONE_YEAR = 365 * 24 * 60 * 60
+
+class PhotoController:
+    """Controlador para servir as fotos de veículos armazenadas localmente."""
+
+    @staticmethod
+    def _send(path, mimetype, etag, max_age):
+        # send_file usa o file_wrapper do servidor (sendfile quando disponível) e atende Range
+        response = send_file(path, mimetype=mimetype, conditional=True, etag=etag, max_age=max_age)
+        if max_age:
+            response.cache_control.public = True
+            response.cache_control.immutable = True
+        else:
+            response.cache_control.no_cache = True
+        return response
+
+    @staticmethod
+    def get_photo(digest, ext):
+        """Serve a foto original."""
+        if not _DIGEST.match(digest) or ext not in PHOTO_TYPES:
+            return jsonify({"error": "Foto não encontrada."}), 404
+
+        path = photo_storage.original_path(digest, ext)
+        if not os.path.exists(path):
+            return jsonify({"error": "Foto não encontrada."}), 404
+        return PhotoController._send(path, PHOTO_TYPES[ext], digest, ONE_YEAR)
+
+    @staticmethod
+    def get_thumbnail(digest):
+        """Serve a miniatura; enquanto ela é gerada, serve a original sem cache."""
+        if not _DIGEST.match(digest):
+            return jsonify({"error": "Foto não encontrada."}), 404
+
+        path = photo_storage.thumbnail_path(digest)
+        if os.path.exists(path):
+            return PhotoController._send(path, 'image/jpeg', f"{digest}-thumbnail", ONE_YEAR)
+
+        original, ext = photo_storage.find_original(digest)
+        if original is None:
+            return jsonify({"error": "Foto não encontrada."}), 404
+        photo_storage.request_thumbnail(digest)
+        return PhotoController._send(original, PHOTO_TYPES[ext], None, 0)
\ No newline at end of file
@@ -1,132 +1,223 @@
-from flask import jsonify, request
-from app.models.reservation import Reservation
-from app.models.vehicle import Vehicle
-from app.models.inspection import Inspection
-from app import db
-from flask_login import login_required, current_user
-from datetime import datetime
-
-class ReservationController:
-    """Controlador para operações de reservas com sinal financeiro no sistema."""
-
-    @staticmethod
-    @login_required
-    def list_reservations():
-        """Lista todas as reservas do usuário autenticado."""
-        try:
-            reservations = Reservation.query.filter_by(user_id=current_user.id).all()
-            return jsonify({
-                "reservations": [reservation.to_dict() for reservation in reservations]
-            }), 200
-        except Exception as e:
-            return jsonify({"error": str(e)}), 500
-
-    @staticmethod
-    @login_required
-    def create_reservation():
-        """Cria uma reserva com sinal financeiro para um veículo."""
-        data = request.get_json()
-
-        required_fields = ['vehicle_id', 'amount']
-        if not data or not all(field in data for field in required_fields):
-            return jsonify({"error": "Vehicle_id e amount são obrigatórios."}), 400
-
-        vehicle_id = data['vehicle_id']
-        amount = data['amount']
-        inspection_id = data.get('inspection_id')
-
-        if amount < 500.00:
-            return jsonify({"error": "O sinal deve ser de no mínimo R$ 500,00."}), 400
-
-        vehicle = Vehicle.query.get_or_404(vehicle_id)
-        active_reservation = Reservation.query.filter_by(vehicle_id=vehicle_id, status='active').first()
-        if vehicle.is_reserved or active_reservation:
-            return jsonify({"error": "Veículo já reservado."}), 400
-
-        inspection = None
-        if inspection_id:
-            inspection = Inspection.query.get_or_404(inspection_id)
-            if inspection.user_id != current_user.id:
-                return jsonify({"error": "Vistoria não pertence ao usuário atual."}), 403
-
-        new_reservation = Reservation(
-            user_id=current_user.id,
-            vehicle_id=vehicle_id,
-            inspection_id=inspection_id,
-            amount=amount,
-            status='active',
-            created_at=datetime.utcnow()
-        )
-
-        vehicle.is_reserved = True
-
-        try:
-            db.session.add(new_reservation)
-            db.session.commit()
-            return jsonify({
-                "message": "Reserva criada com sucesso. Veículo reservado com prioridade.",
-                "reservation": new_reservation.to_dict()
-            }), 201
-        except Exception as e:
-            db.session.rollback()
-            return jsonify({"error": str(e)}), 500
-
-    @staticmethod
-    @login_required
-    def confirm_purchase(reservation_id):
-        """Confirma a compra do veículo, abatendo o sinal do valor final."""
-        reservation = Reservation.query.get_or_404(reservation_id)
-
-        if reservation.user_id != current_user.id:
-            return jsonify({"error": "Acesso negado: Reserva não pertence ao usuário."}), 403
-
-        if reservation.status != 'active':
-            return jsonify({"error": "Reserva já foi concluída ou cancelada."}), 400
-
-        if reservation.inspection_id:
-            inspection = Inspection.query.get_or_404(reservation.inspection_id)
-            if inspection.status != 'completed':
-                return jsonify({"error": "A vistoria associada ainda não foi concluída."}), 400
-
-        reservation.status = 'completed'
-
-        vehicle = Vehicle.query.get(reservation.vehicle_id)
-        final_price = vehicle.preco - reservation.amount
-
-        try:
-            db.session.commit()
-            return jsonify({
-                "message": "Compra confirmada com sucesso. Sinal abatido do valor final.",
-                "reservation": reservation.to_dict(),
-                "final_price": final_price
-            }), 200
-        except Exception as e:
-            db.session.rollback()
-            return jsonify({"error": str(e)}), 500
-
-    @staticmethod
-    @login_required
-    def cancel_reservation(reservation_id):
-        """Cancela a reserva e libera o veículo para outros interessados."""
-        reservation = Reservation.query.get_or_404(reservation_id)
-
-        if reservation.user_id != current_user.id:
-            return jsonify({"error": "Acesso negado: Reserva não pertence ao usuário."}), 403
-
-        if reservation.status != 'active':
-            return jsonify({"error": "Reserva já foi concluída ou cancelada."}), 400
-
-        reservation.status = 'cancelled'
-
-        vehicle = Vehicle.query.get(reservation.vehicle_id)
-        vehicle.is_reserved = False
-
-        try:
-            db.session.commit()
-            return jsonify({
-                "message": "Reserva cancelada com sucesso. Veículo liberado. Sinal retido conforme política.",
-                "reservation": reservation.to_dict()
-            }), 200
-        except Exception as e:
-            db.session.rollback()
+from flask import jsonify, request
+from app.models.reservation import Reservation
+from app.models.vehicle import Vehicle
+from app.models.inspection import Inspection
+from app.models.purchase import Purchase
+from app import db
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import joinedload
+from flask_login import login_required, current_user
+from app.utils.serialization import read_serialization_params, eager_options
+from app.utils.vehicle_events import record_vehicle_update
+from app.utils.table_versions import record_table_change
+from datetime import datetime
+
+class ReservationController:
+    """Controlador para operações de reservas com sinal financeiro no sistema."""
+
+    @staticmethod
+    def _close_reservation(reservation, status):
+        """Encerra a reserva se ela ainda estiver ativa; False se outra operação (ex.: expiração) chegou antes."""
+        closed = db.session.execute(
+            db.update(Reservation)
+            .where(Reservation.id == reservation.id, Reservation.status == 'active')
+            .values(status=status)
+        ).rowcount
+        if closed:
+            record_table_change(db.session, Reservation.__tablename__)
+        return bool(closed)
+
+    @staticmethod
+    @login_required
+    def list_reservations():
+        """Lista todas as reservas do usuário autenticado."""
+        try:
+            serialization = read_serialization_params()
+            reservations = Reservation.query.options(
+                *eager_options(Reservation, **serialization)
+            ).filter_by(user_id=current_user.id).all()
+            return jsonify({
+                "reservations": [reservation.to_dict(**serialization) for reservation in reservations]
+            }), 200
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+
+    @staticmethod
+    @login_required
+    def create_reservation():
+        """Cria uma reserva com sinal financeiro para um veículo."""
+        data = request.get_json()
+
+        required_fields = ['vehicle_id', 'amount']
+        if not data or not all(field in data for field in required_fields):
+            return jsonify({"error": "Vehicle_id e amount são obrigatórios."}), 400
+
+        vehicle_id = data['vehicle_id']
+        amount = data['amount']
+        inspection_id = data.get('inspection_id')
+
+        if amount < 500.00:
+            return jsonify({"error": "O sinal deve ser de no mínimo R$ 500,00."}), 400
+
+        vehicle = Vehicle.query.get_or_404(vehicle_id)
+        active_reservation = Reservation.query.filter_by(vehicle_id=vehicle_id, status='active').first()
+        if vehicle.is_reserved or active_reservation:
+            return jsonify({"error": "Veículo já reservado."}), 409
+
+        inspection = None
+        if inspection_id:
+            inspection = Inspection.query.get_or_404(inspection_id)
+            if inspection.user_id != current_user.id:
+                return jsonify({"error": "Vistoria não pertence ao usuário atual."}), 403
+
+        new_reservation = Reservation(
+            user_id=current_user.id,
+            vehicle_id=vehicle_id,
+            inspection_id=inspection_id,
+            amount=amount,
+            status='active',
+            created_at=datetime.utcnow()
+        )
+
+        try:
+            # A disputa pelo veículo é decidida em uma única instrução: só a requisição que
+            # encontra is_reserved = 0 altera a linha; as demais recebem 409 sem bloquear a tabela
+            claimed = db.session.execute(
+                db.update(Vehicle)
+                .where(Vehicle.id == vehicle_id, Vehicle.is_reserved == False)
+                .values(is_reserved=True)
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            if not claimed:
+                db.session.rollback()
+                return jsonify({"error": "Veículo já reservado."}), 409
+
+            # O UPDATE direto não passa pelo flush do ORM: avisa caches, ETags e o feed de eventos
+            record_vehicle_update(db.session, vehicle, is_reserved=True)
+            record_table_change(db.session, Vehicle.__tablename__)
+
+            db.session.add(new_reservation)
+            db.session.commit()
+            return jsonify({
+                "message": "Reserva criada com sucesso. Veículo reservado com prioridade.",
+                "reservation": new_reservation.to_dict()
+            }), 201
+        except Exception as e:
+            db.session.rollback()
+            return jsonify({"error": str(e)}), 500
+
+    @staticmethod
+    @login_required
+    def confirm_purchase(reservation_id):
+        """Confirma a compra do veículo, abatendo o sinal do valor final."""
+        reservation = Reservation.query.get_or_404(reservation_id)
+
+        if reservation.user_id != current_user.id:
+            return jsonify({"error": "Acesso negado: Reserva não pertence ao usuário."}), 403
+
+        if reservation.status != 'active':
+            return jsonify({"error": "Reserva já foi concluída, cancelada ou expirada."}), 400
+
+        if reservation.inspection_id:
+            inspection = Inspection.query.get_or_404(reservation.inspection_id)
+            if inspection.status != 'completed':
+                return jsonify({"error": "A vistoria associada ainda não foi concluída."}), 400
+
+        vehicle = Vehicle.query.get(reservation.vehicle_id)
+        final_price = vehicle.preco - reservation.amount
+
+        try:
+            if not ReservationController._close_reservation(reservation, 'completed'):
+                db.session.rollback()
+                return jsonify({"error": "Reserva já foi concluída, cancelada ou expirada."}), 409
+            db.session.commit()
+            return jsonify({
+                "message": "Compra confirmada com sucesso. Sinal abatido do valor final.",
+                "reservation": reservation.to_dict(),
+                "final_price": final_price
+            }), 200
+        except Exception as e:
+            db.session.rollback()
+            return jsonify({"error": str(e)}), 500
+
+    @staticmethod
+    @login_required
+    def checkout(reservation_id):
+        """Confirma a reserva e registra a compra em uma única transação."""
+        # Reserva, veículo e vistoria em uma só consulta
+        reservation = Reservation.query.options(
+            joinedload(Reservation.vehicle), joinedload(Reservation.inspection)
+        ).filter_by(id=reservation_id).first_or_404()
+
+        if reservation.user_id != current_user.id:
+            return jsonify({"error": "Acesso negado: Reserva não pertence ao usuário."}), 403
+
+        if reservation.status != 'active':
+            return jsonify({"error": "Reserva já foi concluída, cancelada ou expirada."}), 400
+
+        if reservation.inspection and reservation.inspection.status != 'completed':
+            return jsonify({"error": "A vistoria associada ainda não foi concluída."}), 400
+
+        final_price = reservation.vehicle.preco - reservation.amount
+        new_purchase = Purchase(
+            user_id=current_user.id,
+            vehicle_id=reservation.vehicle_id,
+            reservation_id=reservation.id,
+            final_price=final_price,
+            status='completed',
+            created_at=datetime.utcnow()
+        )
+
+        try:
+            # A reserva só é concluída se ainda estiver ativa; a compra entra na mesma transação
+            if not ReservationController._close_reservation(reservation, 'completed'):
+                db.session.rollback()
+                return jsonify({"error": "Reserva já foi concluída, cancelada ou expirada."}), 409
+            # Veículo vendido segue indisponível (sem UPDATE quando já está reservado)
+            reservation.vehicle.is_reserved = True
+            db.session.add(new_purchase)
+            db.session.flush()
+            # Serializa antes do commit: os relacionamentos já estão na sessão e não são recarregados
+            body = {
+                "message": "Compra concluída com sucesso. Sinal abatido do valor final.",
+                "reservation": reservation.to_dict(),
+                "purchase": new_purchase.to_dict(),
+                "final_price": final_price
+            }
+            db.session.commit()
+            return jsonify(body), 201
+        except IntegrityError:
+            db.session.rollback()
+            return jsonify({"error": "Já existe uma compra para esta reserva."}), 409
+        except Exception as e:
+            db.session.rollback()
+            return jsonify({"error": str(e)}), 500
+
+    @staticmethod
+    @login_required
+    def cancel_reservation(reservation_id):
+        """Cancela a reserva e libera o veículo para outros interessados."""
+        reservation = Reservation.query.get_or_404(reservation_id)
+
+        if reservation.user_id != current_user.id:
+            return jsonify({"error": "Acesso negado: Reserva não pertence ao usuário."}), 403
+
+        if reservation.status != 'active':
+            return jsonify({"error": "Reserva já foi concluída, cancelada ou expirada."}), 400
+
+        try:
+            if not ReservationController._close_reservation(reservation, 'cancelled'):
+                db.session.rollback()
+                return jsonify({"error": "Reserva já foi concluída, cancelada ou expirada."}), 409
+            vehicle = Vehicle.query.get(reservation.vehicle_id)
+            vehicle.is_reserved = False
+            db.session.commit()
+            return jsonify({
+                "message": "Reserva cancelada com sucesso. Veículo liberado. Sinal retido conforme política.",
+                "reservation": reservation.to_dict()
+            }), 200
+        except Exception as e:
+            db.session.rollback()
             return jsonify({"error": str(e)}), 500
\ No newline at end of file
@@ -1,105 +1,136 @@
-from flask import jsonify, request
-from app.models.purchase import Purchase
-from app.models.review import Review
-from app.models.vehicle import Vehicle
-from app import db
-from datetime import datetime, timedelta
-from app.controllers.admin_auth_controller import token_required, permission_required
-
-class SalesReportController:
-    """Controlador para relatórios e dashboard de vendas (Admin)."""
-
-    @staticmethod
-    @token_required
-    @permission_required('view_reports')
-    def get_sales_report(admin):
-        """Gera relatório de vendas com filtros por data."""
-        start_date = request.args.get('start_date')
-        end_date = request.args.get('end_date')
-        
-        query = Purchase.query
-        
-        # Aplica filtros de data se fornecidos
-        if start_date:
-            try:
-                start_datetime = datetime.fromisoformat(start_date.replace('Z', '+00:00'))
-                query = query.filter(Purchase.created_at >= start_datetime)
-            except ValueError:
-                return jsonify({"error": "Formato de data inicial inválido. Use ISO format."}), 400
-        
-        if end_date:
-            try:
-                end_datetime = datetime.fromisoformat(end_date.replace('Z', '+00:00'))
-                query = query.filter(Purchase.created_at <= end_datetime)
-            except ValueError:
-                return jsonify({"error": "Formato de data final inválido. Use ISO format."}), 400
-
-        sales = query.all()
-        
-        total_revenue = sum(sale.final_price for sale in sales)
-        total_sales = len(sales)
-        
-        return jsonify({
-            "report": {
-                "period": {
-                    "start_date": start_date,
-                    "end_date": end_date
-                },
-                "total_sales": total_sales,
-                "total_revenue": float(total_revenue),
-                "average_sale_value": float(total_revenue / total_sales) if total_sales > 0 else 0,
-                "sales": [sale.to_dict() for sale in sales]
-            }
-        }), 200
-
-    @staticmethod
-    @token_required
-    @permission_required('view_reports')
-    def get_sales_dashboard(admin):
-        """Retorna dados consolidados para o dashboard de vendas."""
-        try:
-            total_sales = Purchase.query.count()
-            total_revenue_result = db.session.query(db.func.sum(Purchase.final_price)).scalar()
-            total_revenue = float(total_revenue_result) if total_revenue_result else 0
-            
-            thirty_days_ago = datetime.utcnow() - timedelta(days=30)
-            recent_sales = Purchase.query.filter(Purchase.created_at >= thirty_days_ago).count()
-            
-            popular_vehicles = db.session.query(
-                Vehicle.marca, 
-                Vehicle.modelo,
-                db.func.count(Purchase.id).label('sales_count')
-            ).join(Purchase).group_by(Vehicle.marca, Vehicle.modelo).order_by(db.desc('sales_count')).limit(5).all()
-            
-            recent_reviews = Review.query.order_by(Review.created_at.desc()).limit(10).all()
-            
-            return jsonify({
-                "dashboard": {
-                    "total_sales": total_sales,
-                    "total_revenue": total_revenue,
-                    "recent_sales": recent_sales,
-                    "popular_vehicles": [
-                        {
-                            "marca": vehicle.marca,
-                            "modelo": vehicle.modelo,
-                            "sales_count": vehicle.sales_count
-                        } for vehicle in popular_vehicles
-                    ],
-                    "recent_reviews": [review.to_dict() for review in recent_reviews]
-                }
-            }), 200
-        except Exception as e:
-            return jsonify({"error": str(e)}), 500
-
-    @staticmethod
-    @token_required
-    @permission_required('view_reports')
-    def get_all_reviews(admin):
-        """Lista todas as avaliações do sistema (Admin)."""
-        try:
-            reviews = Review.query.order_by(Review.created_at.desc()).all()
-            return jsonify({
-                "reviews": [review.to_dict() for review in reviews]
-            }), 200
-        except Exception as e:
+from flask import jsonify, request
+from app.models.purchase import Purchase
+from app.models.review import Review
+from app.models.vehicle import Vehicle
+from app import db
+from datetime import datetime, timedelta
+from app.controllers.admin_auth_controller import token_required, permission_required, log_admin_action
+from app.utils.conditional import conditional_response
+from app.utils.serialization import read_serialization_params, eager_options
+from app.utils.export import export_response
+
+# Colunas disponíveis na exportação de vendas (?columns=)
+SALES_EXPORT_COLUMNS = ('id', 'user_id', 'vehicle_id', 'reservation_id', 'final_price', 'status', 'created_at')
+
+def _sales_date_conditions(start_date, end_date):
+    """Monta os filtros de data do relatório de vendas; lança ValueError se inválidos."""
+    conditions = []
+    if start_date:
+        try:
+            conditions.append(Purchase.created_at >= datetime.fromisoformat(start_date.replace('Z', '+00:00')))
+        except ValueError:
+            raise ValueError("Formato de data inicial inválido. Use ISO format.")
+    if end_date:
+        try:
+            conditions.append(Purchase.created_at <= datetime.fromisoformat(end_date.replace('Z', '+00:00')))
+        except ValueError:
+            raise ValueError("Formato de data final inválido. Use ISO format.")
+    return conditions
+
+class SalesReportController:
+    """Controlador para relatórios e dashboard de vendas (Admin)."""
+
+    @staticmethod
+    @token_required
+    @permission_required('view_reports')
+    def get_sales_report(admin):
+        """Gera relatório de vendas com filtros por data."""
+        start_date = request.args.get('start_date')
+        end_date = request.args.get('end_date')
+        
+        try:
+            serialization = read_serialization_params()
+            conditions = _sales_date_conditions(start_date, end_date)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        query = Purchase.query.options(*eager_options(Purchase, **serialization)).filter(*conditions)
+        sales = query.all()
+        
+        total_revenue = sum(sale.final_price for sale in sales)
+        total_sales = len(sales)
+        
+        return jsonify({
+            "report": {
+                "period": {
+                    "start_date": start_date,
+                    "end_date": end_date
+                },
+                "total_sales": total_sales,
+                "total_revenue": float(total_revenue),
+                "average_sale_value": float(total_revenue / total_sales) if total_sales > 0 else 0,
+                "sales": [sale.to_dict(**serialization) for sale in sales]
+            }
+        }), 200
+
+    @staticmethod
+    @token_required
+    @permission_required('view_reports')
+    def export_sales_report(admin):
+        """Exporta as vendas do período em NDJSON ou CSV (streaming, ?format= e ?columns=)."""
+        try:
+            conditions = _sales_date_conditions(request.args.get('start_date'), request.args.get('end_date'))
+            response = export_response(Purchase, SALES_EXPORT_COLUMNS, 'vendas', conditions)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        log_admin_action(admin, "EXPORT_SALES", "Administrador exportou o relatório de vendas")
+        return response
+
+    @staticmethod
+    @token_required
+    @permission_required('view_reports')
+    def get_sales_dashboard(admin):
+        """Retorna dados consolidados para o dashboard de vendas."""
+        try:
+            total_sales = Purchase.query.count()
+            total_revenue_result = db.session.query(db.func.sum(Purchase.final_price)).scalar()
+            total_revenue = float(total_revenue_result) if total_revenue_result else 0
+            
+            thirty_days_ago = datetime.utcnow() - timedelta(days=30)
+            recent_sales = Purchase.query.filter(Purchase.created_at >= thirty_days_ago).count()
+            
+            popular_vehicles = db.session.query(
+                Vehicle.marca, 
+                Vehicle.modelo,
+                db.func.count(Purchase.id).label('sales_count')
+            ).join(Purchase).group_by(Vehicle.marca, Vehicle.modelo).order_by(db.desc('sales_count')).limit(5).all()
+            
+            recent_reviews = Review.query.options(*eager_options(Review)).order_by(Review.created_at.desc()).limit(10).all()
+            
+            return jsonify({
+                "dashboard": {
+                    "total_sales": total_sales,
+                    "total_revenue": total_revenue,
+                    "recent_sales": recent_sales,
+                    "popular_vehicles": [
+                        {
+                            "marca": vehicle.marca,
+                            "modelo": vehicle.modelo,
+                            "sales_count": vehicle.sales_count
+                        } for vehicle in popular_vehicles
+                    ],
+                    "recent_reviews": [review.to_dict() for review in recent_reviews]
+                }
+            }), 200
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+
+    @staticmethod
+    @token_required
+    @permission_required('view_reports')
+    @conditional_response('review', 'purchase', 'reservation', 'inspection', 'vehicle', 'user')
+    def get_all_reviews(admin):
+        """Lista todas as avaliações do sistema (Admin)."""
+        try:
+            serialization = read_serialization_params()
+            reviews = Review.query.options(
+                *eager_options(Review, **serialization)
+            ).order_by(Review.created_at.desc()).all()
+            return jsonify({
+                "reviews": [review.to_dict(**serialization) for review in reviews]
+            }), 200
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        except Exception as e:
             return jsonify({"error": str(e)}), 500
\ No newline at end of file
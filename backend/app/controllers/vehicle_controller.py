@@ -1,139 +1,238 @@
-from flask import jsonify, request
-from app.models.vehicle import Vehicle
-from app import db
-from flask_login import login_required
-from datetime import datetime
-
-class VehicleController:
-    """Controlador para operações de veículos no sistema."""
-
-    @staticmethod
-    @login_required
-    def create():
-        """Cria um novo veículo no sistema."""
-        data = request.get_json()
-
-        required_fields = ['marca', 'modelo', 'ano', 'preco']
-        if not data or not all(field in data for field in required_fields):
-            return jsonify({"error": "Marca, modelo, ano e preço são obrigatórios."}), 400
-
-        # Validações adicionais
-        if not isinstance(data['ano'], int) or data['ano'] < 1900 or data['ano'] > 2026:
-            return jsonify({"error": "Ano inválido. Deve ser um número entre 1900 e 2026."}), 400
-        if not isinstance(data['preco'], (int, float)) or data['preco'] <= 0:
-            return jsonify({"error": "Preço deve ser um número positivo."}), 400
-        if 'photo_url' in data and (not isinstance(data['photo_url'], str) or len(data['photo_url']) > 255):
-            return jsonify({"error": "Photo_url deve ser uma string de até 255 caracteres."}), 400
-
-        new_vehicle = Vehicle(
-            marca=data['marca'],
-            modelo=data['modelo'],
-            ano=data['ano'],
-            preco=data['preco'],
-            photo_url=data.get('photo_url'),  
-            created_at=datetime.utcnow()
-        )
-
-        try:
-            db.session.add(new_vehicle)
-            db.session.commit()
-            return jsonify({
-                "message": "Veículo criado com sucesso.",
-                "vehicle": new_vehicle.to_dict()
-            }), 201
-        except Exception as e:
-            db.session.rollback()
-            return jsonify({"error": str(e)}), 500
-
-    @staticmethod
-    @login_required
-    def search():
-        """Pesquisa veículos com base em filtros (marca, modelo, ano, preço, reservado)."""
-        marca = request.args.get('marca')
-        modelo = request.args.get('modelo')
-        ano = request.args.get('ano', type=int)
-        preco_min = request.args.get('preco_min', type=float)
-        preco_max = request.args.get('preco_max', type=float)
-        is_reserved = request.args.get('is_reserved', type=bool)
-
-        query = Vehicle.query
-
-        if marca:
-            query = query.filter(Vehicle.marca.ilike(f"%{marca}%"))
-        if modelo:
-            query = query.filter(Vehicle.modelo.ilike(f"%{modelo}%"))
-        if ano:
-            query = query.filter(Vehicle.ano == ano)
-        if preco_min:
-            query = query.filter(Vehicle.preco >= preco_min)
-        if preco_max:
-            query = query.filter(Vehicle.preco <= preco_max)
-        if is_reserved is not None:
-            query = query.filter(Vehicle.is_reserved == is_reserved)
-
-        vehicles = query.all()
-
-        if not vehicles:
-            return jsonify({"message": "Nenhum veículo encontrado com os filtros aplicados."}), 200
-
-        return jsonify({"vehicles": [vehicle.to_dict() for vehicle in vehicles]}), 200
-
-    @staticmethod
-    @login_required
-    def update(vehicle_id):
-        """Atualiza os dados de um veículo existente."""
-        data = request.get_json()
-
-        if not data:
-            return jsonify({"error": "Dados inválidos."}), 400
-
-        vehicle = Vehicle.query.get_or_404(vehicle_id)
-
-        # Verifica se o veículo está reservado
-        if vehicle.is_reserved:
-            return jsonify({"error": "Veículo reservado não pode ser atualizado."}), 400
-
-        if 'marca' in data:
-            vehicle.marca = data['marca']
-        if 'modelo' in data:
-            vehicle.modelo = data['modelo']
-        if 'ano' in data:
-            if not isinstance(data['ano'], int) or data['ano'] < 1900 or data['ano'] > 2026:
-                return jsonify({"error": "Ano inválido. Deve ser um número entre 1900 e 2026."}), 400
-            vehicle.ano = data['ano']
-        if 'preco' in data:
-            if not isinstance(data['preco'], (int, float)) or data['preco'] <= 0:
-                return jsonify({"error": "Preço deve ser um número positivo."}), 400
-            vehicle.preco = data['preco']
-        if 'photo_url' in data:
-            if not isinstance(data['photo_url'], str) or len(data['photo_url']) > 255:
-                return jsonify({"error": "Photo_url deve ser uma string de até 255 caracteres."}), 400
-            vehicle.photo_url = data['photo_url']
-
-        try:
-            db.session.commit()
-            return jsonify({
-                "message": "Veículo atualizado com sucesso.",
-                "vehicle": vehicle.to_dict()
-            }), 200
-        except Exception as e:
-            db.session.rollback()
-            return jsonify({"error": str(e)}), 500
-
-    @staticmethod
-    @login_required
-    def delete(vehicle_id):
-        """Deleta um veículo do sistema."""
-        vehicle = Vehicle.query.get_or_404(vehicle_id)
-
-        # Verifica se o veículo está reservado
-        if vehicle.is_reserved:
-            return jsonify({"error": "Veículo reservado não pode ser deletado."}), 400
-
-        try:
-            db.session.delete(vehicle)
-            db.session.commit()
-            return jsonify({"message": "Veículo deletado com sucesso."}), 200
-        except Exception as e:
-            db.session.rollback()
+from flask import jsonify, request, current_app
+from app.models.vehicle import Vehicle
+from app import db
+from app.utils.pagination import paginate_keyset, read_page_params
+from app.utils.serialization import read_serialization_params
+from app.utils.suggest import get_suggestions, SUGGEST_FIELDS
+from app.utils.facets import compute_facets, parse_facets, parse_price_buckets
+from app.utils.search_cache import search_cache
+from app.utils.catalog_snapshot import catalog_snapshot, ensure_snapshot_built
+from app.utils.conditional import conditional_response
+from flask_login import login_required
+from datetime import datetime
+
+VEHICLE_SORT_FIELDS = ('preco', 'ano', 'created_at')
+
+def validate_vehicle_data(data):
+    """Valida marca, modelo, ano, preço e photo_url quando presentes; retorna a mensagem de erro ou None."""
+    for field, label, max_length in (('marca', 'Marca', 100), ('modelo', 'Modelo', 150)):
+        if field in data and (not isinstance(data[field], str) or not data[field].strip() or len(data[field]) > max_length):
+            return f"{label} deve ser um texto não vazio de até {max_length} caracteres."
+    # bool é subclasse de int no Python: true/false do JSON não valem como número
+    if 'ano' in data and (not isinstance(data['ano'], int) or isinstance(data['ano'], bool) or data['ano'] < 1900 or data['ano'] > 2026):
+        return "Ano inválido. Deve ser um número entre 1900 e 2026."
+    if 'preco' in data and (not isinstance(data['preco'], (int, float)) or isinstance(data['preco'], bool) or data['preco'] <= 0):
+        return "Preço deve ser um número positivo."
+    if 'photo_url' in data and (not isinstance(data['photo_url'], str) or len(data['photo_url']) > 255):
+        return "Photo_url deve ser uma string de até 255 caracteres."
+    return None
+
+class VehicleController:
+    """Controlador para operações de veículos no sistema."""
+
+    @staticmethod
+    @login_required
+    def create():
+        """Cria um novo veículo no sistema."""
+        data = request.get_json()
+
+        required_fields = ['marca', 'modelo', 'ano', 'preco']
+        if not data or not all(field in data for field in required_fields):
+            return jsonify({"error": "Marca, modelo, ano e preço são obrigatórios."}), 400
+
+        # Validações adicionais
+        error = validate_vehicle_data(data)
+        if error:
+            return jsonify({"error": error}), 400
+
+        new_vehicle = Vehicle(
+            marca=data['marca'],
+            modelo=data['modelo'],
+            ano=data['ano'],
+            preco=data['preco'],
+            photo_url=data.get('photo_url'),  
+            created_at=datetime.utcnow()
+        )
+
+        try:
+            db.session.add(new_vehicle)
+            db.session.commit()
+            return jsonify({
+                "message": "Veículo criado com sucesso.",
+                "vehicle": new_vehicle.to_dict()
+            }), 201
+        except Exception as e:
+            db.session.rollback()
+            return jsonify({"error": str(e)}), 500
+
+    @staticmethod
+    @login_required
+    @conditional_response('vehicle')
+    def search():
+        """Pesquisa veículos com base em filtros (marca, modelo, ano, preço, reservado)."""
+        cache_key = search_cache.make_key(request.args)
+        cached_body = search_cache.get(cache_key)
+        if cached_body is not None:
+            return current_app.response_class(cached_body, mimetype='application/json'), 200
+
+        version = search_cache.version
+        payload, status = VehicleController._run_search()
+        response = jsonify(payload)
+        if status == 200:
+            search_cache.set(cache_key, response.get_data(), version)
+        return response, status
+
+    @staticmethod
+    def _run_search():
+        """Executa a busca e retorna o corpo da resposta e o status HTTP."""
+        filters = {
+            'marca': request.args.get('marca'),
+            'modelo': request.args.get('modelo'),
+            'ano': request.args.get('ano', type=int),
+            'preco_min': request.args.get('preco_min', type=float),
+            'preco_max': request.args.get('preco_max', type=float),
+            'is_reserved': request.args.get('is_reserved', type=bool)
+        }
+
+        query = Vehicle.query
+
+        if filters['marca']:
+            query = query.filter(Vehicle.marca.ilike(f"%{filters['marca']}%"))
+        if filters['modelo']:
+            query = query.filter(Vehicle.modelo.ilike(f"%{filters['modelo']}%"))
+        if filters['ano']:
+            query = query.filter(Vehicle.ano == filters['ano'])
+        if filters['preco_min']:
+            query = query.filter(Vehicle.preco >= filters['preco_min'])
+        if filters['preco_max']:
+            query = query.filter(Vehicle.preco <= filters['preco_max'])
+        if filters['is_reserved'] is not None:
+            query = query.filter(Vehicle.is_reserved == filters['is_reserved'])
+
+        try:
+            facet_names = parse_facets(request.args.get('facets'))
+            price_buckets = parse_price_buckets(
+                request.args.get('price_buckets'),
+                current_app.config.get('VEHICLE_PRICE_BUCKETS', '20000,50000,100000,200000')
+            )
+            serialization = read_serialization_params()
+            if catalog_snapshot.enabled:
+                page = VehicleController._paginate_from_snapshot(filters)
+            else:
+                page = paginate_keyset(query, Vehicle, sort_fields=VEHICLE_SORT_FIELDS)
+        except ValueError as e:
+            return {"error": str(e)}, 400
+
+        vehicles = page['items']
+
+        # As facetas só são calculadas na primeira página; as seguintes têm os mesmos filtros
+        facets = None
+        if facet_names and not request.args.get('cursor'):
+            facets = compute_facets(query, facet_names, price_buckets)
+
+        if not vehicles and not request.args.get('cursor'):
+            response = {"message": "Nenhum veículo encontrado com os filtros aplicados."}
+            if facets is not None:
+                response["facets"] = facets
+            return response, 200
+
+        response = {
+            "vehicles": [vehicle.to_dict(**serialization) for vehicle in vehicles],
+            "next_cursor": page['next_cursor'],
+            "limit": page['limit'],
+            "total": page['total']
+        }
+        if facets is not None:
+            response["facets"] = facets
+        return response, 200
+
+    @staticmethod
+    def _paginate_from_snapshot(filters):
+        """Resolve filtros e paginação no snapshot NumPy e busca no banco só os ids da página."""
+        params = read_page_params(VEHICLE_SORT_FIELDS)
+        ensure_snapshot_built()
+        ids, next_cursor, total = catalog_snapshot.paginate(filters, params)
+
+        vehicles_by_id = {}
+        if ids:
+            vehicles_by_id = {
+                vehicle.id: vehicle
+                for vehicle in Vehicle.query.filter(Vehicle.id.in_(ids)).all()
+            }
+        return {
+            "items": [vehicles_by_id[vehicle_id] for vehicle_id in ids if vehicle_id in vehicles_by_id],
+            "next_cursor": next_cursor,
+            "limit": params['limit'],
+            "total": total
+        }
+
+    @staticmethod
+    @login_required
+    def suggest():
+        """Sugere marcas e modelos para o autocomplete da busca, tolerando acentos e erros de digitação."""
+        query = request.args.get('q', '')
+        field = request.args.get('field')
+        limit = request.args.get('limit', 10, type=int)
+
+        if field is not None and field not in SUGGEST_FIELDS:
+            return jsonify({"error": "Campo inválido. Use 'marca' ou 'modelo'."}), 400
+        if limit < 1:
+            return jsonify({"error": "O parâmetro limit deve ser positivo."}), 400
+        limit = min(limit, current_app.config.get('SUGGEST_MAX_LIMIT', 20))
+
+        try:
+            suggestions = get_suggestions(query, limit=limit, field=field)
+            return jsonify({"suggestions": suggestions}), 200
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+
+    @staticmethod
+    @login_required
+    def update(vehicle_id):
+        """Atualiza os dados de um veículo existente."""
+        data = request.get_json()
+
+        if not data:
+            return jsonify({"error": "Dados inválidos."}), 400
+
+        vehicle = Vehicle.query.get_or_404(vehicle_id)
+
+        # Verifica se o veículo está reservado
+        if vehicle.is_reserved:
+            return jsonify({"error": "Veículo reservado não pode ser atualizado."}), 400
+
+        error = validate_vehicle_data(data)
+        if error:
+            return jsonify({"error": error}), 400
+
+        for field in ('marca', 'modelo', 'ano', 'preco', 'photo_url'):
+            if field in data:
+                setattr(vehicle, field, data[field])
+
+        try:
+            db.session.commit()
+            return jsonify({
+                "message": "Veículo atualizado com sucesso.",
+                "vehicle": vehicle.to_dict()
+            }), 200
+        except Exception as e:
+            db.session.rollback()
+            return jsonify({"error": str(e)}), 500
+
+    @staticmethod
+    @login_required
+    def delete(vehicle_id):
+        """Deleta um veículo do sistema."""
+        vehicle = Vehicle.query.get_or_404(vehicle_id)
+
+        # Verifica se o veículo está reservado
+        if vehicle.is_reserved:
+            return jsonify({"error": "Veículo reservado não pode ser deletado."}), 400
+
+        try:
+            db.session.delete(vehicle)
+            db.session.commit()
+            return jsonify({"message": "Veículo deletado com sucesso."}), 200
+        except Exception as e:
+            db.session.rollback()
             return jsonify({"error": str(e)}), 500
\ No newline at end of file
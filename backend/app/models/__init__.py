@@ -1,20 +1,22 @@
-from app import db
-from app.models.user import User
-from app.models.vehicle import Vehicle
-from app.models.inspection import Inspection
-from app.models.reservation import Reservation
-from app.models.admin import Admin, AdminLog
-from app.models.purchase import Purchase
-from app.models.review import Review
-
-__all__ = [
-    "db", 
-    "User", 
-    "Vehicle", 
-    "Inspection", 
-    "Reservation",
-    "Admin", 
-    "AdminLog", 
-    "Purchase",
-    "Review"
+from app import db
+from app.models.user import User
+from app.models.vehicle import Vehicle
+from app.models.inspection import Inspection
+from app.models.reservation import Reservation
+from app.models.admin import Admin, AdminLog
+from app.models.purchase import Purchase
+from app.models.review import Review
+from app.models.table_version import TableVersion
+
+__all__ = [
+    "db", 
+    "User", 
+    "Vehicle", 
+    "Inspection", 
+    "Reservation",
+    "Admin", 
+    "AdminLog", 
+    "Purchase",
+    "Review",
+    "TableVersion"
 ]
\ No newline at end of file
@@ -1,37 +1,47 @@
-from app import db
-from datetime import datetime
-
-class Reservation(db.Model):
-    """Modelo que representa uma reserva com sinal financeiro no sistema."""
-    
-    id = db.Column(db.Integer, primary_key=True)
-    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
-    vehicle_id = db.Column(db.Integer, db.ForeignKey('vehicle.id'), nullable=False)
-    inspection_id = db.Column(db.Integer, db.ForeignKey('inspection.id'), nullable=True)
-    amount = db.Column(db.Float, nullable=False)
-    status = db.Column(db.String(20), nullable=False, default='active')
-    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
-
-    # Relationships
-    reserver = db.relationship('User', back_populates='reservations', lazy=True)
-    vehicle = db.relationship('Vehicle', back_populates='reservations', lazy=True)
-    inspection = db.relationship('Inspection', back_populates='reservation', uselist=False)
-    purchase = db.relationship('Purchase', back_populates='reservation', uselist=False)
-
-    def to_dict(self):
-        """Converte o modelo para um dicionário."""
-        return {
-            'id': self.id,
-            'user_id': self.user_id,
-            'vehicle_id': self.vehicle_id,
-            'inspection_id': self.inspection_id,
-            'amount': self.amount,
-            'status': self.status,
-            'created_at': self.created_at.isoformat(),
-            'user': self.reserver.to_dict() if self.reserver else None,
-            'vehicle': self.vehicle.to_dict() if self.vehicle else None,
-            'inspection': self.inspection.to_dict() if self.inspection else None
-        }
-
-    def __repr__(self):
+from app import db
+from app.utils.serialization import SerializableMixin
+from datetime import datetime
+
+class Reservation(SerializableMixin, db.Model):
+    """Modelo que representa uma reserva com sinal financeiro no sistema."""
+    
+    __table_args__ = (
+        db.Index('ix_reservation_vehicle_id_status', 'vehicle_id', 'status'),
+        db.Index('ix_reservation_user_id', 'user_id'),
+        db.Index('ix_reservation_created_at', 'created_at'),
+        # Varredura de reservas vencidas (status = 'active' AND created_at < limite)
+        db.Index('ix_reservation_status_created_at', 'status', 'created_at'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    vehicle_id = db.Column(db.Integer, db.ForeignKey('vehicle.id'), nullable=False)
+    inspection_id = db.Column(db.Integer, db.ForeignKey('inspection.id'), nullable=True)
+    amount = db.Column(db.Float, nullable=False)
+    status = db.Column(db.String(20), nullable=False, default='active')
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    # Relationships
+    reserver = db.relationship('User', back_populates='reservations', lazy=True)
+    vehicle = db.relationship('Vehicle', back_populates='reservations', lazy=True)
+    inspection = db.relationship('Inspection', back_populates='reservation', uselist=False)
+    purchase = db.relationship('Purchase', back_populates='reservation', uselist=False)
+
+    # Serialização: relacionamentos expansíveis e os embutidos por padrão
+    serialize_relations = {'user': 'reserver', 'vehicle': 'vehicle', 'inspection': 'inspection', 'purchase': 'purchase'}
+    default_expand = ('user', 'vehicle', 'inspection')
+
+    def serialize_fields(self):
+        """Retorna os campos escalares do modelo."""
+        return {
+            'id': self.id,
+            'user_id': self.user_id,
+            'vehicle_id': self.vehicle_id,
+            'inspection_id': self.inspection_id,
+            'amount': self.amount,
+            'status': self.status,
+            'created_at': self.created_at
+        }
+
+    def __repr__(self):
         return f'<Reservation {self.id} for Vehicle {self.vehicle_id} by User {self.user_id}>'
\ No newline at end of file
@@ -0,0 +1,12 @@
+from app import db
+from datetime import datetime
+
+class TableVersion(db.Model):
+    """Versão de cada tabela, incrementada no mesmo commit de qualquer alteração nela."""
+    
+    name = db.Column(db.String(64), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f'<TableVersion {self.name} v{self.version}>'
\ No newline at end of file
@@ -1,37 +1,52 @@
-from app import db
-from flask_login import UserMixin
-from werkzeug.security import generate_password_hash, check_password_hash
-from datetime import datetime
-
-class User(UserMixin, db.Model):
-    """Modelo que representa um usuário no sistema."""
-    
-    id = db.Column(db.Integer, primary_key=True)
-    username = db.Column(db.String(150), unique=True, nullable=False)
-    email = db.Column(db.String(120), unique=True, nullable=False)
-    password_hash = db.Column(db.String(255), nullable=False)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
-
-    inspections = db.relationship('Inspection', back_populates='inspector', lazy=True)
-    reservations = db.relationship('Reservation', back_populates='reserver', lazy=True)
-    purchases = db.relationship('Purchase', back_populates='buyer', lazy=True)
-
-    def set_password(self, password):
-        """Define a senha hasheada do usuário."""
-        self.password_hash = generate_password_hash(password)
-
-    def check_password(self, password):
-        """Verifica se a senha fornecida corresponde à senha hasheada."""
-        return check_password_hash(self.password_hash, password)
-
-    def to_dict(self):
-        """Converte o modelo para um dicionário."""
-        return {
-            'id': self.id,
-            'username': self.username,
-            'email': self.email,
-            'created_at': self.created_at.isoformat()
-        }
-
-    def __repr__(self):
+from app import db
+from app.utils.serialization import SerializableMixin
+from flask_login import UserMixin
+from app.utils.password_hasher import password_hasher
+from datetime import datetime
+
+# Prefixo do id guardado na sessão do Flask-Login; evita confundir ids de tabelas diferentes
+USER_ID_PREFIX = 'user:'
+
+class User(UserMixin, SerializableMixin, db.Model):
+    """Modelo que representa um usuário no sistema."""
+    
+    __table_args__ = (
+        db.Index('ix_user_created_at', 'created_at'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    username = db.Column(db.String(150), unique=True, nullable=False)
+    email = db.Column(db.String(120), unique=True, nullable=False)
+    password_hash = db.Column(db.String(255), nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    inspections = db.relationship('Inspection', back_populates='inspector', lazy=True)
+    reservations = db.relationship('Reservation', back_populates='reserver', lazy=True)
+    purchases = db.relationship('Purchase', back_populates='buyer', lazy=True)
+
+    def get_id(self):
+        """Id guardado na sessão do Flask-Login."""
+        return f'{USER_ID_PREFIX}{self.id}'
+
+    def set_password(self, password):
+        """Define a senha hasheada do usuário."""
+        self.password_hash = password_hasher.hash(password)
+
+    def check_password(self, password):
+        """Verifica a senha; se o hash usa parâmetros antigos, troca pelo atual (gravado no próximo commit)."""
+        valid, new_hash = password_hasher.verify(self.password_hash, password)
+        if new_hash:
+            self.password_hash = new_hash
+        return valid
+
+    def serialize_fields(self):
+        """Retorna os campos escalares do modelo."""
+        return {
+            'id': self.id,
+            'username': self.username,
+            'email': self.email,
+            'created_at': self.created_at
+        }
+
+    def __repr__(self):
         return f'<User {self.username}>'
\ No newline at end of file
@@ -1,36 +1,50 @@
-from flask import Blueprint
-from app.controllers.admin_auth_controller import AdminAuthController
-from app.controllers.admin_management_controller import AdminManagementController
-from app.controllers.admin_system_controller import AdminSystemController
-
-admin_bp = Blueprint('admin', __name__)
-
-# Autenticação e Perfil
-admin_bp.route('/login', methods=['POST'])(AdminAuthController.login)
-admin_bp.route('/profile', methods=['GET'])(AdminAuthController.get_profile)
-admin_bp.route('/profile', methods=['PUT'])(AdminAuthController.update_profile)
-
-# Gestão de Usuários
-admin_bp.route('/users', methods=['GET'])(AdminManagementController.get_users)
-admin_bp.route('/users/<int:user_id>', methods=['GET'])(AdminManagementController.get_user)
-admin_bp.route('/users/<int:user_id>', methods=['PUT'])(AdminManagementController.update_user)
-
-# Gestão de Veículos
-admin_bp.route('/vehicles', methods=['GET'])(AdminManagementController.get_vehicles)
-admin_bp.route('/vehicles', methods=['POST'])(AdminManagementController.create_vehicle)
-admin_bp.route('/vehicles/<int:vehicle_id>', methods=['PUT'])(AdminManagementController.update_vehicle)
-admin_bp.route('/vehicles/<int:vehicle_id>', methods=['DELETE'])(AdminManagementController.delete_vehicle)
-
-# Gestão de Vistorias
-admin_bp.route('/inspections', methods=['GET'])(AdminManagementController.get_inspections)
-
-# Gestão de Reservas
-admin_bp.route('/reservations', methods=['GET'])(AdminManagementController.get_reservations)
-
-# Gestão de Administradores
-admin_bp.route('/admins', methods=['GET'])(AdminSystemController.get_admins)
-admin_bp.route('/admins', methods=['POST'])(AdminSystemController.create_admin)
-
-# Auditoria e Dashboard
-admin_bp.route('/logs', methods=['GET'])(AdminSystemController.get_logs)
-admin_bp.route('/dashboard', methods=['GET'])(AdminSystemController.get_dashboard)
\ No newline at end of file
+from flask import Blueprint
+from app.controllers.admin_auth_controller import AdminAuthController
+from app.controllers.admin_management_controller import AdminManagementController
+from app.controllers.admin_system_controller import AdminSystemController
+
+admin_bp = Blueprint('admin', __name__)
+
+# Autenticação e Perfil
+admin_bp.route('/login', methods=['POST'])(AdminAuthController.login)
+admin_bp.route('/profile', methods=['GET'])(AdminAuthController.get_profile)
+admin_bp.route('/profile', methods=['PUT'])(AdminAuthController.update_profile)
+
+# Gestão de Usuários
+admin_bp.route('/users', methods=['GET'])(AdminManagementController.get_users)
+admin_bp.route('/users/export', methods=['GET'])(AdminManagementController.export_users)
+admin_bp.route('/users/<int:user_id>', methods=['GET'])(AdminManagementController.get_user)
+admin_bp.route('/users/<int:user_id>', methods=['PUT'])(AdminManagementController.update_user)
+
+# Gestão de Veículos
+admin_bp.route('/vehicles', methods=['GET'])(AdminManagementController.get_vehicles)
+admin_bp.route('/vehicles/export', methods=['GET'])(AdminManagementController.export_vehicles)
+admin_bp.route('/vehicles', methods=['POST'])(AdminManagementController.create_vehicle)
+admin_bp.route('/vehicles/bulk', methods=['POST'])(AdminManagementController.bulk_create_vehicles)
+admin_bp.route('/vehicles/bulk', methods=['PATCH'])(AdminManagementController.bulk_update_vehicles)
+admin_bp.route('/vehicles/<int:vehicle_id>', methods=['PUT'])(AdminManagementController.update_vehicle)
+admin_bp.route('/vehicles/<int:vehicle_id>', methods=['DELETE'])(AdminManagementController.delete_vehicle)
+admin_bp.route('/vehicles/<int:vehicle_id>/photo', methods=['POST'])(AdminManagementController.upload_vehicle_photo)
+
+# Gestão de Vistorias
+admin_bp.route('/inspections', methods=['GET'])(AdminManagementController.get_inspections)
+admin_bp.route('/inspections/export', methods=['GET'])(AdminManagementController.export_inspections)
+
+# Gestão de Reservas
+admin_bp.route('/reservations', methods=['GET'])(AdminManagementController.get_reservations)
+admin_bp.route('/reservations/export', methods=['GET'])(AdminManagementController.export_reservations)
+admin_bp.route('/reservations/sweeper', methods=['GET'])(AdminSystemController.get_reservation_sweeper_stats)
+
+# Gestão de Administradores
+admin_bp.route('/admins', methods=['GET'])(AdminSystemController.get_admins)
+admin_bp.route('/admins', methods=['POST'])(AdminSystemController.create_admin)
+
+# Auditoria e Dashboard
+admin_bp.route('/logs', methods=['GET'])(AdminSystemController.get_logs)
+admin_bp.route('/dashboard', methods=['GET'])(AdminSystemController.get_dashboard)
+
+# Métricas de Cache
+admin_bp.route('/cache', methods=['GET'])(AdminSystemController.get_cache_stats)
+
+# Métricas de Compressão
+admin_bp.route('/compression', methods=['GET'])(AdminSystemController.get_compression_stats)
\ No newline at end of file
@@ -0,0 +1,6 @@
+from flask import Blueprint
+from app.controllers.event_controller import EventController
+
+event_bp = Blueprint('event', __name__)
+
+event_bp.route('', methods=['GET'])(EventController.stream)
\ No newline at end of file
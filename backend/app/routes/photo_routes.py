@@ -0,0 +1,7 @@
+from flask import Blueprint
+from app.controllers.photo_controller import PhotoController
+
+photo_bp = Blueprint('photo', __name__)
+
+photo_bp.route('/<digest>.<ext>', methods=['GET'])(PhotoController.get_photo)
+photo_bp.route('/<digest>/thumbnail', methods=['GET'])(PhotoController.get_thumbnail)
\ No newline at end of file
@@ -0,0 +1,68 @@
+from app.utils.pagination import paginate_keyset, read_page_params, make_next_cursor, encode_cursor, decode_cursor
+from app.utils.vehicle_events import VehicleChange, on_vehicle_change, record_vehicle_change, record_vehicle_update
+from app.utils.suggest import get_suggestions, normalize_term
+from app.utils.facets import compute_facets, parse_facets, parse_price_buckets
+from app.utils.cache import LRUCache
+from app.utils.search_cache import search_cache
+from app.utils.catalog_snapshot import catalog_snapshot
+from app.utils.table_versions import record_table_change, get_table_versions
+from app.utils.conditional import conditional_response
+from app.utils.vehicle_import import import_vehicles, iter_csv_rows, iter_ndjson_rows
+from app.utils.photo_storage import photo_storage, thumbnail_url_for
+from app.utils.json_provider import FastJSONProvider
+from app.utils.export import export_response, read_export_params
+from app.utils.compression import compressor
+from app.utils.inspection_slots import SlotCalendar
+from app.utils.event_bus import event_bus
+from app.utils.reservation_sweeper import reservation_sweeper
+from app.utils.admin_principals import AdminPrincipal, admin_principals
+from app.utils.user_principals import UserPrincipal, user_principals
+from app.utils.password_hasher import PasswordHasherBusy, password_hasher
+from app.utils.audit_log import audit_log
+from app.utils.serialization import SerializableMixin, parse_paths, read_serialization_params, eager_options
+
+__all__ = [
+    "paginate_keyset",
+    "read_page_params",
+    "make_next_cursor",
+    "encode_cursor",
+    "decode_cursor",
+    "VehicleChange",
+    "on_vehicle_change",
+    "record_vehicle_change",
+    "record_vehicle_update",
+    "get_suggestions",
+    "normalize_term",
+    "compute_facets",
+    "parse_facets",
+    "parse_price_buckets",
+    "LRUCache",
+    "search_cache",
+    "catalog_snapshot",
+    "record_table_change",
+    "get_table_versions",
+    "conditional_response",
+    "import_vehicles",
+    "iter_csv_rows",
+    "iter_ndjson_rows",
+    "photo_storage",
+    "thumbnail_url_for",
+    "SerializableMixin",
+    "parse_paths",
+    "read_serialization_params",
+    "eager_options",
+    "FastJSONProvider",
+    "export_response",
+    "read_export_params",
+    "compressor",
+    "SlotCalendar",
+    "event_bus",
+    "reservation_sweeper",
+    "AdminPrincipal",
+    "admin_principals",
+    "UserPrincipal",
+    "user_principals",
+    "PasswordHasherBusy",
+    "password_hasher",
+    "audit_log"
+]
\ No newline at end of file
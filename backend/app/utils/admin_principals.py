@@ -0,0 +1,154 @@
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from app import db
+from app.models.admin import Admin
+from app.utils.cache import LRUCache
+import hashlib
+import threading
+import time
+import jwt
+
+class AdminPrincipal:
+    """Cópia imutável do administrador autenticado, com as permissões já interpretadas."""
+
+    __slots__ = ('id', 'username', 'email', 'created_at', 'is_super_admin', 'is_active',
+                 'last_login', 'permissions', '_permission_list')
+
+    def __init__(self, admin):
+        self.id = admin.id
+        self.username = admin.username
+        self.email = admin.email
+        self.created_at = admin.created_at
+        self.is_super_admin = admin.is_super_admin
+        self.is_active = admin.is_active
+        self.last_login = admin.last_login
+        self._permission_list = tuple(admin.get_permissions_list())
+        self.permissions = frozenset(self._permission_list)
+
+    def has_permission(self, permission):
+        """Verifica se o admin tem uma permissão específica."""
+        return self.is_super_admin or permission in self.permissions
+
+    def to_dict(self):
+        """Converte o administrador para um dicionário (mesmo formato de Admin.to_dict)."""
+        return {
+            'id': self.id,
+            'username': self.username,
+            'email': self.email,
+            'created_at': self.created_at,
+            'is_super_admin': self.is_super_admin,
+            'is_active': self.is_active,
+            'last_login': self.last_login,
+            'permissions': list(self._permission_list)
+        }
+
+    def __repr__(self):
+        return f'<AdminPrincipal {self.username}>'
+
+class AdminPrincipalCache:
+    """Cache dos tokens JWT já verificados e dos administradores autenticados.
+
+    Tokens são indexados pelo SHA-256 e guardam (admin_id, exp); a expiração do
+    token continua sendo respeitada a cada acesso. Os administradores ficam em um
+    segundo cache por id, invalidado após o commit de qualquer alteração em Admin.
+    Entre processos a invalidação não se propaga: ADMIN_CACHE_TTL limita o atraso.
+    """
+
+    def __init__(self):
+        self._tokens = LRUCache()
+        self._principals = LRUCache()
+        self._generation = 0
+        self._generation_lock = threading.Lock()
+        self.enabled = False
+
+    def init_app(self, app):
+        self.enabled = app.config.get('ADMIN_CACHE_ENABLED', True)
+        max_entries = app.config.get('ADMIN_CACHE_MAX_ENTRIES', 10000)
+        ttl = app.config.get('ADMIN_CACHE_TTL', 60)
+        self._tokens.configure(max_entries=max_entries, ttl=ttl)
+        self._principals.configure(max_entries=max_entries, ttl=ttl)
+
+    @staticmethod
+    def _digest(token):
+        return hashlib.sha256(token.encode()).digest()
+
+    def authenticate(self, token, secret, algorithm):
+        """Retorna o AdminPrincipal do token (None se o admin não existe); erros de JWT propagam."""
+        if not self.enabled:
+            data = jwt.decode(token, secret, algorithms=[algorithm])
+            admin = db.session.get(Admin, data['admin_id'])
+            return AdminPrincipal(admin) if admin else None
+
+        digest = self._digest(token)
+        cached = self._tokens.get(digest)
+        if cached is None:
+            data = jwt.decode(token, secret, algorithms=[algorithm])
+            cached = (data['admin_id'], data.get('exp'))
+            self._tokens.set(digest, cached)
+        admin_id, expires_at = cached
+        if expires_at is not None and expires_at <= time.time():
+            self._tokens.pop(digest)
+            raise jwt.ExpiredSignatureError('Signature has expired')
+        return self.get(admin_id)
+
+    def get(self, admin_id):
+        """Retorna o AdminPrincipal do id, consultando o banco apenas na primeira vez."""
+        principal = self._principals.get(admin_id)
+        if principal is not None:
+            return principal
+        generation = self._generation
+        admin = db.session.get(Admin, admin_id)
+        if admin is None:
+            return None
+        principal = AdminPrincipal(admin)
+        self._store(principal, generation)
+        return principal
+
+    def remember(self, token, admin):
+        """Guarda o token recém-emitido e o admin, evitando a consulta na primeira requisição."""
+        if not self.enabled:
+            return
+        data = jwt.decode(token, options={'verify_signature': False})
+        self._tokens.set(self._digest(token), (admin.id, data.get('exp')))
+        self._store(AdminPrincipal(admin), self._generation)
+
+    def _store(self, principal, generation):
+        # Só guarda se nenhum admin foi alterado desde a leitura: a cópia poderia estar desatualizada
+        with self._generation_lock:
+            if generation == self._generation:
+                self._principals.set(principal.id, principal)
+
+    def invalidate(self, *admin_ids):
+        """Descarta os administradores informados; a próxima requisição relê do banco."""
+        with self._generation_lock:
+            self._generation += 1
+            for admin_id in admin_ids:
+                self._principals.pop(admin_id)
+
+    def stats(self):
+        return {
+            "enabled": self.enabled,
+            "tokens": self._tokens.stats(),
+            "principals": self._principals.stats()
+        }
+
+admin_principals = AdminPrincipalCache()
+
+@event.listens_for(Session, 'after_flush')
+def _collect_changed_admins(session, flush_context):
+    changed = {
+        obj.id for obj in (*session.new, *session.dirty, *session.deleted)
+        if isinstance(obj, Admin)
+    }
+    if changed:
+        session.info.setdefault('changed_admins', set()).update(changed)
+
+@event.listens_for(Session, 'after_commit')
+def _invalidate_changed_admins(session):
+    changed = session.info.pop('changed_admins', None)
+    if changed:
+        admin_principals.invalidate(*changed)
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_changed_admins(session):
+    session.info.pop('changed_admins', None)
\ No newline at end of file
@@ -0,0 +1,232 @@
+from flask import current_app
+from app import db
+from app.models.admin import Admin, AdminLog
+from app.utils.table_versions import record_table_change
+from app.utils.admin_principals import admin_principals
+from datetime import datetime
+import atexit
+import queue
+import threading
+import time
+
+_STOP = object()
+
+class AuditLogWriter:
+    """Grava os logs de auditoria dos administradores em lote, fora da requisição.
+
+    log_admin_action apenas enfileira o registro; uma thread grava a fila com um
+    INSERT de várias linhas quando junta AUDIT_LOG_BATCH_SIZE itens ou a cada
+    AUDIT_LOG_FLUSH_SECONDS. As atualizações de last_login passam pela mesma fila e
+    são agrupadas por admin (vale o login mais recente). Um lote recusado pelo banco
+    é repetido AUDIT_LOG_RETRIES vezes e depois gravado item a item, descartando só
+    o que continuar falhando. Ao encerrar o processo a fila é esvaziada antes de sair.
+    Com AUDIT_LOG_ASYNC=false a gravação é imediata.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.batch_size = 100
+        self.flush_seconds = 1.0
+        self.retries = 3
+        self.retry_delay = 0.5
+        self._app = None
+        # Criada uma única vez: a thread em execução nunca troca de fila
+        self._queue = queue.Queue(maxsize=10000)
+        self._lock = threading.Lock()
+        self._thread = None
+        self._stats = {"queued": 0, "written": 0, "last_login_updates": 0, "batches": 0, "errors": 0, "dropped": 0}
+
+    def init_app(self, app):
+        # A thread atual grava o que já está na fila na aplicação em que foi enfileirado
+        self.stop()
+        self._app = app
+        self.enabled = app.config.get('AUDIT_LOG_ASYNC', True)
+        self.batch_size = app.config.get('AUDIT_LOG_BATCH_SIZE', 100)
+        self.flush_seconds = app.config.get('AUDIT_LOG_FLUSH_SECONDS', 1.0)
+        self.retries = app.config.get('AUDIT_LOG_RETRIES', 3)
+        with self._queue.mutex:
+            self._queue.maxsize = app.config.get('AUDIT_LOG_QUEUE_SIZE', 10000)
+
+    def _start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                if self._thread is None:
+                    atexit.register(self.stop)
+                self._thread = threading.Thread(
+                    target=self._run, args=(self._app, self._queue), name='audit-log-writer', daemon=True
+                )
+                self._thread.start()
+
+    def _put(self, item):
+        self._start()
+        # Fila cheia: a requisição espera a gravação liberar espaço em vez de perder o registro
+        self._queue.put(item)
+        with self._lock:
+            self._stats["queued"] += 1
+
+    def log(self, admin_id, action, description=None, ip_address=None, user_agent=None):
+        """Registra uma ação de administrador (gravada pelo próximo lote)."""
+        row = {
+            'admin_id': admin_id,
+            'action': action,
+            'description': description,
+            'ip_address': ip_address,
+            'user_agent': user_agent,
+            'created_at': datetime.utcnow()
+        }
+        if not self.enabled:
+            self._persist([row], {}, attempts=1)
+            return
+        self._put(row)
+
+    def touch_last_login(self, admin_id, when):
+        """Registra o último login do admin; logins seguidos do mesmo admin viram um único UPDATE."""
+        if not self.enabled:
+            self._persist([], {admin_id: when}, attempts=1)
+            return
+        self._put((admin_id, when))
+
+    def _run(self, app, items_queue):
+        stopping = False
+        while not stopping:
+            items = []
+            deadline = time.monotonic() + self.flush_seconds
+            while len(items) < self.batch_size:
+                try:
+                    item = items_queue.get(timeout=max(0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    items_queue.task_done()
+                    stopping = True
+                    break
+                items.append(item)
+            if stopping:
+                # Esvazia o que sobrou na fila antes de encerrar
+                while True:
+                    try:
+                        item = items_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is _STOP:
+                        items_queue.task_done()
+                    else:
+                        items.append(item)
+            if not items:
+                continue
+            try:
+                rows = []
+                last_logins = {}
+                for item in items:
+                    if isinstance(item, dict):
+                        rows.append(item)
+                    else:
+                        admin_id, when = item
+                        if admin_id not in last_logins or when > last_logins[admin_id]:
+                            last_logins[admin_id] = when
+                with app.app_context():
+                    try:
+                        self._persist(rows, last_logins, attempts=self.retries)
+                    finally:
+                        db.session.remove()
+            except Exception:
+                # A thread não pode morrer: flush() e o atexit dependem dela
+                app.logger.exception("Erro inesperado no escritor de auditoria")
+            finally:
+                for _ in items:
+                    items_queue.task_done()
+
+    def _persist(self, rows, last_logins, attempts):
+        """Grava o lote com novas tentativas; se continuar falhando, grava item a item."""
+        error = None
+        for attempt in range(attempts):
+            error = self._write(rows, last_logins)
+            if error is None:
+                return
+            current_app.logger.warning(
+                "Falha ao gravar %d log(s) de auditoria e %d last_login (tentativa %d de %d): %s",
+                len(rows), len(last_logins), attempt + 1, attempts, error
+            )
+            if attempt + 1 < attempts:
+                time.sleep(self.retry_delay * 2 ** attempt)
+
+        if len(rows) + len(last_logins) > 1:
+            # Isola os registros recusados para não perder o lote inteiro por causa de um deles
+            for row in rows:
+                self._persist([row], {}, attempts=1)
+            for admin_id, when in last_logins.items():
+                self._persist([], {admin_id: when}, attempts=1)
+            return
+        with self._lock:
+            self._stats["dropped"] += 1
+        current_app.logger.error(
+            "Registro de auditoria descartado: %s", rows[0] if rows else last_logins, exc_info=error
+        )
+
+    def _write(self, rows, last_logins):
+        """Grava os registros com um INSERT de várias linhas e os last_login no mesmo commit.
+
+        Retorna None se gravou ou a exceção do banco (com a transação já desfeita).
+        """
+        session = db.session
+        try:
+            if rows:
+                session.execute(db.insert(AdminLog), rows)
+                record_table_change(session, AdminLog.__tablename__)
+            if last_logins:
+                # Condicional: um lote atrasado não sobrescreve um login mais recente
+                admin = Admin.__table__
+                session.execute(
+                    db.update(admin)
+                    .where(
+                        admin.c.id == db.bindparam('admin_id'),
+                        db.or_(admin.c.last_login.is_(None), admin.c.last_login < db.bindparam('when'))
+                    )
+                    .values(last_login=db.bindparam('when')),
+                    [{'admin_id': admin_id, 'when': when} for admin_id, when in last_logins.items()]
+                )
+                record_table_change(session, Admin.__tablename__)
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            with self._lock:
+                self._stats["errors"] += 1
+            return e
+        if last_logins:
+            # O UPDATE direto não passa pelo flush do ORM: o cache dos administradores não o veria
+            admin_principals.invalidate(*last_logins)
+        with self._lock:
+            self._stats["written"] += len(rows)
+            self._stats["last_login_updates"] += len(last_logins)
+            self._stats["batches"] += 1
+        return None
+
+    def flush(self):
+        """Espera a gravação de tudo o que já foi enfileirado."""
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.join()
+
+    def stop(self, timeout=10):
+        """Grava o que estiver na fila e encerra a thread (registrado no atexit)."""
+        thread = self._thread
+        if thread is None or not thread.is_alive():
+            return
+        self._queue.put(_STOP)
+        thread.join(timeout)
+
+    def stats(self):
+        """Retorna os contadores do escritor de auditoria deste processo."""
+        with self._lock:
+            stats = dict(self._stats)
+        stats.update({
+            "enabled": self.enabled,
+            "pending": self._queue.qsize(),
+            "batch_size": self.batch_size,
+            "flush_seconds": self.flush_seconds,
+            "running": self._thread is not None and self._thread.is_alive()
+        })
+        return stats
+
+audit_log = AuditLogWriter()
\ No newline at end of file
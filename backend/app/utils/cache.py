@@ -0,0 +1,96 @@
+from collections import OrderedDict
+import threading
+import time
+
+class LRUCache:
+    """Cache LRU thread-safe com limite por quantidade de entradas e/ou bytes e TTL opcional."""
+
+    def __init__(self, max_entries=None, max_bytes=None, ttl=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def configure(self, max_entries=None, max_bytes=None, ttl=None):
+        """Altera os limites do cache, descartando o conteúdo atual."""
+        with self._lock:
+            self.max_entries = max_entries
+            self.max_bytes = max_bytes
+            self.ttl = ttl
+            self._data.clear()
+            self._size = 0
+
+    def get(self, key, default=None):
+        """Retorna o valor armazenado ou default, contabilizando acerto/falha."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self.misses += 1
+                return default
+            value, size, expires_at = item
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                self._size -= size
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value, size=1):
+        """Armazena um valor, removendo os menos usados recentemente se necessário."""
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        expires_at = time.monotonic() + self.ttl if self.ttl else None
+        with self._lock:
+            previous = self._data.pop(key, None)
+            if previous is not None:
+                self._size -= previous[1]
+            self._data[key] = (value, size, expires_at)
+            self._size += size
+            while self._data and (
+                (self.max_entries is not None and len(self._data) > self.max_entries)
+                or (self.max_bytes is not None and self._size > self.max_bytes)
+            ):
+                _, (_, evicted_size, _) = self._data.popitem(last=False)
+                self._size -= evicted_size
+                self.evictions += 1
+
+    def pop(self, key):
+        """Remove uma entrada, se existir."""
+        with self._lock:
+            item = self._data.pop(key, None)
+            if item is not None:
+                self._size -= item[1]
+                return item[0]
+            return None
+
+    def clear(self):
+        """Remove todas as entradas."""
+        with self._lock:
+            self._data.clear()
+            self._size = 0
+
+    def stats(self):
+        """Retorna os contadores do cache."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._data),
+                "size_bytes": self._size if self.max_bytes is not None else None,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else None
+            }
\ No newline at end of file
@@ -0,0 +1,250 @@
+from flask import current_app
+from app import db
+from app.models.vehicle import Vehicle
+from app.utils.vehicle_events import on_vehicle_change
+from app.utils.suggest import normalize_term
+from app.utils.pagination import make_next_cursor
+from datetime import datetime, timedelta
+import threading
+import time
+
+try:
+    import numpy as np
+except ImportError:  # O motor é opcional; sem NumPy a busca usa apenas SQL
+    np = None
+
+_EPOCH = datetime(1970, 1, 1)
+
+# Tamanho dos blocos ao percorrer a ordem pré-calculada em busca da página
+SCAN_CHUNK = 65536
+
+def _to_micros(value):
+    return (value - _EPOCH) // timedelta(microseconds=1)
+
+class CatalogSnapshot:
+    """Cópia colunar do catálogo em arrays NumPy para filtrar a busca com máscaras vetorizadas.
+
+    Guarda id, ano, preço, reservado, data de criação e os códigos internados de
+    marca/modelo. Os filtros numéricos viram máscaras booleanas e os de texto são
+    resolvidos sobre o vocabulário (pequeno) de valores distintos. Só os ids da
+    página pedida são buscados no banco.
+
+    O snapshot é construído na primeira busca, não no init_app: create_app também roda
+    nos comandos do Flask (ex.: "flask db upgrade"), quando a tabela pode nem existir.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self.enabled = False
+        self.built_at = None
+        self._size = 0
+
+    def init_app(self, app):
+        self.enabled = app.config.get('VEHICLE_SNAPSHOT_ENABLED', False) and np is not None
+        if app.config.get('VEHICLE_SNAPSHOT_ENABLED', False) and np is None:
+            app.logger.warning("VEHICLE_SNAPSHOT_ENABLED ignorado: NumPy não está instalado.")
+
+    def build(self, rows):
+        """Recria o snapshot a partir de tuplas (id, marca, modelo, ano, preco, is_reserved, created_at)."""
+        rows = list(rows)
+        size = len(rows)
+        capacity = max(1024, size * 2)
+
+        def column(index, dtype):
+            array = np.zeros(capacity, dtype=dtype)
+            array[:size] = np.fromiter((row[index] for row in rows), dtype=dtype, count=size)
+            return array
+
+        with self._lock:
+            self._codes = {'marca': {}, 'modelo': {}}
+            self._vocabulary = {'marca': [], 'modelo': []}
+            self._ids = column(0, np.int64)
+            self._marca = np.zeros(capacity, dtype=np.int32)
+            self._marca[:size] = [self._intern('marca', row[1]) for row in rows]
+            self._modelo = np.zeros(capacity, dtype=np.int32)
+            self._modelo[:size] = [self._intern('modelo', row[2]) for row in rows]
+            self._ano = column(3, np.int32)
+            self._preco = column(4, np.float64)
+            self._is_reserved = column(5, bool)
+            self._created_at = np.zeros(capacity, dtype=np.int64)
+            self._created_at[:size] = np.array([row[6] for row in rows], dtype='datetime64[us]').astype(np.int64)
+            self._alive = np.zeros(capacity, dtype=bool)
+            self._alive[:size] = True
+            self._row_of = {int(vehicle_id): row for row, vehicle_id in enumerate(self._ids[:size])}
+            self._sorted = {}
+            self._size = size
+            self.built_at = time.monotonic()
+
+    def _intern(self, field, value):
+        codes = self._codes[field]
+        code = codes.get(value)
+        if code is None:
+            code = len(self._vocabulary[field])
+            codes[value] = code
+            self._vocabulary[field].append(normalize_term(value))
+        return code
+
+    def _grow(self):
+        for name in ('_ids', '_ano', '_preco', '_is_reserved', '_created_at', '_marca', '_modelo', '_alive'):
+            current = getattr(self, name)
+            grown = np.zeros(current.size * 2, dtype=current.dtype)
+            grown[:current.size] = current
+            setattr(self, name, grown)
+
+    def _append(self, values):
+        if self._size == self._ids.size:
+            self._grow()
+        row = self._size
+        self._size += 1
+        self._ids[row] = values['id']
+        self._alive[row] = True
+        self._row_of[values['id']] = row
+        self._patch(row, values)
+
+    def _patch(self, row, values):
+        if 'marca' in values:
+            self._marca[row] = self._intern('marca', values['marca'])
+        if 'modelo' in values:
+            self._modelo[row] = self._intern('modelo', values['modelo'])
+        if 'ano' in values:
+            self._ano[row] = values['ano']
+        if 'preco' in values:
+            self._preco[row] = values['preco']
+        if 'is_reserved' in values:
+            self._is_reserved[row] = bool(values['is_reserved'])
+        if values.get('created_at') is not None:
+            self._created_at[row] = _to_micros(values['created_at'])
+
+    def apply(self, changes):
+        """Aplica alterações de veículos (VehicleChange) ao snapshot."""
+        with self._lock:
+            if self.built_at is None:
+                return
+            if any(change.action == 'bulk' for change in changes):
+                # Reconstrói na próxima busca
+                self.built_at = None
+                return
+            for change in changes:
+                row = self._row_of.get(change.vehicle_id)
+                if change.action == 'deleted':
+                    if row is not None:
+                        self._alive[row] = False
+                        del self._row_of[change.vehicle_id]
+                elif row is None:
+                    if change.action == 'created':
+                        self._append(change.new)
+                else:
+                    self._patch(row, change.new or {})
+            # A ordem pré-calculada é refeita na próxima consulta
+            self._sorted = {}
+
+    def _column(self, sort):
+        return {
+            'id': self._ids,
+            'ano': self._ano,
+            'preco': self._preco,
+            'created_at': self._created_at
+        }[sort][:self._size]
+
+    def _sorted_order(self, sort):
+        order = self._sorted.get(sort)
+        if order is None:
+            ids = self._ids[:self._size]
+            if sort == 'id':
+                order = np.argsort(ids, kind='stable')
+            else:
+                order = np.lexsort((ids, self._column(sort)))
+            self._sorted[sort] = order
+        return order
+
+    def _text_lookup(self, field, needle):
+        """Tabela código -> bool com os valores que contêm o trecho (equivalente ao ilike '%x%')."""
+        needle = normalize_term(needle)
+        vocabulary = self._vocabulary[field]
+        lookup = np.zeros(len(vocabulary), dtype=bool)
+        lookup[[code for code, term in enumerate(vocabulary) if needle in term]] = True
+        return lookup
+
+    def _mask(self, filters):
+        size = self._size
+        mask = self._alive[:size].copy()
+        if filters.get('marca'):
+            mask &= self._text_lookup('marca', filters['marca'])[self._marca[:size]]
+        if filters.get('modelo'):
+            mask &= self._text_lookup('modelo', filters['modelo'])[self._modelo[:size]]
+        if filters.get('ano'):
+            mask &= self._ano[:size] == filters['ano']
+        if filters.get('preco_min'):
+            mask &= self._preco[:size] >= filters['preco_min']
+        if filters.get('preco_max'):
+            mask &= self._preco[:size] <= filters['preco_max']
+        if filters.get('is_reserved') is not None:
+            mask &= self._is_reserved[:size] == filters['is_reserved']
+        return mask
+
+    def paginate(self, filters, params):
+        """Retorna os ids da página pedida, o próximo cursor e (se solicitado) o total."""
+        with self._lock:
+            mask = self._mask(filters)
+            order = self._sorted_order(params['sort'])
+            column = self._column(params['sort'])
+            ids = self._ids[:self._size]
+            descending = params['order'] == 'desc'
+
+            cursor = params['cursor']
+            if cursor:
+                value = cursor['v']
+                if params['sort'] == 'created_at':
+                    value = _to_micros(datetime.fromisoformat(value))
+                sorted_values = column[order]
+                low = np.searchsorted(sorted_values, value, side='left')
+                high = np.searchsorted(sorted_values, value, side='right')
+                tied_ids = ids[order[low:high]]
+                side = 'left' if descending else 'right'
+                position = low + int(np.searchsorted(tied_ids, cursor['id'], side=side))
+                candidates = order[:position][::-1] if descending else order[position:]
+            else:
+                candidates = order[::-1] if descending else order
+
+            # Percorre a ordem em blocos e para assim que a página (mais um) estiver completa
+            wanted = params['limit'] + 1
+            chunks = []
+            found = 0
+            for start in range(0, candidates.size, SCAN_CHUNK):
+                chunk = candidates[start:start + SCAN_CHUNK]
+                chunk = chunk[mask[chunk]]
+                chunks.append(chunk)
+                found += chunk.size
+                if found >= wanted:
+                    break
+            selected = np.concatenate(chunks)[:wanted] if chunks else candidates[:0]
+            page_rows = selected[:params['limit']]
+
+            next_cursor = None
+            if selected.size > params['limit']:
+                last = page_rows[-1]
+                last_value = column[last].item()
+                if params['sort'] == 'created_at':
+                    last_value = _EPOCH + timedelta(microseconds=last_value)
+                next_cursor = make_next_cursor(params, last_value, int(ids[last]))
+
+            total = int(mask.sum()) if params['total'] else None
+            return [int(vehicle_id) for vehicle_id in ids[page_rows]], next_cursor, total
+
+catalog_snapshot = CatalogSnapshot()
+
+def ensure_snapshot_built():
+    """Constrói o snapshot na primeira busca e o recria periodicamente (alterações de outros processos)."""
+    refresh_seconds = current_app.config.get('VEHICLE_SNAPSHOT_REFRESH_SECONDS', 300)
+    built_at = catalog_snapshot.built_at
+    if built_at is not None and time.monotonic() - built_at < refresh_seconds:
+        return
+    rows = db.session.query(
+        Vehicle.id, Vehicle.marca, Vehicle.modelo, Vehicle.ano,
+        Vehicle.preco, Vehicle.is_reserved, Vehicle.created_at
+    ).yield_per(10000)
+    catalog_snapshot.build(rows)
+
+@on_vehicle_change
+def _update_catalog_snapshot(changes):
+    catalog_snapshot.apply(changes)
\ No newline at end of file
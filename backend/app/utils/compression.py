@@ -0,0 +1,194 @@
+from flask import request
+import threading
+import time
+import zlib
+
+try:
+    import brotli
+except ImportError:  # brotli é opcional
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # zstandard é opcional
+    zstandard = None
+
+# Tipos que valem a pena comprimir; imagens e arquivos já comprimidos passam direto
+COMPRESSIBLE_MIMETYPES = (
+    'application/json',
+    'application/x-ndjson',
+    'application/javascript',
+    'image/svg+xml',
+    'text/'
+)
+
+class _GzipEncoder:
+    def __init__(self, level):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data):
+        # Sync flush: cada bloco do streaming chega ao cliente sem esperar o próximo
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self):
+        return self._compressor.flush()
+
+class _BrotliEncoder:
+    def __init__(self, level):
+        self._compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data):
+        return self._compressor.process(data) + self._compressor.flush()
+
+    def finish(self):
+        return self._compressor.finish()
+
+class _ZstdEncoder:
+    def __init__(self, level):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data):
+        return self._compressor.compress(data) + self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self):
+        return self._compressor.flush()
+
+ENCODERS = {'gzip': _GzipEncoder}
+if brotli is not None:
+    ENCODERS['br'] = _BrotliEncoder
+if zstandard is not None:
+    ENCODERS['zstd'] = _ZstdEncoder
+
+class ResponseCompressor:
+    """Comprime as respostas conforme o Accept-Encoding do cliente (zstd, brotli ou gzip).
+
+    Respostas menores que COMPRESS_MIN_SIZE seguem sem compressão; respostas em
+    streaming são comprimidas bloco a bloco. Por rota, registra bytes antes e
+    depois e o tempo de CPU gasto na compressão.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def init_app(self, app):
+        self.enabled = app.config.get('COMPRESS_ENABLED', True)
+        self.min_size = app.config.get('COMPRESS_MIN_SIZE', 1024)
+        preference = app.config.get('COMPRESS_ALGORITHMS', 'zstd,br,gzip')
+        self.algorithms = [name.strip() for name in preference.split(',') if name.strip() in ENCODERS]
+        self.levels = {
+            'gzip': app.config.get('COMPRESS_LEVEL_GZIP', 6),
+            'br': app.config.get('COMPRESS_LEVEL_BR', 4),
+            'zstd': app.config.get('COMPRESS_LEVEL_ZSTD', 3)
+        }
+        app.after_request(self.compress_response)
+
+    def _negotiate(self):
+        """Escolhe o algoritmo com maior qualidade no Accept-Encoding (empate: ordem de preferência)."""
+        best, best_quality = None, 0
+        for name in self.algorithms:
+            quality = request.accept_encodings.quality(name)
+            if quality > best_quality:
+                best, best_quality = name, quality
+        return best
+
+    def _should_compress(self, response):
+        if not self.enabled or response.direct_passthrough:
+            return False
+        if response.status_code < 200 or response.status_code in (204, 206, 304):
+            return False
+        if 'Content-Encoding' in response.headers:
+            return False
+        mimetype = response.mimetype or ''
+        # Server-Sent Events precisam chegar ao cliente evento a evento
+        return mimetype.startswith(COMPRESSIBLE_MIMETYPES) and mimetype != 'text/event-stream'
+
+    def compress_response(self, response):
+        if not self._should_compress(response):
+            return response
+
+        response.vary.add('Accept-Encoding')
+        if not response.is_streamed and response.calculate_content_length() < self.min_size:
+            return response
+
+        algorithm = self._negotiate()
+        if algorithm is None:
+            return response
+
+        encoder = ENCODERS[algorithm](self.levels[algorithm])
+        route = request.url_rule.rule if request.url_rule else request.path
+        response.headers['Content-Encoding'] = algorithm
+        # A representação comprimida não é idêntica byte a byte à original
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            response.set_etag(etag, weak=True)
+
+        if response.is_streamed:
+            response.response = self._compress_stream(response.response, encoder, route, algorithm)
+            response.headers.pop('Content-Length', None)
+            return response
+
+        data = response.get_data()
+        start = time.thread_time()
+        compressed = encoder.compress(data) + encoder.finish()
+        self._record(route, algorithm, len(data), len(compressed), time.thread_time() - start)
+        response.set_data(compressed)
+        return response
+
+    def _compress_stream(self, chunks, encoder, route, algorithm):
+        original = compressed = 0
+        cpu = 0.0
+        try:
+            for chunk in chunks:
+                if isinstance(chunk, str):
+                    chunk = chunk.encode('utf-8')
+                if not chunk:
+                    continue
+                start = time.thread_time()
+                output = encoder.compress(chunk)
+                cpu += time.thread_time() - start
+                original += len(chunk)
+                compressed += len(output)
+                yield output
+            start = time.thread_time()
+            output = encoder.finish()
+            cpu += time.thread_time() - start
+            compressed += len(output)
+            yield output
+        finally:
+            if hasattr(chunks, 'close'):
+                chunks.close()
+            self._record(route, algorithm, original, compressed, cpu)
+
+    def _record(self, route, algorithm, original, compressed, cpu):
+        with self._lock:
+            stats = self._stats.setdefault(route, {
+                'responses': 0, 'bytes_in': 0, 'bytes_out': 0, 'cpu_seconds': 0.0, 'algorithms': {}
+            })
+            stats['responses'] += 1
+            stats['bytes_in'] += original
+            stats['bytes_out'] += compressed
+            stats['cpu_seconds'] += cpu
+            stats['algorithms'][algorithm] = stats['algorithms'].get(algorithm, 0) + 1
+
+    def stats(self):
+        """Economia de bytes e CPU gasta por rota."""
+        with self._lock:
+            routes = {}
+            for route, stats in self._stats.items():
+                routes[route] = dict(
+                    stats,
+                    algorithms=dict(stats['algorithms']),
+                    bytes_saved=stats['bytes_in'] - stats['bytes_out'],
+                    ratio=round(stats['bytes_out'] / stats['bytes_in'], 4) if stats['bytes_in'] else None,
+                    cpu_seconds=round(stats['cpu_seconds'], 6)
+                )
+        return {
+            "enabled": self.enabled,
+            "algorithms": self.algorithms,
+            "min_size": self.min_size,
+            "routes": routes
+        }
+
+compressor = ResponseCompressor()
\ No newline at end of file
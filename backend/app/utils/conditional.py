@@ -0,0 +1,47 @@
+from flask import request, make_response, current_app
+from app.utils.table_versions import get_table_versions
+from functools import wraps
+import hashlib
+
+def conditional_response(*tables):
+    """Decorator que emite ETag/Last-Modified a partir das versões das tabelas lidas pela rota.
+
+    Quando o cliente envia If-None-Match (ou If-Modified-Since) ainda válido, responde
+    304 sem executar a consulta nem a serialização. O ETag combina as versões das
+    tabelas com a rota e os parâmetros da requisição, então é forte: mesma versão e
+    mesmos parâmetros produzem exatamente o mesmo corpo.
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated(*args, **kwargs):
+            versions = get_table_versions(tables)
+            fingerprint = '|'.join([
+                request.path,
+                repr(sorted(request.args.items(multi=True))),
+                ','.join(f"{name}:{versions[name][0]}" for name in sorted(versions))
+            ])
+            etag = hashlib.sha1(fingerprint.encode('utf-8')).hexdigest()[:32]
+            timestamps = [updated_at for _, updated_at in versions.values() if updated_at is not None]
+            last_modified = max(timestamps).replace(microsecond=0) if timestamps else None
+
+            not_modified = False
+            if request.if_none_match:
+                # Comparação fraca (RFC 9110): a versão comprimida recebe ETag fraco
+                not_modified = request.if_none_match.contains_weak(etag)
+            elif request.if_modified_since and last_modified is not None:
+                not_modified = last_modified <= request.if_modified_since.replace(tzinfo=None)
+
+            if not_modified:
+                response = current_app.response_class(status=304)
+            else:
+                response = make_response(f(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+
+            response.set_etag(etag)
+            if last_modified is not None:
+                response.last_modified = last_modified
+            response.headers['Cache-Control'] = 'private, no-cache'
+            return response
+        return decorated
+    return decorator
\ No newline at end of file
@@ -0,0 +1,140 @@
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from collections import deque
+from app.utils.vehicle_events import on_vehicle_change
+import itertools
+import queue
+import threading
+import time
+
+# Eventos de vaga publicados aos clientes: só os campos que a vitrine exibe
+VEHICLE_EVENT_FIELDS = ('id', 'marca', 'modelo', 'ano', 'preco', 'is_reserved', 'photo_url')
+
+class Subscriber:
+    """Fila limitada de um cliente do feed; se encher, o cliente é desconectado e retoma pelo Last-Event-ID."""
+
+    def __init__(self, maxsize, topics=None):
+        self.queue = queue.Queue(maxsize=maxsize)
+        self.topics = topics
+        self.overflowed = False
+
+    def wants(self, event_type):
+        return self.topics is None or event_type.split('.', 1)[0] in self.topics
+
+    def offer(self, item):
+        try:
+            self.queue.put_nowait(item)
+        except queue.Full:
+            self.overflowed = True
+
+class EventBus:
+    """Barramento em processo que distribui os eventos para cada cliente conectado.
+
+    Mantém um histórico curto para que um cliente reconectado receba o que perdeu
+    a partir do Last-Event-ID. Os ids levam o instante de início do processo:
+    um id de outro processo (ou antigo demais) gera um evento 'reset', indicando
+    que o cliente deve recarregar os dados.
+    """
+
+    def __init__(self):
+        self.boot = format(int(time.time() * 1000), 'x')
+        self._sequence = itertools.count(1)
+        self._lock = threading.Lock()
+        self._subscribers = set()
+        self._history = deque(maxlen=1000)
+        self.queue_size = 100
+        self.published = 0
+        self.dropped = 0
+
+    def init_app(self, app):
+        self.queue_size = app.config.get('EVENTS_QUEUE_SIZE', 100)
+        self._history = deque(self._history, maxlen=app.config.get('EVENTS_HISTORY_SIZE', 1000))
+
+    def publish(self, event_type, data):
+        with self._lock:
+            item = (f"{self.boot}-{next(self._sequence)}", event_type, data)
+            self._history.append(item)
+            self.published += 1
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            if subscriber.wants(event_type):
+                subscriber.offer(item)
+
+    def subscribe(self, last_event_id=None, topics=None):
+        """Registra um cliente; com Last-Event-ID, já enfileira os eventos perdidos."""
+        subscriber = Subscriber(self.queue_size, topics)
+        with self._lock:
+            if last_event_id:
+                missed = self._missed_since(last_event_id)
+                if missed is None:
+                    subscriber.offer((f"{self.boot}-0", 'reset', {}))
+                else:
+                    for item in missed:
+                        if subscriber.wants(item[1]):
+                            subscriber.offer(item)
+            self._subscribers.add(subscriber)
+        return subscriber
+
+    def _missed_since(self, last_event_id):
+        boot, _, sequence = last_event_id.partition('-')
+        if boot != self.boot or not sequence.isdigit():
+            return None
+        sequence = int(sequence)
+        oldest = int(self._history[0][0].partition('-')[2]) if self._history else sequence + 1
+        if sequence + 1 < oldest:
+            return None
+        return [item for item in self._history if int(item[0].partition('-')[2]) > sequence]
+
+    def unsubscribe(self, subscriber):
+        with self._lock:
+            self._subscribers.discard(subscriber)
+            if subscriber.overflowed:
+                self.dropped += 1
+
+    def stats(self):
+        with self._lock:
+            return {
+                "subscribers": len(self._subscribers),
+                "published": self.published,
+                "dropped_clients": self.dropped,
+                "history": len(self._history)
+            }
+
+event_bus = EventBus()
+
+@on_vehicle_change
+def _publish_vehicle_changes(changes):
+    for change in changes:
+        if change.action == 'bulk':
+            event_bus.publish('vehicle.reset', {})
+        elif change.action == 'created':
+            event_bus.publish('vehicle.created', {field: change.new[field] for field in VEHICLE_EVENT_FIELDS})
+        elif change.action == 'deleted':
+            event_bus.publish('vehicle.deleted', {'id': change.vehicle_id})
+        elif change.old['is_reserved'] != change.new['is_reserved']:
+            event_type = 'vehicle.reserved' if change.new['is_reserved'] else 'vehicle.released'
+            event_bus.publish(event_type, {'id': change.vehicle_id})
+        else:
+            changed = {
+                field: change.new[field] for field in VEHICLE_EVENT_FIELDS
+                if change.old[field] != change.new[field]
+            }
+            if changed:
+                event_bus.publish('vehicle.updated', dict(changed, id=change.vehicle_id))
+
+@event.listens_for(Session, 'after_flush')
+def _collect_booked_slots(session, flush_context):
+    from app.models.inspection import Inspection
+
+    for obj in session.new:
+        if isinstance(obj, Inspection):
+            session.info.setdefault('booked_slots', []).append({'slot': obj.inspection_date, 'bay': obj.bay})
+
+@event.listens_for(Session, 'after_commit')
+def _publish_booked_slots(session):
+    for slot in session.info.pop('booked_slots', ()):
+        event_bus.publish('slot.booked', slot)
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_booked_slots(session):
+    session.info.pop('booked_slots', None)
\ No newline at end of file
@@ -0,0 +1,85 @@
+from flask import current_app, request, stream_with_context
+from app import db
+from datetime import date, datetime
+import csv
+import io
+
+EXPORT_FORMATS = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv'
+}
+
+def read_export_params(allowed_columns):
+    """Lê ?format= (ndjson ou csv) e ?columns=; lança ValueError se inválidos."""
+    export_format = request.args.get('format', 'ndjson').lower()
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError("Formato inválido. Use 'ndjson' ou 'csv'.")
+
+    columns = request.args.get('columns')
+    if not columns:
+        return export_format, list(allowed_columns)
+
+    names = []
+    for name in columns.split(','):
+        name = name.strip()
+        if not name or name in names:
+            continue
+        if name not in allowed_columns:
+            raise ValueError(f"Coluna inválida: '{name}'. Disponíveis: {', '.join(allowed_columns)}.")
+        names.append(name)
+    if not names:
+        raise ValueError("Informe ao menos uma coluna.")
+    return export_format, names
+
+def _csv_value(value):
+    if value is None:
+        return ''
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+def _encode_csv(names, partitions):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(names)
+    # BOM para que planilhas reconheçam o UTF-8 (acentos)
+    yield buffer.getvalue().encode('utf-8-sig')
+    for rows in partitions:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows([_csv_value(value) for value in row] for row in rows)
+        yield buffer.getvalue().encode('utf-8')
+
+def _encode_ndjson(names, partitions):
+    dumps = current_app.json.dumps_bytes
+    for rows in partitions:
+        yield b''.join(dumps(dict(zip(names, row))) + b'\n' for row in rows)
+
+def export_response(model, allowed_columns, filename, conditions=()):
+    """Resposta em streaming com as linhas da tabela em NDJSON ou CSV, com memória constante.
+
+    Seleciona só as colunas pedidas (sem montar objetos do ORM) e lê o resultado em
+    lotes com yield_per, que no MySQL usa cursor do lado do servidor. Cada lote vira
+    um bloco da resposta chunked, então o worker nunca guarda a tabela inteira.
+    """
+    export_format, names = read_export_params(allowed_columns)
+    batch_size = current_app.config.get('EXPORT_BATCH_SIZE', 1000)
+    statement = db.select(*[model.__table__.c[name] for name in names]) \
+        .where(*conditions) \
+        .order_by(model.__table__.c.id) \
+        .execution_options(yield_per=batch_size)
+    encode = _encode_csv if export_format == 'csv' else _encode_ndjson
+
+    def generate():
+        result = db.session.execute(statement)
+        try:
+            yield from encode(names, result.partitions())
+        finally:
+            result.close()
+
+    stamp = datetime.utcnow().strftime('%Y%m%d-%H%M%S')
+    return current_app.response_class(
+        stream_with_context(generate()),
+        mimetype=EXPORT_FORMATS[export_format],
+        headers={'Content-Disposition': f'attachment; filename="{filename}-{stamp}.{export_format}"'}
+    )
\ No newline at end of file
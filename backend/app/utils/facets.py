@@ -0,0 +1,75 @@
+from app import db
+from app.models.vehicle import Vehicle
+
+FACET_NAMES = ('marca', 'ano', 'preco', 'is_reserved')
+
+def parse_facets(value):
+    """Interpreta o parâmetro ?facets= (true/all ou lista separada por vírgulas)."""
+    if value is None or value.strip().lower() in ('', '0', 'false', 'no'):
+        return ()
+    if value.strip().lower() in ('1', 'true', 'yes', 'all'):
+        return FACET_NAMES
+    names = tuple(name.strip() for name in value.split(',') if name.strip())
+    invalid = [name for name in names if name not in FACET_NAMES]
+    if invalid:
+        raise ValueError(f"Facetas inválidas: {', '.join(invalid)}. Use: {', '.join(FACET_NAMES)}.")
+    return names
+
+def parse_price_buckets(value, default):
+    """Interpreta os limites das faixas de preço (ex.: "20000,50000,100000")."""
+    raw = value if value is not None else default
+    try:
+        bounds = sorted({float(bound) for bound in str(raw).split(',') if bound.strip()})
+    except ValueError:
+        raise ValueError("Faixas de preço inválidas. Use números separados por vírgula.")
+    if not bounds:
+        raise ValueError("Informe ao menos um limite de faixa de preço.")
+    return bounds
+
+def _price_facet(query, bounds):
+    # A faixa de cada veículo é calculada no banco com um CASE, agrupando por índice da faixa
+    bucket = db.case(
+        *[(Vehicle.preco < bound, index) for index, bound in enumerate(bounds)],
+        else_=len(bounds)
+    ).label('bucket')
+    counts = dict(
+        query.with_entities(bucket, db.func.count(Vehicle.id)).group_by(bucket).all()
+    )
+    edges = [None] + bounds + [None]
+    return [
+        {"min": edges[index], "max": edges[index + 1], "count": counts.get(index, 0)}
+        for index in range(len(bounds) + 1)
+    ]
+
+def compute_facets(query, names, price_buckets):
+    """Calcula as contagens por faceta para o conjunto de filtros da query, com GROUP BY no banco."""
+    query = query.order_by(None)
+    facets = {}
+
+    if 'marca' in names:
+        rows = query.with_entities(Vehicle.marca, db.func.count(Vehicle.id)).group_by(Vehicle.marca).all()
+        facets['marca'] = [
+            {"value": marca, "count": count}
+            for marca, count in sorted(rows, key=lambda row: (-row[1], row[0]))
+        ]
+
+    if 'ano' in names:
+        rows = query.with_entities(Vehicle.ano, db.func.count(Vehicle.id)).group_by(Vehicle.ano).all()
+        facets['ano'] = [
+            {"value": ano, "count": count}
+            for ano, count in sorted(rows, key=lambda row: -row[0])
+        ]
+
+    if 'preco' in names:
+        facets['preco'] = _price_facet(query, price_buckets)
+
+    if 'is_reserved' in names:
+        rows = dict(
+            query.with_entities(Vehicle.is_reserved, db.func.count(Vehicle.id)).group_by(Vehicle.is_reserved).all()
+        )
+        facets['is_reserved'] = {
+            "reserved": rows.get(True, 0),
+            "available": rows.get(False, 0)
+        }
+
+    return facets
\ No newline at end of file
@@ -0,0 +1,114 @@
+from app import db
+from bisect import bisect_right
+from datetime import date, datetime, time, timedelta
+
+def _parse_minutes(value):
+    """Converte "HH:MM" em minutos desde a meia-noite."""
+    hours, _, minutes = value.partition(':')
+    return int(hours) * 60 + int(minutes or 0)
+
+def _parse_dates(value):
+    return frozenset(date.fromisoformat(item.strip()) for item in (value or '').split(',') if item.strip())
+
+def _parse_weekdays(value):
+    return frozenset(int(item) for item in (value or '').split(',') if item.strip())
+
+class SlotCalendar:
+    """Calendário de vistorias: horário de funcionamento, duração do horário, boxes e datas bloqueadas.
+
+    Calcula a disponibilidade de uma janela inteira a partir de uma única consulta
+    agrupada por horário, em vez de uma consulta por horário.
+    """
+
+    def __init__(self, opening='09:00', closing='17:00', slot_minutes=60, bays=1,
+                 blackout_dates=frozenset(), closed_weekdays=frozenset()):
+        self.slot_minutes = slot_minutes
+        self.bays = bays
+        self.blackout_dates = blackout_dates
+        self.closed_weekdays = closed_weekdays
+        opening, closing = _parse_minutes(opening), _parse_minutes(closing)
+        self.offsets = tuple(range(opening, closing - slot_minutes + 1, slot_minutes))
+        self._offset_index = {offset: position for position, offset in enumerate(self.offsets)}
+        self._suffixes = tuple(f"{offset // 60:02d}:{offset % 60:02d}:00" for offset in self.offsets)
+
+    @classmethod
+    def from_config(cls, config):
+        return cls(
+            opening=config.get('INSPECTION_OPENING_TIME', '09:00'),
+            closing=config.get('INSPECTION_CLOSING_TIME', '17:00'),
+            slot_minutes=config.get('INSPECTION_SLOT_MINUTES', 60),
+            bays=config.get('INSPECTION_BAYS', 1),
+            blackout_dates=_parse_dates(config.get('INSPECTION_BLACKOUT_DATES')),
+            closed_weekdays=_parse_weekdays(config.get('INSPECTION_CLOSED_WEEKDAYS'))
+        )
+
+    def is_open(self, day):
+        return day not in self.blackout_dates and day.weekday() not in self.closed_weekdays
+
+    def is_slot(self, when):
+        """Indica se o horário é o início de um horário válido do calendário."""
+        if when.second or when.microsecond or not self.is_open(when.date()):
+            return False
+        return when.hour * 60 + when.minute in self._offset_index
+
+    def booked_counts(self, start, end):
+        """Vistorias agendadas por horário na janela [start, end), em uma única consulta."""
+        from app.models.inspection import Inspection
+
+        rows = db.session.query(Inspection.inspection_date, db.func.count(Inspection.id)) \
+            .filter(Inspection.inspection_date >= start, Inspection.inspection_date < end) \
+            .group_by(Inspection.inspection_date) \
+            .all()
+        return dict(rows)
+
+    def availability(self, start_day, days, booked, now=None):
+        """Horários com vaga na janela (strings ISO 8601) e os boxes livres de cada um.
+
+        A ocupação vai para um vetor indexado por (dia, horário) e a saída é montada
+        com os sufixos de hora já formatados, sem criar um datetime por horário.
+        Horários que já começaram são ignorados.
+        """
+        now = now or datetime.utcnow()
+        per_day = len(self.offsets)
+        occupancy = [0] * (days * per_day)
+        window_start = datetime.combine(start_day, time())
+        for when, count in booked.items():
+            delta = when - window_start
+            position = self._offset_index.get(delta.seconds // 60) if not delta.seconds % 60 else None
+            if position is not None and 0 <= delta.days < days:
+                occupancy[delta.days * per_day + position] += count
+
+        bays = self.bays
+        suffixes = self._suffixes
+        today = now.date()
+        slots, free_bays = [], []
+        for day_index in range(days):
+            day = start_day + timedelta(days=day_index)
+            if day < today or not self.is_open(day):
+                continue
+            first = bisect_right(self.offsets, now.hour * 60 + now.minute) if day == today else 0
+            prefix = day.isoformat() + 'T'
+            base = day_index * per_day
+            for position in range(first, per_day):
+                free = bays - occupancy[base + position]
+                if free > 0:
+                    slots.append(prefix + suffixes[position])
+                    free_bays.append(free)
+        return slots, free_bays
+
+    def free_bays(self, when):
+        """Boxes ainda livres no horário, em ordem crescente."""
+        from app.models.inspection import Inspection
+
+        taken = {bay for (bay,) in db.session.query(Inspection.bay).filter(Inspection.inspection_date == when)}
+        return [bay for bay in range(1, self.bays + 1) if bay not in taken]
+
+    def nearest_free(self, when, count=3, days=7):
+        """Horários livres mais próximos de ``when`` (antes ou depois), ordenados pela distância."""
+        start_day = max(when.date() - timedelta(days=days), datetime.utcnow().date())
+        window = (when.date() - start_day).days + days + 1
+        window_start = datetime.combine(start_day, time())
+        booked = self.booked_counts(window_start, window_start + timedelta(days=window))
+        slots, _ = self.availability(start_day, window, booked)
+        slots.sort(key=lambda slot: abs(datetime.fromisoformat(slot) - when))
+        return slots[:count]
\ No newline at end of file
@@ -0,0 +1,70 @@
+from flask.json.provider import DefaultJSONProvider
+from datetime import date, datetime, time
+from decimal import Decimal
+import dataclasses
+import uuid
+
+try:
+    import orjson
+except ImportError:  # orjson é opcional; sem ele, usa o encoder da biblioteca padrão
+    orjson = None
+
+def _default(value):
+    """Converte os tipos que o encoder não conhece (datas em ISO 8601, Decimal como número)."""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    if hasattr(value, '__html__'):
+        return str(value.__html__())
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Provider JSON do Flask baseado no orjson, com fallback para a biblioteca padrão.
+
+    Datas e Decimal são serializados diretamente, sem conversão prévia nos modelos.
+    As respostas são montadas a partir de ``dumps_bytes``, sem a cópia intermediária em str.
+    """
+
+    default = staticmethod(_default)
+    # A ordem das chaves segue os dicionários (determinística); ordenar custa caro em listas grandes
+    sort_keys = False
+
+    def __init__(self, app):
+        super().__init__(app)
+        self.use_orjson = orjson is not None and app.config.get('JSON_USE_ORJSON', True)
+
+    def _orjson_options(self, indent=False):
+        options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if self.sort_keys:
+            options |= orjson.OPT_SORT_KEYS
+        if indent:
+            options |= orjson.OPT_INDENT_2
+        return options
+
+    def dumps_bytes(self, obj, indent=False):
+        """Serializa direto para bytes UTF-8."""
+        if self.use_orjson:
+            return orjson.dumps(obj, default=_default, option=self._orjson_options(indent))
+        kwargs = {'indent': 2} if indent else {'separators': (',', ':')}
+        return super().dumps(obj, **kwargs).encode('utf-8')
+
+    def dumps(self, obj, **kwargs):
+        if self.use_orjson and not kwargs:
+            return self.dumps_bytes(obj).decode('utf-8')
+        return super().dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs):
+        # orjson aceita bytes diretamente, sem decodificar o corpo da requisição
+        if self.use_orjson and not kwargs:
+            return orjson.loads(s)
+        return super().loads(s, **kwargs)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        return self._app.response_class(self.dumps_bytes(obj, indent=indent), mimetype=self.mimetype)
\ No newline at end of file
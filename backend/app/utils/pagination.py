@@ -0,0 +1,160 @@
+from flask import request, current_app
+from app import db
+from datetime import datetime
+import base64
+import json
+
+def encode_cursor(payload):
+    """Codifica a posição da última linha retornada em um token opaco."""
+    raw = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+def decode_cursor(token):
+    """Decodifica um token gerado por encode_cursor."""
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+    except (ValueError, TypeError):
+        raise ValueError("Cursor inválido.")
+    if not isinstance(payload, dict) or 'id' not in payload or 'v' not in payload:
+        raise ValueError("Cursor inválido.")
+    return payload
+
+def _serialize_value(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+def _deserialize_value(column, value):
+    if value is not None and isinstance(column.type, db.DateTime):
+        try:
+            return datetime.fromisoformat(value)
+        except (TypeError, ValueError):
+            raise ValueError("Cursor inválido.")
+    return value
+
+def _estimate_total(query, model):
+    """Estimativa barata do total usando as estatísticas da tabela (MySQL)."""
+    if query.whereclause is None and db.engine.dialect.name == 'mysql':
+        estimate = db.session.execute(
+            db.text(
+                "SELECT TABLE_ROWS FROM information_schema.TABLES "
+                "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table"
+            ),
+            {"table": model.__tablename__}
+        ).scalar()
+        if estimate is not None:
+            return int(estimate)
+    # Sem estatísticas confiáveis (ou com filtros aplicados) faz a contagem exata
+    return query.order_by(None).count()
+
+def read_page_params(sort_fields, default_sort='id', default_order='asc'):
+    """Lê e valida os parâmetros de paginação da requisição.
+
+    Parâmetros aceitos: limit, cursor, sort (um dos sort_fields), order (asc|desc)
+    e total (exact|estimate).
+    """
+    default_limit = current_app.config.get('PAGINATION_DEFAULT_LIMIT', 50)
+    max_limit = current_app.config.get('PAGINATION_MAX_LIMIT', 200)
+
+    limit = request.args.get('limit', default_limit, type=int)
+    if limit < 1:
+        raise ValueError("O parâmetro limit deve ser positivo.")
+    limit = min(limit, max_limit)
+
+    sort = request.args.get('sort', default_sort)
+    if sort != 'id' and sort not in sort_fields:
+        allowed = ', '.join(['id'] + list(sort_fields))
+        raise ValueError(f"Ordenação inválida. Use uma de: {allowed}.")
+
+    order = request.args.get('order', default_order)
+    if order not in ('asc', 'desc'):
+        raise ValueError("O parâmetro order deve ser 'asc' ou 'desc'.")
+
+    total_mode = request.args.get('total')
+    if total_mode not in (None, 'exact', 'estimate'):
+        raise ValueError("O parâmetro total deve ser 'exact' ou 'estimate'.")
+
+    cursor = None
+    token = request.args.get('cursor')
+    if token:
+        cursor = decode_cursor(token)
+        if cursor.get('s') != sort or cursor.get('o') != order:
+            raise ValueError("O cursor não corresponde à ordenação solicitada.")
+
+    return {
+        "limit": limit,
+        "sort": sort,
+        "order": order,
+        "total": total_mode,
+        "cursor": cursor
+    }
+
+def make_next_cursor(params, last_value, last_id):
+    """Gera o cursor da próxima página a partir da última linha retornada."""
+    return encode_cursor({
+        's': params['sort'],
+        'o': params['order'],
+        'v': _serialize_value(last_value),
+        'id': last_id
+    })
+
+def paginate_keyset(query, model, sort_fields, default_sort='id', default_order='asc'):
+    """Pagina uma query por cursor (keyset) usando os parâmetros da requisição.
+
+    A ordenação sempre usa o id como desempate, então cada página é um range
+    scan no índice (coluna, id) em vez de um OFFSET.
+    """
+    params = read_page_params(sort_fields, default_sort, default_order)
+    limit, sort = params['limit'], params['sort']
+
+    total = None
+    if params['total'] == 'exact':
+        total = query.order_by(None).count()
+    elif params['total'] == 'estimate':
+        total = _estimate_total(query, model)
+
+    id_column = model.id
+    sort_column = getattr(model, sort)
+    descending = params['order'] == 'desc'
+
+    cursor = params['cursor']
+    if cursor:
+        last_id = cursor['id']
+        if sort == 'id':
+            query = query.filter(id_column < last_id if descending else id_column > last_id)
+        else:
+            last_value = _deserialize_value(sort_column, cursor['v'])
+            if descending:
+                query = query.filter(db.or_(
+                    sort_column < last_value,
+                    db.and_(sort_column == last_value, id_column < last_id)
+                ))
+            else:
+                query = query.filter(db.or_(
+                    sort_column > last_value,
+                    db.and_(sort_column == last_value, id_column > last_id)
+                ))
+
+    if sort == 'id':
+        ordering = [id_column.desc() if descending else id_column.asc()]
+    elif descending:
+        ordering = [sort_column.desc(), id_column.desc()]
+    else:
+        ordering = [sort_column.asc(), id_column.asc()]
+
+    # Busca uma linha a mais para saber se existe próxima página sem COUNT(*)
+    rows = query.order_by(None).order_by(*ordering).limit(limit + 1).all()
+    items = rows[:limit]
+
+    next_cursor = None
+    if len(rows) > limit:
+        last = items[-1]
+        next_cursor = make_next_cursor(params, getattr(last, sort), last.id)
+
+    return {
+        "items": items,
+        "next_cursor": next_cursor,
+        "limit": limit,
+        "total": total
+    }
\ No newline at end of file
@@ -0,0 +1,126 @@
+from concurrent.futures import ProcessPoolExecutor, TimeoutError
+from flask import jsonify
+from werkzeug.security import generate_password_hash, check_password_hash, DEFAULT_PBKDF2_ITERATIONS
+import multiprocessing
+import threading
+
+DEFAULT_METHOD = 'scrypt:32768:8:1'
+
+def canonical_method(method):
+    """Completa os parâmetros omitidos, no formato gravado no início do hash ("método$sal$hash")."""
+    parts = method.split(':')
+    if parts[0] == 'scrypt':
+        defaults = ['scrypt', '32768', '8', '1']
+    elif parts[0] == 'pbkdf2':
+        defaults = ['pbkdf2', 'sha256', str(DEFAULT_PBKDF2_ITERATIONS)]
+    else:
+        raise ValueError(f"Método de hash de senha inválido: {method}")
+    return ':'.join(parts + defaults[len(parts):])
+
+def _hash_password(password, method, salt_length):
+    """Calcula o hash em um processo do pool."""
+    return generate_password_hash(password, method=method, salt_length=salt_length)
+
+def _verify_password(password_hash, password, method, salt_length):
+    """Confere a senha em um processo do pool; se o hash usa parâmetros antigos, já calcula o novo."""
+    if not check_password_hash(password_hash, password):
+        return False, None
+    if password_hash.split('$', 1)[0] != method:
+        return True, generate_password_hash(password, method=method, salt_length=salt_length)
+    return True, None
+
+class PasswordHasherBusy(Exception):
+    """Fila de hashing cheia (ou hash demorou além do limite): a requisição recebe 503."""
+
+class PasswordHasher:
+    """Calcula e confere hashes de senha em um pool de processos de tamanho fixo.
+
+    O KDF consome CPU por dezenas de milissegundos; fora do worker da requisição ele
+    não atrasa as leituras do catálogo. No máximo PASSWORD_HASH_MAX_PENDING operações
+    ficam em andamento ou na fila; acima disso a requisição falha na hora com 503.
+    Com PASSWORD_HASH_WORKERS=0 o hash é calculado na própria requisição.
+    """
+
+    def __init__(self):
+        self.method = DEFAULT_METHOD
+        self.salt_length = 16
+        self.workers = 0
+        self.max_pending = 0
+        self.timeout = None
+        self._pool = None
+        self._slots = None
+        self._lock = threading.Lock()
+        self._stats = {"completed": 0, "rejected": 0, "rehashed": 0}
+
+    def init_app(self, app):
+        self.method = canonical_method(app.config.get('PASSWORD_HASH_METHOD', DEFAULT_METHOD))
+        self.salt_length = app.config.get('PASSWORD_HASH_SALT_LENGTH', 16)
+        self.workers = app.config.get('PASSWORD_HASH_WORKERS', 2)
+        self.max_pending = app.config.get('PASSWORD_HASH_MAX_PENDING', 32)
+        self.timeout = app.config.get('PASSWORD_HASH_TIMEOUT', 10)
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        app.register_error_handler(PasswordHasherBusy, self._busy_response)
+
+    @staticmethod
+    def _busy_response(error):
+        response = jsonify({"error": "Servidor ocupado. Tente novamente em instantes."})
+        response.headers['Retry-After'] = '1'
+        return response, 503
+
+    def _executor(self):
+        if self._pool is None:
+            with self._lock:
+                if self._pool is None:
+                    # spawn: um fork no meio de um servidor com threads copiaria locks presos (logging, pool do banco)
+                    self._pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context('spawn'))
+        return self._pool
+
+    def _count(self, name):
+        with self._lock:
+            self._stats[name] += 1
+
+    def _run(self, function, *args):
+        if self.workers <= 0:
+            return function(*args)
+        # A vaga é devolvida ao mesmo semáforo, mesmo que init_app o troque enquanto o hash roda
+        slots = self._slots
+        if not slots.acquire(blocking=False):
+            self._count("rejected")
+            raise PasswordHasherBusy()
+        try:
+            future = self._executor().submit(function, *args)
+        except Exception:
+            slots.release()
+            raise
+        # A vaga só é liberada quando o processo termina, mesmo que a requisição desista antes
+        future.add_done_callback(lambda _: slots.release())
+        try:
+            result = future.result(timeout=self.timeout)
+        except TimeoutError:
+            self._count("rejected")
+            raise PasswordHasherBusy()
+        self._count("completed")
+        return result
+
+    def hash(self, password):
+        """Retorna o hash da senha com os parâmetros configurados."""
+        return self._run(_hash_password, password, self.method, self.salt_length)
+
+    def verify(self, password_hash, password):
+        """Retorna (senha confere, novo hash ou None se os parâmetros do hash estão atualizados)."""
+        valid, new_hash = self._run(_verify_password, password_hash, password, self.method, self.salt_length)
+        if new_hash:
+            self._count("rehashed")
+        return valid, new_hash
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+        stats.update({
+            "method": self.method,
+            "workers": self.workers,
+            "max_pending": self.max_pending
+        })
+        return stats
+
+password_hasher = PasswordHasher()
\ No newline at end of file
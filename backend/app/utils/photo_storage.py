@@ -0,0 +1,158 @@
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import multiprocessing
+import os
+import re
+import tempfile
+import threading
+
+PHOTO_TYPES = {
+    'jpg': 'image/jpeg',
+    'png': 'image/png',
+    'gif': 'image/gif',
+    'webp': 'image/webp'
+}
+
+_PHOTO_URL = re.compile(r'^(?P<base>.*/api/photos/)(?P<digest>[0-9a-f]{64})\.(?P<ext>jpg|png|gif|webp)$')
+
+def thumbnail_url_for(photo_url):
+    """Retorna a URL da miniatura de uma foto armazenada localmente (None para URLs externas)."""
+    match = _PHOTO_URL.match(photo_url or '')
+    if not match:
+        return None
+    return f"{match.group('base')}{match.group('digest')}/thumbnail"
+
+def _sniff_extension(header):
+    """Identifica o formato da imagem pelos primeiros bytes do arquivo."""
+    if header.startswith(b'\xff\xd8\xff'):
+        return 'jpg'
+    if header.startswith(b'\x89PNG\r\n\x1a\n'):
+        return 'png'
+    if header[:6] in (b'GIF87a', b'GIF89a'):
+        return 'gif'
+    if header[:4] == b'RIFF' and header[8:12] == b'WEBP':
+        return 'webp'
+    return None
+
+def _make_thumbnail(source, target, width, height):
+    """Gera a miniatura em um processo separado (executado pelo ProcessPoolExecutor)."""
+    from PIL import Image, ImageOps
+
+    with Image.open(source) as image:
+        image = ImageOps.exif_transpose(image)
+        thumbnail = ImageOps.fit(image.convert('RGB'), (width, height), Image.LANCZOS)
+        directory = os.path.dirname(target)
+        os.makedirs(directory, exist_ok=True)
+        fd, temporary = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as output:
+            thumbnail.save(output, 'JPEG', quality=80, optimize=True)
+        os.replace(temporary, target)
+    return target
+
+class PhotoStorage:
+    """Armazena fotos de veículos em disco, endereçadas pelo SHA-256 do conteúdo.
+
+    Arquivos iguais são gravados uma única vez. As miniaturas de tamanho fixo são
+    geradas em um pool de processos, fora do worker que atende a requisição.
+    """
+
+    def __init__(self):
+        self.root = None
+        self._pool = None
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._logger = None
+
+    def init_app(self, app):
+        self.root = app.config.get('PHOTO_STORAGE_DIR') or os.path.join(app.instance_path, 'photos')
+        self.max_bytes = app.config.get('PHOTO_MAX_BYTES', 10 * 1024 * 1024)
+        self.workers = app.config.get('PHOTO_THUMBNAIL_WORKERS', 2)
+        width, height = app.config.get('PHOTO_THUMBNAIL_SIZE', '320x240').lower().split('x')
+        self.thumbnail_size = (int(width), int(height))
+        # O callback da miniatura roda fora do contexto da aplicação
+        self._logger = app.logger
+
+    def _shard(self, kind, digest):
+        return os.path.join(self.root, kind, digest[:2])
+
+    def original_path(self, digest, ext):
+        return os.path.join(self._shard('originals', digest), f"{digest}.{ext}")
+
+    def thumbnail_path(self, digest):
+        width, height = self.thumbnail_size
+        return os.path.join(self._shard('thumbnails', digest), f"{digest}_{width}x{height}.jpg")
+
+    def find_original(self, digest):
+        """Retorna (caminho, extensão) da foto original, ou (None, None) se não existir."""
+        for ext in PHOTO_TYPES:
+            path = self.original_path(digest, ext)
+            if os.path.exists(path):
+                return path, ext
+        return None, None
+
+    def save(self, stream, chunk_size=1024 * 1024):
+        """Grava a imagem calculando o hash durante a cópia; retorna (digest, extensão, se é nova)."""
+        temporary_dir = os.path.join(self.root, 'tmp')
+        os.makedirs(temporary_dir, exist_ok=True)
+        digest = hashlib.sha256()
+        size = 0
+        header = b''
+        fd, temporary = tempfile.mkstemp(dir=temporary_dir)
+        try:
+            with os.fdopen(fd, 'wb') as output:
+                while True:
+                    chunk = stream.read(chunk_size)
+                    if not chunk:
+                        break
+                    if len(header) < 16:
+                        header += chunk[:16 - len(header)]
+                    size += len(chunk)
+                    if size > self.max_bytes:
+                        raise ValueError(f"A imagem excede o limite de {self.max_bytes // (1024 * 1024)} MB.")
+                    digest.update(chunk)
+                    output.write(chunk)
+
+            ext = _sniff_extension(header)
+            if ext is None:
+                raise ValueError("Formato de imagem não suportado. Use JPEG, PNG, GIF ou WEBP.")
+
+            digest = digest.hexdigest()
+            target = self.original_path(digest, ext)
+            if os.path.exists(target):
+                return digest, ext, False
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            os.replace(temporary, target)
+            return digest, ext, True
+        finally:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+
+    def _executor(self):
+        if self._pool is None:
+            # spawn: um fork no meio de um servidor com threads copiaria locks presos (logging, pool do banco)
+            self._pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context('spawn'))
+        return self._pool
+
+    def request_thumbnail(self, digest):
+        """Agenda a geração da miniatura, se ainda não existir nem estiver em andamento."""
+        target = self.thumbnail_path(digest)
+        if os.path.exists(target):
+            return
+        source, _ = self.find_original(digest)
+        if source is None:
+            return
+        with self._lock:
+            if digest in self._pending:
+                return
+            width, height = self.thumbnail_size
+            future = self._executor().submit(_make_thumbnail, source, target, width, height)
+            self._pending[digest] = future
+        future.add_done_callback(lambda _: self._finish(digest))
+
+    def _finish(self, digest):
+        with self._lock:
+            future = self._pending.pop(digest, None)
+        if future is not None and future.exception() is not None:
+            self._logger.error("Erro ao gerar miniatura %s", digest, exc_info=future.exception())
+
+photo_storage = PhotoStorage()
\ No newline at end of file
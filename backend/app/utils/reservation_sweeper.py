@@ -0,0 +1,180 @@
+from app import db
+from app.models.reservation import Reservation
+from app.models.vehicle import Vehicle
+from app.utils.vehicle_events import VEHICLE_FIELDS, record_vehicle_change
+from app.utils.table_versions import record_table_change
+from datetime import datetime, timedelta
+import threading
+import time
+
+class ReservationSweeper:
+    """Expira reservas ativas mais antigas que RESERVATION_TTL_HOURS e libera os veículos.
+
+    Cada lote é uma transação curta com instruções sobre conjuntos de ids (sem carregar
+    objetos do ORM). A varredura roda pelo comando ``flask expire-reservations`` (cron) ou
+    por uma thread da aplicação a cada RESERVATION_SWEEP_INTERVAL_SECONDS (0 desativa).
+    Como as atualizações são condicionais, várias instâncias podem varrer ao mesmo tempo.
+    """
+
+    def __init__(self):
+        self.ttl = timedelta(hours=48)
+        self.batch_size = 500
+        self.interval = 0
+        self._lock = threading.Lock()
+        self._thread = None
+        self._stop = threading.Event()
+        self._stats = {
+            "runs": 0,
+            "expired_total": 0,
+            "released_total": 0,
+            "errors": 0,
+            "last_run_at": None,
+            "last_expired": 0,
+            "last_released": 0,
+            "last_batches": 0,
+            "last_duration_ms": 0.0,
+            "max_duration_ms": 0.0,
+            "last_error": None
+        }
+
+    def init_app(self, app):
+        self.ttl = timedelta(hours=app.config.get('RESERVATION_TTL_HOURS', 48))
+        self.batch_size = app.config.get('RESERVATION_SWEEP_BATCH_SIZE', 500)
+        self.interval = app.config.get('RESERVATION_SWEEP_INTERVAL_SECONDS', 0)
+        if self.interval > 0:
+            # A thread só começa com a primeira requisição: comandos como "flask db upgrade" não varrem
+            app.before_request(lambda: self.start(app))
+
+    def start(self, app):
+        """Inicia a thread de varredura periódica (uma vez por processo)."""
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, args=(app,), name='reservation-sweeper', daemon=True)
+                self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self, app):
+        while not self._stop.wait(self.interval):
+            with app.app_context():
+                try:
+                    self.sweep()
+                except Exception:
+                    app.logger.exception("Erro ao expirar reservas")
+                finally:
+                    db.session.remove()
+
+    def sweep(self, now=None, ttl=None, batch_size=None):
+        """Expira as reservas vencidas em lotes e retorna o resumo da varredura."""
+        cutoff = (now or datetime.utcnow()) - (self.ttl if ttl is None else ttl)
+        batch_size = batch_size or self.batch_size
+        expired = released = batches = 0
+        start = time.perf_counter()
+        try:
+            while True:
+                # Cada reserva lida sai do status 'active' (por esta varredura ou por outra operação),
+                # então a próxima consulta já começa depois dela
+                rows = db.session.execute(
+                    db.select(Reservation.id, Reservation.vehicle_id)
+                    .where(Reservation.status == 'active', Reservation.created_at < cutoff)
+                    .order_by(Reservation.created_at, Reservation.id)
+                    .limit(batch_size)
+                ).all()
+                if not rows:
+                    break
+                batch_expired, batch_released = self._expire_batch(rows)
+                db.session.commit()
+                expired += batch_expired
+                released += batch_released
+                batches += 1
+                if len(rows) < batch_size:
+                    break
+        except Exception as e:
+            db.session.rollback()
+            self._record(expired, released, batches, time.perf_counter() - start, error=str(e))
+            raise
+
+        duration = time.perf_counter() - start
+        self._record(expired, released, batches, duration)
+        return {
+            "expired": expired,
+            "released": released,
+            "batches": batches,
+            "duration_ms": round(duration * 1000, 2)
+        }
+
+    def _expire_batch(self, rows):
+        """Expira um lote de reservas e libera os veículos que ficaram sem reserva."""
+        session = db.session
+        reservation_ids = [row.id for row in rows]
+        vehicle_ids = {row.vehicle_id for row in rows}
+
+        # O status é conferido de novo: confirmações e cancelamentos concorrentes prevalecem
+        expired = session.execute(
+            db.update(Reservation)
+            .where(Reservation.id.in_(reservation_ids), Reservation.status == 'active')
+            .values(status='expired')
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        if not expired:
+            return 0, 0
+
+        # Veículos com outra reserva ativa ou com compra concluída continuam reservados
+        held = db.exists().where(
+            Reservation.vehicle_id == Vehicle.id,
+            Reservation.status.in_(('active', 'completed'))
+        )
+        vehicles = session.execute(
+            db.select(*(getattr(Vehicle, field) for field in VEHICLE_FIELDS))
+            .where(Vehicle.id.in_(vehicle_ids), Vehicle.is_reserved == True, ~held)
+            .with_for_update()
+        ).all()
+        if vehicles:
+            session.execute(
+                db.update(Vehicle)
+                .where(Vehicle.id.in_([vehicle.id for vehicle in vehicles]))
+                .values(is_reserved=False)
+                .execution_options(synchronize_session=False)
+            )
+            # UPDATE direto: avisa caches, snapshot e feed de eventos veículo a veículo
+            for vehicle in vehicles:
+                old = vehicle._asdict()
+                record_vehicle_change(session, 'updated', vehicle.id, old=old, new=dict(old, is_reserved=False))
+            record_table_change(session, Reservation.__tablename__, Vehicle.__tablename__)
+        else:
+            record_table_change(session, Reservation.__tablename__)
+        return expired, len(vehicles)
+
+    def _record(self, expired, released, batches, duration, error=None):
+        duration_ms = round(duration * 1000, 2)
+        with self._lock:
+            stats = self._stats
+            stats["runs"] += 1
+            stats["expired_total"] += expired
+            stats["released_total"] += released
+            stats["last_run_at"] = datetime.utcnow()
+            stats["last_expired"] = expired
+            stats["last_released"] = released
+            stats["last_batches"] = batches
+            stats["last_duration_ms"] = duration_ms
+            stats["max_duration_ms"] = max(stats["max_duration_ms"], duration_ms)
+            if error is not None:
+                stats["errors"] += 1
+                stats["last_error"] = error
+
+    def stats(self):
+        """Retorna os contadores das varreduras feitas neste processo."""
+        with self._lock:
+            stats = dict(self._stats)
+        stats.update({
+            "ttl_hours": self.ttl.total_seconds() / 3600,
+            "batch_size": self.batch_size,
+            "interval_seconds": self.interval,
+            "running": self._thread is not None and self._thread.is_alive()
+        })
+        return stats
+
+reservation_sweeper = ReservationSweeper()
\ No newline at end of file
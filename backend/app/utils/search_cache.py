@@ -0,0 +1,70 @@
+from app.utils.cache import LRUCache
+from app.utils.vehicle_events import on_vehicle_change
+import threading
+
+class SearchCache:
+    """Cache dos resultados da busca de veículos, versionado pelo catálogo.
+
+    A chave inclui a versão do catálogo, incrementada após cada commit que altera
+    um veículo; assim nenhuma resposta anterior à alteração volta a ser servida.
+    O corpo JSON já serializado é armazenado, e o tamanho em bytes limita o cache.
+    O cache e a versão são de cada processo: alterações feitas em outro processo
+    (outro worker ou um comando do Flask) só aparecem quando a entrada vence, ou
+    seja, após até SEARCH_CACHE_TTL segundos.
+    """
+
+    def __init__(self):
+        self._cache = LRUCache()
+        self._version = 0
+        self._version_lock = threading.Lock()
+        self.enabled = False
+
+    def init_app(self, app):
+        self.enabled = app.config.get('SEARCH_CACHE_ENABLED', True)
+        self._cache.configure(
+            max_bytes=app.config.get('SEARCH_CACHE_MAX_BYTES', 32 * 1024 * 1024),
+            ttl=app.config.get('SEARCH_CACHE_TTL', 30)
+        )
+
+    @property
+    def version(self):
+        return self._version
+
+    def bump_version(self):
+        """Invalida todas as respostas em cache."""
+        with self._version_lock:
+            self._version += 1
+        # Entradas de versões antigas nunca mais serão lidas; libera a memória logo
+        self._cache.clear()
+
+    @staticmethod
+    def make_key(args):
+        """Normaliza os parâmetros da busca (ordem e valores vazios não importam)."""
+        return tuple(sorted(
+            (name, tuple(value.strip() for value in args.getlist(name)))
+            for name in args
+            if any(value.strip() for value in args.getlist(name))
+        ))
+
+    def get(self, key):
+        if not self.enabled:
+            return None
+        return self._cache.get((self._version, key))
+
+    def set(self, key, body, version):
+        """Armazena o corpo da resposta se o catálogo não mudou durante a consulta."""
+        if not self.enabled or version != self._version:
+            return
+        self._cache.set((version, key), body, size=len(body))
+
+    def stats(self):
+        stats = self._cache.stats()
+        stats["enabled"] = self.enabled
+        stats["catalog_version"] = self._version
+        return stats
+
+search_cache = SearchCache()
+
+@on_vehicle_change
+def _bump_catalog_version(changes):
+    search_cache.bump_version()
\ No newline at end of file
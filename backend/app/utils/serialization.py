@@ -0,0 +1,129 @@
+from flask import current_app, request, has_app_context
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm.interfaces import MANYTOONE
+
+class SerializableMixin:
+    """Serialização com profundidade explícita, campos esparsos (?fields=) e expansão (?expand=).
+
+    ``serialize_fields()`` retorna os campos escalares (por padrão, todas as colunas
+    mapeadas; modelos com campos sensíveis ou derivados a sobrescrevem),
+    ``serialize_relations`` (nome no JSON -> atributo do relacionamento) e
+    ``default_expand``, os relacionamentos embutidos quando nada é pedido.
+    Objetos aninhados são sempre rasos, a menos que a expansão peça o caminho
+    completo (ex.: ``purchase.vehicle``), o que evita ciclos como Review <-> Purchase.
+    """
+
+    serialize_relations = {}
+    default_expand = ()
+
+    def serialize_fields(self):
+        """Retorna as colunas mapeadas do modelo com os valores atuais."""
+        return {attribute.key: getattr(self, attribute.key) for attribute in self.__mapper__.column_attrs}
+
+    def to_dict(self, fields=None, expand=None, depth=None):
+        """Converte o modelo para um dicionário.
+
+        ``fields`` e ``expand`` são árvores geradas por ``parse_paths``; ``None``
+        em ``expand`` usa os relacionamentos padrão do modelo.
+        """
+        if depth is None:
+            depth = _max_depth()
+
+        data = self.serialize_fields()
+        if fields:
+            data = {key: value for key, value in data.items() if key in fields}
+        if depth <= 0:
+            return data
+
+        for name, attribute, nested_expand in _expanded_relations(type(self), fields, expand):
+            related = getattr(self, attribute)
+            nested_fields = fields.get(name) if fields else None
+            data[name] = related.to_dict(
+                fields=nested_fields or None,
+                expand=nested_expand,
+                depth=depth - 1
+            ) if related is not None else None
+        return data
+
+def _expanded_relations(model, fields, expand):
+    """Relacionamentos que serão serializados: (nome, atributo, expansão aninhada)."""
+    if expand is None:
+        expand = {name: {} for name in model.default_expand}
+    if fields:
+        # Pedir um relacionamento em ?fields= implica expandi-lo
+        expand = dict(expand)
+        for name in fields:
+            if name in model.serialize_relations:
+                expand.setdefault(name, {})
+
+    for name, nested_expand in expand.items():
+        attribute = model.serialize_relations.get(name)
+        if attribute is None or (fields and name not in fields):
+            continue
+        yield name, attribute, nested_expand
+
+def eager_options(model, fields=None, expand=None, depth=None, _parent=None):
+    """Plano de carregamento que cobre exatamente o que ``to_dict`` vai serializar.
+
+    Relacionamentos muitos-para-um usam joinedload (mesma consulta); os demais
+    usam selectinload (uma consulta por relacionamento, independente do número de linhas).
+    """
+    if depth is None:
+        depth = _max_depth()
+    if depth <= 0:
+        return []
+
+    options = []
+    for name, attribute, nested_expand in _expanded_relations(model, fields, expand):
+        relationship = getattr(model, attribute)
+        many_to_one = relationship.property.direction is MANYTOONE
+        if _parent is None:
+            option = joinedload(relationship) if many_to_one else selectinload(relationship)
+        else:
+            option = _parent.joinedload(relationship) if many_to_one else _parent.selectinload(relationship)
+
+        nested_fields = fields.get(name) if fields else None
+        nested = eager_options(
+            relationship.property.mapper.class_,
+            nested_fields or None,
+            nested_expand,
+            depth - 1,
+            option
+        )
+        options.extend(nested or [option])
+    return options
+
+def _max_depth():
+    if has_app_context():
+        return current_app.config.get('SERIALIZE_MAX_DEPTH', 3)
+    return 3
+
+def parse_paths(value, max_depth=None):
+    """Converte "a,b.c,b.d" em {'a': {}, 'b': {'c': {}, 'd': {}}}; lança ValueError se inválido."""
+    tree = {}
+    if not value:
+        return tree
+    max_depth = max_depth if max_depth is not None else _max_depth()
+    for path in value.split(','):
+        path = path.strip()
+        if not path:
+            continue
+        parts = path.split('.')
+        if not all(parts):
+            raise ValueError(f"Caminho inválido: '{path}'.")
+        if len(parts) > max_depth + 1:
+            raise ValueError(f"O caminho '{path}' excede a profundidade máxima ({max_depth}).")
+        node = tree
+        for part in parts:
+            node = node.setdefault(part, {})
+    return tree
+
+def read_serialization_params():
+    """Lê ?fields= e ?expand= da requisição, prontos para passar a ``to_dict``."""
+    fields = parse_paths(request.args.get('fields'))
+    expand = request.args.get('expand')
+    return {
+        'fields': fields or None,
+        # ?expand= vazio desliga os relacionamentos padrão
+        'expand': parse_paths(expand) if expand is not None else None
+    }
\ No newline at end of file
@@ -0,0 +1,217 @@
+from flask import current_app
+from app import db
+from app.models.vehicle import Vehicle
+from app.utils.vehicle_events import on_vehicle_change
+from collections import defaultdict
+import threading
+import time
+import unicodedata
+
+SUGGEST_FIELDS = ('marca', 'modelo')
+
+# Pontuação das correspondências por prefixo, acima de qualquer similaridade de trigramas
+PREFIX_SCORE = 2.0
+
+def normalize_term(text):
+    """Remove acentos, ignora maiúsculas e espaços repetidos ("Citroën " -> "citroen")."""
+    decomposed = unicodedata.normalize('NFKD', text or '')
+    stripped = ''.join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return ' '.join(stripped.casefold().split())
+
+def _trigrams(term):
+    padded = f"  {term} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+class _TrieNode:
+    __slots__ = ('children', 'keys')
+
+    def __init__(self):
+        self.children = {}
+        self.keys = set()
+
+class SuggestIndex:
+    """Índice em memória dos valores distintos de marca/modelo.
+
+    Combina uma trie de prefixos (cada palavra do valor é indexada, então "plus"
+    encontra "Onix Plus") com um índice de trigramas para tolerar pequenos erros
+    de digitação. As entradas têm contagem de referência, o que permite aplicar
+    inserções, alterações e exclusões de veículos de forma incremental.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._clear()
+        self.built_at = None
+
+    def _clear(self):
+        self._root = _TrieNode()
+        self._entries = {}
+        self._trigrams = defaultdict(set)
+
+    def build(self, rows):
+        """Recria o índice a partir de tuplas (marca, modelo, quantidade)."""
+        with self._lock:
+            self._clear()
+            for marca, modelo, count in rows:
+                self._add(marca, modelo, count)
+            self.built_at = time.monotonic()
+
+    def _add(self, marca, modelo, count=1):
+        for field, value in (('marca', marca), ('modelo', modelo)):
+            key = (field, value)
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry['count'] += count
+                continue
+            term = normalize_term(value)
+            if not term:
+                continue
+            self._entries[key] = {'value': value, 'field': field, 'term': term, 'count': count}
+            for word in self._word_suffixes(term):
+                self._trie_insert(word, key)
+            for gram in _trigrams(term):
+                self._trigrams[gram].add(key)
+
+    def _remove(self, marca, modelo):
+        for field, value in (('marca', marca), ('modelo', modelo)):
+            key = (field, value)
+            entry = self._entries.get(key)
+            if entry is None:
+                continue
+            entry['count'] -= 1
+            if entry['count'] > 0:
+                continue
+            del self._entries[key]
+            for word in self._word_suffixes(entry['term']):
+                self._trie_discard(word, key)
+            for gram in _trigrams(entry['term']):
+                keys = self._trigrams.get(gram)
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del self._trigrams[gram]
+
+    @staticmethod
+    def _word_suffixes(term):
+        words = term.split(' ')
+        return [' '.join(words[i:]) for i in range(len(words))]
+
+    def _trie_insert(self, word, key):
+        node = self._root
+        for ch in word:
+            node = node.children.setdefault(ch, _TrieNode())
+        node.keys.add(key)
+
+    def _trie_discard(self, word, key):
+        path = [self._root]
+        for ch in word:
+            node = path[-1].children.get(ch)
+            if node is None:
+                return
+            path.append(node)
+        path[-1].keys.discard(key)
+        # Remove os nós que ficaram vazios
+        for depth in range(len(word), 0, -1):
+            node = path[depth]
+            if node.keys or node.children:
+                break
+            del path[depth - 1].children[word[depth - 1]]
+
+    def apply(self, changes):
+        """Aplica alterações de veículos (VehicleChange) ao índice."""
+        with self._lock:
+            if self.built_at is None:
+                return
+            if any(change.action == 'bulk' for change in changes):
+                # Reconstrói na próxima consulta
+                self.built_at = None
+                return
+            for change in changes:
+                if change.old and change.new and all(
+                    change.old[field] == change.new[field] for field in SUGGEST_FIELDS
+                ):
+                    continue
+                if change.old:
+                    self._remove(change.old['marca'], change.old['modelo'])
+                if change.new:
+                    self._add(change.new['marca'], change.new['modelo'])
+
+    def _prefix_keys(self, prefix, limit):
+        node = self._root
+        for ch in prefix:
+            node = node.children.get(ch)
+            if node is None:
+                return set()
+        found = set()
+        stack = [node]
+        while stack and len(found) < limit:
+            current = stack.pop()
+            found.update(current.keys)
+            stack.extend(current.children.values())
+        return found
+
+    def suggest(self, query, limit=10, field=None, min_similarity=0.3):
+        """Retorna sugestões por prefixo e, para completar, por similaridade de trigramas."""
+        term = normalize_term(query)
+        if not term:
+            return []
+
+        with self._lock:
+            # Percorre mais nós que o necessário para conseguir ordenar por popularidade
+            prefix_keys = self._prefix_keys(term, limit * 20)
+            results = [
+                (PREFIX_SCORE, self._entries[key]) for key in prefix_keys
+                if field is None or key[0] == field
+            ]
+
+            if len(results) < limit and len(term) >= 3:
+                query_grams = _trigrams(term)
+                shared = defaultdict(int)
+                for gram in query_grams:
+                    for key in self._trigrams.get(gram, ()):
+                        if key not in prefix_keys and (field is None or key[0] == field):
+                            shared[key] += 1
+                for key, hits in shared.items():
+                    entry = self._entries[key]
+                    # Coeficiente de Dice entre os conjuntos de trigramas
+                    score = 2.0 * hits / (len(query_grams) + len(_trigrams(entry['term'])))
+                    if score >= min_similarity:
+                        results.append((score, entry))
+
+            results.sort(key=lambda item: (-item[0], -item[1]['count'], item[1]['value']))
+            return [
+                {
+                    'value': entry['value'],
+                    'field': entry['field'],
+                    'count': entry['count'],
+                    'match': 'prefix' if score == PREFIX_SCORE else 'fuzzy'
+                }
+                for score, entry in results[:limit]
+            ]
+
+suggest_index = SuggestIndex()
+
+def _ensure_built():
+    """Constrói o índice na primeira consulta e o recria periodicamente.
+
+    A recriação periódica cobre alterações feitas por outros processos, já que
+    os eventos de commit só chegam ao processo que fez a alteração.
+    """
+    refresh_seconds = current_app.config.get('SUGGEST_REFRESH_SECONDS', 300)
+    built_at = suggest_index.built_at
+    if built_at is not None and time.monotonic() - built_at < refresh_seconds:
+        return
+    rows = db.session.query(
+        Vehicle.marca, Vehicle.modelo, db.func.count(Vehicle.id)
+    ).group_by(Vehicle.marca, Vehicle.modelo).all()
+    suggest_index.build(rows)
+
+def get_suggestions(query, limit=10, field=None):
+    """Consulta o índice de sugestões, construindo-o se necessário."""
+    _ensure_built()
+    min_similarity = current_app.config.get('SUGGEST_MIN_SIMILARITY', 0.3)
+    return suggest_index.suggest(query, limit=limit, field=field, min_similarity=min_similarity)
+
+@on_vehicle_change
+def _update_suggest_index(changes):
+    suggest_index.apply(changes)
\ No newline at end of file
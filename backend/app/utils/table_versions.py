@@ -0,0 +1,85 @@
+from sqlalchemy import event
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from app import db
+from app.models.table_version import TableVersion
+from datetime import datetime
+
+def _changed_tables(session):
+    return session.info.setdefault('changed_tables', set())
+
+def record_table_change(session, *tables):
+    """Marca tabelas como alteradas por comandos fora do ORM (ex.: UPDATE em lote)."""
+    _changed_tables(session).update(tables)
+
+def _bump(connection, tables):
+    """Incrementa a versão das tabelas na própria transação da alteração.
+
+    Usa a conexão que a sessão já tem: o commit não precisa de uma segunda conexão do
+    pool (com pool_size=1 isso travava até o timeout) e dados e ETag mudam juntos.
+    As linhas de versão são as últimas travadas na transação, sempre na mesma ordem,
+    então dois escritores nunca esperam um pelo outro em ordem inversa.
+    """
+    table = TableVersion.__table__
+    now = datetime.utcnow()
+
+    def update():
+        return [
+            name for name in sorted(tables)
+            if connection.execute(
+                table.update()
+                .where(table.c.name == name)
+                .values(version=table.c.version + 1, updated_at=now)
+            ).rowcount == 0
+        ]
+
+    missing = update()
+    if not missing:
+        return
+    # As linhas vêm da migração 0003; só faltam em bancos criados com db.create_all()
+    try:
+        with connection.begin_nested():
+            connection.execute(table.insert(), [
+                {'name': name, 'version': 1, 'updated_at': now} for name in missing
+            ])
+    except IntegrityError:
+        # Outro processo criou a linha ao mesmo tempo: basta incrementá-la
+        update()
+
+@event.listens_for(Session, 'after_flush')
+def _collect_flushed_tables(session, flush_context):
+    tables = set()
+    for obj in session.new:
+        tables.add(obj.__table__.name)
+    for obj in session.deleted:
+        tables.add(obj.__table__.name)
+    for obj in session.dirty:
+        if session.is_modified(obj, include_collections=False):
+            tables.add(obj.__table__.name)
+    tables.discard(TableVersion.__tablename__)
+    if tables:
+        _changed_tables(session).update(tables)
+
+@event.listens_for(Session, 'before_commit')
+def _bump_changed_tables(session):
+    if session.in_nested_transaction():
+        # Só o commit da transação externa grava; o savepoint mantém as tabelas pendentes
+        return
+    # before_commit roda antes do flush final: as tabelas alteradas só são conhecidas depois dele
+    session.flush()
+    tables = session.info.pop('changed_tables', None)
+    if tables:
+        _bump(session.connection(), tables)
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_changed_tables(session):
+    session.info.pop('changed_tables', None)
+
+def get_table_versions(tables):
+    """Retorna {tabela: (versão, updated_at)} com uma única consulta pela chave primária."""
+    rows = db.session.query(
+        TableVersion.name, TableVersion.version, TableVersion.updated_at
+    ).filter(TableVersion.name.in_(tables)).all()
+    versions = {name: (0, None) for name in tables}
+    versions.update({name: (version, updated_at) for name, version, updated_at in rows})
+    return versions
\ No newline at end of file
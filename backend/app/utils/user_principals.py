@@ -0,0 +1,129 @@
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from flask_login import UserMixin
+from app import db
+from app.utils.cache import LRUCache
+import threading
+
+# app.models.user importa app.utils (serialização); o modelo é importado nas funções para evitar o ciclo
+
+class UserPrincipal(UserMixin):
+    """Cópia leve do usuário autenticado, servida pelo user_loader sem consultar o banco."""
+
+    __slots__ = ('id', 'username', 'email', 'created_at')
+
+    def __init__(self, user):
+        self.id = user.id
+        self.username = user.username
+        self.email = user.email
+        self.created_at = user.created_at
+
+    def get_id(self):
+        from app.models.user import USER_ID_PREFIX
+        return f'{USER_ID_PREFIX}{self.id}'
+
+    def to_dict(self):
+        """Converte o usuário para um dicionário (mesmos campos de User.to_dict)."""
+        return {
+            'id': self.id,
+            'username': self.username,
+            'email': self.email,
+            'created_at': self.created_at
+        }
+
+    def __repr__(self):
+        return f'<UserPrincipal {self.username}>'
+
+class UserPrincipalCache:
+    """Cache LRU com TTL dos usuários autenticados, indexado pelo id do usuário.
+
+    Preenchido no login e invalidado após o commit de qualquer alteração em User.
+    Entre processos a invalidação não se propaga: USER_CACHE_TTL limita o atraso.
+    """
+
+    def __init__(self):
+        self._cache = LRUCache()
+        self._generation = 0
+        self._generation_lock = threading.Lock()
+        self.enabled = False
+
+    def init_app(self, app):
+        self.enabled = app.config.get('USER_CACHE_ENABLED', True)
+        self._cache.configure(
+            max_entries=app.config.get('USER_CACHE_MAX_ENTRIES', 10000),
+            ttl=app.config.get('USER_CACHE_TTL', 300)
+        )
+
+    @staticmethod
+    def parse_id(principal_id):
+        """Extrai o id do usuário de 'user:<id>' (ou do id numérico das sessões antigas)."""
+        from app.models.user import USER_ID_PREFIX
+        if principal_id.startswith(USER_ID_PREFIX):
+            principal_id = principal_id[len(USER_ID_PREFIX):]
+        try:
+            return int(principal_id)
+        except ValueError:
+            return None
+
+    def load(self, principal_id):
+        """Retorna o UserPrincipal da sessão, consultando o banco apenas na primeira vez."""
+        user_id = self.parse_id(principal_id)
+        if user_id is None:
+            return None
+        principal = self._cache.get(user_id) if self.enabled else None
+        if principal is not None:
+            return principal
+        from app.models.user import User
+        generation = self._generation
+        user = db.session.get(User, user_id)
+        if user is None:
+            return None
+        principal = UserPrincipal(user)
+        self._store(principal, generation)
+        return principal
+
+    def remember(self, user):
+        """Guarda o usuário recém-autenticado para as próximas requisições."""
+        self._store(UserPrincipal(user), self._generation)
+
+    def _store(self, principal, generation):
+        # Só guarda se nenhum usuário foi alterado desde a leitura: a cópia poderia estar desatualizada
+        if not self.enabled:
+            return
+        with self._generation_lock:
+            if generation == self._generation:
+                self._cache.set(principal.id, principal)
+
+    def invalidate(self, *user_ids):
+        """Descarta os usuários informados; a próxima requisição relê do banco."""
+        with self._generation_lock:
+            self._generation += 1
+            for user_id in user_ids:
+                self._cache.pop(user_id)
+
+    def stats(self):
+        stats = self._cache.stats()
+        stats["enabled"] = self.enabled
+        return stats
+
+user_principals = UserPrincipalCache()
+
+@event.listens_for(Session, 'after_flush')
+def _collect_changed_users(session, flush_context):
+    from app.models.user import User
+    changed = {
+        obj.id for obj in (*session.new, *session.dirty, *session.deleted)
+        if isinstance(obj, User)
+    }
+    if changed:
+        session.info.setdefault('changed_users', set()).update(changed)
+
+@event.listens_for(Session, 'after_commit')
+def _invalidate_changed_users(session):
+    changed = session.info.pop('changed_users', None)
+    if changed:
+        user_principals.invalidate(*changed)
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_changed_users(session):
+    session.info.pop('changed_users', None)
\ No newline at end of file
@@ -0,0 +1,74 @@
+from flask import current_app
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+from collections import namedtuple
+from app.models.vehicle import Vehicle
+
+# Alteração de um veículo confirmada no banco: action é 'created', 'updated' ou 'deleted';
+# old e new são dicionários com as colunas antes e depois (None quando não se aplica).
+# A action 'bulk' (sem vehicle_id) indica um conjunto desconhecido de veículos alterado
+# por comandos em lote; quem mantém cópias do catálogo deve reconstruí-las.
+VehicleChange = namedtuple('VehicleChange', ['action', 'vehicle_id', 'old', 'new'])
+
+VEHICLE_FIELDS = ('id', 'marca', 'modelo', 'ano', 'preco', 'is_reserved', 'photo_url', 'created_at')
+
+_listeners = []
+
+def on_vehicle_change(listener):
+    """Registra uma função chamada com a lista de VehicleChange após cada commit."""
+    _listeners.append(listener)
+    return listener
+
+def record_vehicle_change(session, action, vehicle_id, old=None, new=None):
+    """Registra manualmente uma alteração feita fora do ORM (ex.: UPDATE em lote)."""
+    session.info.setdefault('vehicle_changes', []).append(
+        VehicleChange(action, vehicle_id, old, new)
+    )
+
+def record_vehicle_update(session, vehicle, **values):
+    """Registra um UPDATE direto (fora do ORM) sobre um veículo já carregado na sessão."""
+    old = _snapshot(vehicle)
+    record_vehicle_change(session, 'updated', vehicle.id, old=old, new=dict(old, **values))
+
+def _snapshot(vehicle):
+    return {field: getattr(vehicle, field) for field in VEHICLE_FIELDS}
+
+def _previous_snapshot(vehicle):
+    state = inspect(vehicle)
+    previous = {}
+    for field in VEHICLE_FIELDS:
+        history = state.attrs[field].history
+        if history.deleted:
+            previous[field] = history.deleted[0]
+        elif history.unchanged:
+            previous[field] = history.unchanged[0]
+        else:
+            previous[field] = getattr(vehicle, field)
+    return previous
+
+@event.listens_for(Session, 'after_flush')
+def _collect_vehicle_changes(session, flush_context):
+    for obj in session.new:
+        if isinstance(obj, Vehicle):
+            record_vehicle_change(session, 'created', obj.id, new=_snapshot(obj))
+    for obj in session.dirty:
+        if isinstance(obj, Vehicle) and session.is_modified(obj, include_collections=False):
+            record_vehicle_change(session, 'updated', obj.id, old=_previous_snapshot(obj), new=_snapshot(obj))
+    for obj in session.deleted:
+        if isinstance(obj, Vehicle):
+            record_vehicle_change(session, 'deleted', obj.id, old=_previous_snapshot(obj))
+
+@event.listens_for(Session, 'after_commit')
+def _dispatch_vehicle_changes(session):
+    changes = session.info.pop('vehicle_changes', None)
+    if not changes:
+        return
+    for listener in _listeners:
+        try:
+            listener(changes)
+        except Exception:
+            current_app.logger.exception("Erro ao processar alteração de veículos")
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_vehicle_changes(session):
+    session.info.pop('vehicle_changes', None)
\ No newline at end of file
@@ -0,0 +1,131 @@
+from app import db
+from app.models.vehicle import Vehicle
+from app.utils.vehicle_events import record_vehicle_change
+from app.utils.table_versions import record_table_change
+import codecs
+import csv
+import json
+
+IMPORT_FIELDS = ('marca', 'modelo', 'ano', 'preco', 'photo_url')
+REQUIRED_FIELDS = ('marca', 'modelo', 'ano', 'preco')
+
+def _read_lines(stream, chunk_size=64 * 1024):
+    """Lê o corpo da requisição em blocos e devolve as linhas decodificadas, sem carregar tudo na memória."""
+    decoder = codecs.getincrementaldecoder('utf-8-sig')()
+    pending = ''
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        pending += decoder.decode(chunk)
+        lines = pending.split('\n')
+        pending = lines.pop()
+        for line in lines:
+            yield line.rstrip('\r')
+    pending += decoder.decode(b'', final=True)
+    if pending:
+        yield pending.rstrip('\r')
+
+def _coerce_csv_row(row):
+    """Converte os campos textuais do CSV nos tipos esperados pela validação."""
+    data = {
+        key.strip(): value.strip()
+        for key, value in row.items()
+        if key and key.strip() in IMPORT_FIELDS and value is not None and value.strip() != ''
+    }
+    if 'ano' in data:
+        try:
+            data['ano'] = int(data['ano'])
+        except ValueError:
+            pass
+    if 'preco' in data:
+        try:
+            data['preco'] = float(data['preco'])
+        except ValueError:
+            pass
+    return data
+
+def iter_csv_rows(stream):
+    """Gera (número da linha, dados) para cada linha do CSV; a primeira linha é o cabeçalho."""
+    reader = csv.DictReader(_read_lines(stream))
+    for row in reader:
+        yield reader.line_num, _coerce_csv_row(row)
+
+def iter_ndjson_rows(stream):
+    """Gera (número da linha, dados) para cada objeto JSON do NDJSON; erros de parse viram ValueError."""
+    for line_number, line in enumerate(_read_lines(stream), start=1):
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+        except ValueError:
+            yield line_number, ValueError("JSON inválido.")
+            continue
+        if not isinstance(data, dict):
+            yield line_number, ValueError("Cada linha deve ser um objeto JSON.")
+            continue
+        yield line_number, {key: value for key, value in data.items() if key in IMPORT_FIELDS}
+
+def import_vehicles(rows, validate, batch_size, max_errors):
+    """Valida e insere veículos em lotes de INSERT multi-linha, com um commit por lote.
+
+    Se o banco recusa um lote, ele é dividido ao meio e reenviado até isolar as linhas
+    recusadas; só elas entram no relatório de erros, as demais são inseridas.
+    Retorna um resumo com inseridos, falhas e os erros por linha (limitados a max_errors).
+    """
+    summary = {"inserted": 0, "failed": 0, "batches": 0, "errors": [], "errors_truncated": False}
+    batch = []
+
+    def add_error(line, message):
+        summary["failed"] += 1
+        if len(summary["errors"]) < max_errors:
+            summary["errors"].append({"line": line, "error": message})
+        else:
+            summary["errors_truncated"] = True
+
+    def insert(rows):
+        try:
+            db.session.execute(db.insert(Vehicle), [values for _, values in rows])
+            record_table_change(db.session, Vehicle.__tablename__)
+            record_vehicle_change(db.session, 'bulk', None)
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            if len(rows) == 1:
+                add_error(rows[0][0], f"Falha ao inserir a linha: {getattr(e, 'orig', None) or e}")
+                return
+            middle = len(rows) // 2
+            insert(rows[:middle])
+            insert(rows[middle:])
+            return
+        summary["inserted"] += len(rows)
+        summary["batches"] += 1
+
+    def flush():
+        if batch:
+            insert(list(batch))
+            batch.clear()
+
+    for line, data in rows:
+        if isinstance(data, Exception):
+            add_error(line, str(data))
+            continue
+        if not all(field in data for field in REQUIRED_FIELDS):
+            add_error(line, "Marca, modelo, ano e preço são obrigatórios.")
+            continue
+        error = validate(data)
+        if error:
+            add_error(line, error)
+            continue
+        batch.append((line, {
+            'marca': data['marca'],
+            'modelo': data['modelo'],
+            'ano': data['ano'],
+            'preco': data['preco'],
+            'photo_url': data.get('photo_url'),
+            'is_reserved': False
+        }))
+        if len(batch) >= batch_size:
+            flush()
+    flush()
+    return summary
\ No newline at end of file
@@ -0,0 +1,103 @@
+"""Compara as alterações de administrador com o log de auditoria gravado na requisição e em lote.
+
+Com AUDIT_LOG_ASYNC=false cada PUT /api/admin/vehicles/<id> faz dois commits (a alteração
+e o log); com o escritor em lote, só a alteração é gravada na requisição. O script
+informa a latência p50/p95 e os commits por requisição de cada modo e, ao final, falha
+(código 1) se algum log enfileirado não chegar ao banco ou se os logins seguidos não
+forem agrupados (um UPDATE de last_login por lote, não por login).
+
+Uso (no diretório backend):
+    python -m benchmarks.bench_admin_audit_log --requests 500
+"""
+import argparse
+import sys
+import time
+
+from sqlalchemy import event
+
+from benchmarks.common import create_benchmark_app, seed_vehicles, percentile
+
+PASSWORD = 'bench-password'
+
+def seed(count):
+    """Cria um super administrador e ``count`` veículos disponíveis."""
+    from app import db
+    from app.models import Admin, Vehicle
+    from werkzeug.security import generate_password_hash
+
+    seed_vehicles(count)
+    db.session.execute(db.update(Vehicle).values(is_reserved=False))
+    db.session.add(Admin(
+        username='bench-admin', email='admin@example.com', is_super_admin=True,
+        password_hash=generate_password_hash(PASSWORD)
+    ))
+    db.session.commit()
+    return list(db.session.scalars(db.select(Vehicle.id).order_by(Vehicle.id)))
+
+def login(client):
+    response = client.post('/api/admin/login', json={'email': 'admin@example.com', 'password': PASSWORD})
+    assert response.status_code == 200, response.get_json()
+    return {'Authorization': f"Bearer {response.get_json()['token']}"}
+
+def run_mode(name, requests, asynchronous):
+    from app import db
+    from app.models import AdminLog
+    from app.utils.audit_log import audit_log
+
+    app = create_benchmark_app(
+        AUDIT_LOG_ASYNC=asynchronous, PASSWORD_HASH_WORKERS=0, RESERVATION_SWEEP_INTERVAL_SECONDS=0
+    )
+    with app.app_context():
+        vehicle_ids = seed(requests)
+        engine = db.engine
+
+    client = app.test_client()
+    headers = login(client)
+    # Conta só os commits que gravaram dados de negócio (o incremento de table_version vai no mesmo commit)
+    commits = []
+
+    def note_write(connection, cursor, statement, *args):
+        if statement.lstrip().split(None, 1)[0].upper() in ('INSERT', 'UPDATE', 'DELETE') and 'table_version' not in statement:
+            connection.info['wrote'] = True
+
+    event.listen(engine, 'before_cursor_execute', note_write)
+    event.listen(engine, 'commit', lambda connection: connection.info.pop('wrote', False) and commits.append(1))
+    latencies, counts = [], []
+    for index, vehicle_id in enumerate(vehicle_ids):
+        del commits[:]
+        start = time.perf_counter()
+        response = client.put(f'/api/admin/vehicles/{vehicle_id}', json={'preco': 20000 + index}, headers=headers)
+        latencies.append(time.perf_counter() - start)
+        assert response.status_code == 200, response.get_json()
+        counts.append(len(commits))
+
+    # Vários logins seguidos: o last_login vira um UPDATE por lote, não um por login
+    audit_log.flush()
+    updates_before = audit_log.stats()['last_login_updates']
+    for _ in range(10):
+        login(client)
+    audit_log.flush()
+    last_login_updates = audit_log.stats()['last_login_updates'] - updates_before
+
+    with app.app_context():
+        logs = db.session.scalar(db.select(db.func.count(AdminLog.id)).where(AdminLog.action == 'UPDATE_VEHICLE'))
+
+    print(f"{name:>12}: p50 {percentile(latencies, 0.5) * 1000:.2f} ms   "
+          f"p95 {percentile(latencies, 0.95) * 1000:.2f} ms   commits por requisição: {percentile(counts, 0.5)}   "
+          f"logs gravados: {logs}/{requests}   UPDATEs de last_login em 10 logins: {last_login_updates}")
+    return percentile(latencies, 0.5), logs == requests, last_login_updates
+
+def run(requests):
+    p50_sync, sync_ok, _ = run_mode('na requisição', requests, False)
+    p50_async, async_ok, last_login_updates = run_mode('em lote', requests, True)
+    print(f"economia no p50: {(1 - p50_async / p50_sync) * 100:.0f}%")
+    if not (sync_ok and async_ok) or last_login_updates >= 10:
+        print("FALHA: logs perdidos ou last_login não agrupado")
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--requests', type=int, default=500)
+    args = parser.parse_args()
+    sys.exit(run(args.requests))
\ No newline at end of file
@@ -0,0 +1,66 @@
+"""Compara a busca de veículos pelo SQL e pelo snapshot NumPy do catálogo.
+
+Uso (no diretório backend):
+    python -m benchmarks.bench_catalog_snapshot --sizes 10000,100000,1000000
+
+Por padrão usa um SQLite temporário; defina BENCH_DATABASE_URL para medir no MySQL.
+"""
+import argparse
+import time
+
+from benchmarks.common import create_benchmark_app, seed_vehicles, percentile
+
+SCENARIOS = [
+    ("disponíveis de 2015 por preço", "is_reserved=1&ano=2015&sort=preco"),
+    ("faixa de preço, mais recentes", "preco_min=50000&preco_max=80000&sort=created_at&order=desc"),
+    ("marca parcial + preço mínimo", "marca=volks&preco_min=200000&sort=ano"),
+    ("catálogo inteiro com total", "sort=preco&total=exact"),
+]
+
+def _time(app, path, repeat):
+    from app.controllers.vehicle_controller import VehicleController
+    samples = []
+    for _ in range(repeat):
+        with app.test_request_context(path):
+            start = time.perf_counter()
+            payload, status = VehicleController._run_search()
+            samples.append(time.perf_counter() - start)
+            assert status == 200, payload
+    return samples
+
+def run(sizes, repeat):
+    from app import db
+    from app.utils.catalog_snapshot import catalog_snapshot, ensure_snapshot_built
+
+    for size in sizes:
+        app = create_benchmark_app(SEARCH_CACHE_ENABLED=False)
+        with app.app_context():
+            start = time.perf_counter()
+            seed_vehicles(size)
+            print(f"\n== {size} veículos (carga em {time.perf_counter() - start:.1f}s) ==")
+
+            catalog_snapshot.built_at = None
+            catalog_snapshot.enabled = True
+            start = time.perf_counter()
+            ensure_snapshot_built()
+            print(f"snapshot construído em {time.perf_counter() - start:.2f}s")
+
+            print(f"{'cenário':38} {'SQL p50':>10} {'NumPy p50':>10} {'ganho':>7}")
+            for name, query in SCENARIOS:
+                path = f"/api/vehicles?{query}&limit=50"
+                catalog_snapshot.enabled = False
+                sql = percentile(_time(app, path, repeat), 0.5)
+                catalog_snapshot.enabled = True
+                numpy = percentile(_time(app, path, repeat), 0.5)
+                print(f"{name:38} {sql * 1000:9.2f}ms {numpy * 1000:9.2f}ms {sql / numpy:6.1f}x")
+            db.session.remove()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', default='10000,100000,1000000')
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+    run([int(size) for size in args.sizes.split(',')], args.repeat)
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -0,0 +1,83 @@
+"""Compara a finalização da compra em duas chamadas com o checkout em uma só.
+
+Fluxo antigo: PATCH /api/reservations/<id>/confirm seguido de
+POST /api/users/from-reservation/<id>. Fluxo novo: POST /api/reservations/<id>/checkout.
+Os dois fluxos são alternados sobre reservas ativas equivalentes; o script informa
+a latência p50/p95 de cada um e quantas instruções SQL cada compra emitiu.
+
+Uso (no diretório backend):
+    python -m benchmarks.bench_checkout --purchases 500
+"""
+import argparse
+import time
+
+from sqlalchemy import event
+
+from benchmarks.common import create_benchmark_app, seed_vehicles, seed_users, percentile
+
+PASSWORD = 'bench-password'
+
+def seed(count):
+    """Cria um comprador e ``count`` veículos, cada um com uma reserva ativa."""
+    from app import db
+    from app.models import User, Vehicle, Reservation
+
+    seed_users(1, 'buyer', PASSWORD)
+    seed_vehicles(count)
+    user_id = User.query.first().id
+    db.session.execute(db.update(Vehicle).values(is_reserved=True))
+    db.session.execute(db.insert(Reservation), [
+        {'user_id': user_id, 'vehicle_id': vehicle_id, 'amount': 1000, 'status': 'active'}
+        for vehicle_id in db.session.scalars(db.select(Vehicle.id).order_by(Vehicle.id))
+    ])
+    db.session.commit()
+    return list(db.session.scalars(db.select(Reservation.id).order_by(Reservation.id)))
+
+def two_calls(client, reservation_id):
+    response = client.patch(f'/api/reservations/{reservation_id}/confirm')
+    assert response.status_code == 200, response.get_json()
+    response = client.post(f'/api/users/from-reservation/{reservation_id}')
+    assert response.status_code == 201, response.get_json()
+
+def one_call(client, reservation_id):
+    response = client.post(f'/api/reservations/{reservation_id}/checkout')
+    assert response.status_code == 201, response.get_json()
+
+def run(purchases):
+    from app import db
+
+    app = create_benchmark_app(SESSION_COOKIE_SECURE=False, RESERVATION_SWEEP_INTERVAL_SECONDS=0)
+    with app.app_context():
+        reservation_ids = seed(purchases * 2)
+        engine = db.engine
+
+    client = app.test_client()
+    response = client.post('/api/users/login', json={'email': 'buyer0@example.com', 'password': PASSWORD})
+    assert response.status_code == 200, response.get_json()
+
+    statements = []
+    event.listen(engine, 'before_cursor_execute', lambda *args: statements.append(args[2]))
+    flows = {'duas chamadas': (two_calls, [], []), 'checkout': (one_call, [], [])}
+    for index, reservation_id in enumerate(reservation_ids):
+        name = 'duas chamadas' if index % 2 == 0 else 'checkout'
+        flow, latencies, counts = flows[name]
+        del statements[:]
+        start = time.perf_counter()
+        flow(client, reservation_id)
+        latencies.append(time.perf_counter() - start)
+        counts.append(len(statements))
+
+    print(f"{purchases} compras por fluxo ({engine.dialect.name})")
+    p50 = {}
+    for name, (_, latencies, counts) in flows.items():
+        p50[name] = percentile(latencies, 0.5)
+        print(f"{name:>14}: p50 {p50[name] * 1000:.2f} ms   p95 {percentile(latencies, 0.95) * 1000:.2f} ms   "
+              f"instruções SQL por compra: {percentile(counts, 0.5)}")
+    saving = 1 - p50['checkout'] / p50['duas chamadas']
+    print(f"economia no p50: {saving * 100:.0f}%")
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--purchases', type=int, default=500)
+    args = parser.parse_args()
+    run(args.purchases)
\ No newline at end of file
@@ -0,0 +1,117 @@
+"""Disputa de horários de vistoria por vários usuários ao mesmo tempo.
+
+Cada thread é um usuário que tenta agendar horários concorridos; quando perde
+o horário (409), tenta a primeira alternativa sugerida. Ao final confere no
+banco que nenhum (horário, box) foi vendido duas vezes e que nenhum horário
+passou do número de boxes; qualquer resposta fora de 201/409 também é falha.
+
+Uso (no diretório backend):
+    python -m benchmarks.bench_inspection_booking --bookers 50 --attempts 5 --bays 2
+
+Em SQLite as escritas são serializadas pelo próprio banco; defina BENCH_DATABASE_URL
+para medir no MySQL.
+"""
+import argparse
+import random
+import sys
+import threading
+import time
+from collections import Counter
+
+from benchmarks.common import create_benchmark_app, seed_users, percentile
+
+PASSWORD = 'bench-password'
+
+def seed(bookers):
+    from app import db
+    from app.models import Vehicle
+
+    seed_users(bookers, 'booker', PASSWORD)
+    db.session.add(Vehicle(marca='Fiat', modelo='Uno', ano=2020, preco=50000))
+    db.session.commit()
+    return Vehicle.query.first().id
+
+def booker(client, index, vehicle_id, hot_slots, attempts, barrier, results):
+    rng = random.Random(index)
+    slot = rng.choice(hot_slots)
+    barrier.wait()
+    for _ in range(attempts):
+        start = time.perf_counter()
+        response = client.post('/api/inspections/', json={'vehicle_id': vehicle_id, 'inspection_date': slot})
+        elapsed = time.perf_counter() - start
+        body = response.get_json() or {}
+        results.append((response.status_code, elapsed))
+        if response.status_code == 409 and body.get('alternatives'):
+            slot = body['alternatives'][0]
+        else:
+            slot = rng.choice(hot_slots)
+
+def run(bookers, attempts, bays, hot):
+    from app import db
+    from app.models import Inspection
+    from app.utils.inspection_slots import SlotCalendar
+    from datetime import datetime, time as day_time, timedelta
+
+    # Uma conexão por usuário: sem isso as threads além do pool esperam o pool_timeout e medem a fila do pool
+    app = create_benchmark_app(
+        INSPECTION_BAYS=bays, SESSION_COOKIE_SECURE=False,
+        SQLALCHEMY_ENGINE_OPTIONS={'pool_size': bookers, 'max_overflow': 0}, PASSWORD_HASH_WORKERS=0
+    )
+    with app.app_context():
+        vehicle_id = seed(bookers)
+        calendar = SlotCalendar.from_config(app.config)
+        tomorrow = datetime.utcnow().date() + timedelta(days=1)
+        slots, _ = calendar.availability(tomorrow, 7, {}, now=datetime.combine(tomorrow, day_time()))
+        hot_slots = slots[:hot]
+
+    # Os logins acontecem antes da disputa: um login recusado não pode deixar a barreira esperando
+    clients = []
+    for index in range(bookers):
+        client = app.test_client()
+        response = client.post('/api/users/login', json={'email': f'booker{index}@example.com', 'password': PASSWORD})
+        assert response.status_code == 200, response.get_json()
+        clients.append(client)
+
+    results = []
+    barrier = threading.Barrier(bookers + 1)
+    threads = [
+        threading.Thread(target=booker, args=(client, index, vehicle_id, hot_slots, attempts, barrier, results))
+        for index, client in enumerate(clients)
+    ]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    with app.app_context():
+        per_bay = db.session.query(Inspection.inspection_date, Inspection.bay, db.func.count()) \
+            .group_by(Inspection.inspection_date, Inspection.bay).all()
+        per_slot = Counter()
+        for inspection_date, _, count in per_bay:
+            per_slot[inspection_date] += count
+        double_booked = sum(1 for _, _, count in per_bay if count > 1)
+        overbooked = sum(1 for count in per_slot.values() if count > bays)
+
+    statuses = Counter(status for status, _ in results)
+    others = {status: count for status, count in statuses.items() if status not in (201, 409)}
+    latencies = [latency for _, latency in results]
+    print(f"{bookers} usuários x {attempts} tentativas, {hot} horários concorridos, {bays} box(es) por horário")
+    print(f"requisições: {len(results)} em {elapsed:.2f}s ({len(results) / elapsed:.0f} req/s)")
+    print(f"latência p50 {percentile(latencies, 0.5) * 1000:.1f} ms   p95 {percentile(latencies, 0.95) * 1000:.1f} ms")
+    print(f"agendadas (201): {statuses.get(201, 0)}   horário perdido (409): {statuses.get(409, 0)}   "
+          f"outros: {others or 0}")
+    print(f"vistorias no banco: {sum(per_slot.values())}   (horário, box) duplicados: {double_booked}   "
+          f"horários acima da capacidade: {overbooked}")
+    return double_booked or overbooked or others or statuses.get(201, 0) != sum(per_slot.values())
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--bookers', type=int, default=50)
+    parser.add_argument('--attempts', type=int, default=5)
+    parser.add_argument('--bays', type=int, default=2)
+    parser.add_argument('--hot-slots', type=int, default=4)
+    args = parser.parse_args()
+    sys.exit(1 if run(args.bookers, args.attempts, args.bays, args.hot_slots) else 0)
\ No newline at end of file
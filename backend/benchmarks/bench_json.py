@@ -0,0 +1,69 @@
+"""Compara a serialização JSON das respostas com o encoder padrão e com o orjson.
+
+Os payloads são listas de Purchase e Reservation com os relacionamentos padrão,
+no mesmo formato das rotas de relatório e de reservas.
+
+Uso (no diretório backend):
+    python -m benchmarks.bench_json --rows 2000 --repeat 20
+"""
+import argparse
+import json
+import time
+
+from benchmarks.common import create_benchmark_app, seed_sales, percentile
+
+def _time(function, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        body = function()
+        samples.append(time.perf_counter() - start)
+    return samples, len(body)
+
+def run(rows, repeat):
+    from app.models import Purchase, Reservation
+    from app.utils.json_provider import FastJSONProvider, orjson, _default
+    from app.utils.serialization import eager_options
+
+    app = create_benchmark_app()
+    with app.app_context():
+        seed_sales(rows)
+        payloads = {
+            'purchases': {"purchases": [
+                purchase.to_dict()
+                for purchase in Purchase.query.options(*eager_options(Purchase)).all()
+            ]},
+            'reservations': {"reservations": [
+                reservation.to_dict()
+                for reservation in Reservation.query.options(*eager_options(Reservation)).all()
+            ]}
+        }
+
+    fallback = FastJSONProvider(app)
+    fallback.use_orjson = False
+    encoders = [
+        ("json (stdlib, sort_keys)", lambda payload: json.dumps(
+            payload, default=_default, sort_keys=True, separators=(',', ':')).encode('utf-8')),
+        ("provider sem orjson", fallback.dumps_bytes),
+    ]
+    if orjson is not None:
+        encoders.append(("provider com orjson", FastJSONProvider(app).dumps_bytes))
+    else:
+        print("orjson não instalado; medindo apenas a biblioteca padrão (pip install orjson).")
+
+    for name, payload in payloads.items():
+        print(f"\n== {name}: {rows} linhas ==")
+        baseline = None
+        for label, encode in encoders:
+            samples, size = _time(lambda: encode(payload), repeat)
+            p50 = percentile(samples, 0.5) * 1000
+            baseline = baseline or p50
+            print(f"{label:<26} p50 {p50:8.2f} ms   p95 {percentile(samples, 0.95) * 1000:8.2f} ms"
+                  f"   {size / 1024:8.0f} KiB   {baseline / p50:5.1f}x")
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=2000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+    run(args.rows, args.repeat)
\ No newline at end of file
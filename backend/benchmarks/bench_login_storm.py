@@ -0,0 +1,89 @@
+"""Latência da busca de veículos durante uma rajada de logins.
+
+Leitores consultam o catálogo continuamente; primeiro sem carga (base) e depois
+enquanto várias threads fazem login sem parar. O cenário roda com o hash de senha
+na própria requisição (PASSWORD_HASH_WORKERS=0) e no pool de processos com fila
+limitada, que recusa o excesso com 503 em vez de ocupar todos os workers.
+
+Uso (no diretório backend):
+    python -m benchmarks.bench_login_storm --seconds 5 --readers 2 --logins 16
+"""
+import argparse
+import threading
+import time
+from collections import Counter
+
+from benchmarks.common import create_benchmark_app, seed_users, seed_vehicles, percentile
+
+PASSWORD = 'bench-password'
+
+def reader(client, stop, latencies):
+    while not stop.is_set():
+        start = time.perf_counter()
+        response = client.get('/api/vehicles/?marca=Fiat&limit=20')
+        latencies.append(time.perf_counter() - start)
+        assert response.status_code == 200, response.get_json()
+
+def login(app, prefix, index):
+    client = app.test_client()
+    response = client.post('/api/users/login', json={'email': f'{prefix}{index}@example.com', 'password': PASSWORD})
+    assert response.status_code == 200, response.get_json()
+    return client
+
+def login_storm(app, index, stop, statuses):
+    client = app.test_client()
+    while not stop.is_set():
+        response = client.post('/api/users/login', json={'email': f'storm{index}@example.com', 'password': PASSWORD})
+        statuses.append(response.status_code)
+        if response.status_code == 503:
+            # Cliente bem-comportado: respeita o Retry-After antes de tentar de novo
+            stop.wait(float(response.headers.get('Retry-After', 1)))
+
+def measure(app, readers, logins, seconds):
+    """Retorna as latências da busca e os status dos logins durante ``seconds`` segundos."""
+    stop = threading.Event()
+    latencies, statuses = [], []
+    threads = [threading.Thread(target=reader, args=(login(app, 'reader', index), stop, latencies)) for index in range(readers)]
+    threads += [threading.Thread(target=login_storm, args=(app, index, stop, statuses)) for index in range(logins)]
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return latencies, statuses
+
+def run(seconds, readers, logins, workers, max_pending):
+    # O modo na própria requisição vem primeiro: o pool de processos só é criado no segundo cenário
+    scenarios = [('hash na requisição', 0, max_pending), (f'pool de {workers} processo(s)', workers, max_pending)]
+    for name, scenario_workers, scenario_pending in scenarios:
+        app = create_benchmark_app(
+            SESSION_COOKIE_SECURE=False,
+            SEARCH_CACHE_ENABLED=False,
+            PASSWORD_HASH_WORKERS=scenario_workers,
+            PASSWORD_HASH_MAX_PENDING=scenario_pending
+        )
+        with app.app_context():
+            seed_users(logins, 'storm', PASSWORD)
+            seed_users(readers, 'reader', PASSWORD)
+            seed_vehicles(5000)
+
+        base, _ = measure(app, readers, 0, seconds)
+        storm, statuses = measure(app, readers, logins, seconds)
+        counts = Counter(statuses)
+        print(f"{name}: {readers} leitor(es), {logins} threads de login, {seconds}s por fase")
+        print(f"  busca sem carga:  p50 {percentile(base, 0.5) * 1000:.1f} ms   p95 {percentile(base, 0.95) * 1000:.1f} ms   "
+              f"({len(base) / seconds:.0f} req/s)")
+        print(f"  busca com logins: p50 {percentile(storm, 0.5) * 1000:.1f} ms   p95 {percentile(storm, 0.95) * 1000:.1f} ms   "
+              f"({len(storm) / seconds:.0f} req/s)")
+        print(f"  logins: {counts.get(200, 0) / seconds:.0f}/s aceitos, {counts.get(503, 0) / seconds:.0f}/s recusados (503)")
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--seconds', type=float, default=5)
+    parser.add_argument('--readers', type=int, default=2)
+    parser.add_argument('--logins', type=int, default=16)
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--max-pending', type=int, default=4)
+    args = parser.parse_args()
+    run(args.seconds, args.readers, args.logins, args.workers, args.max_pending)
\ No newline at end of file
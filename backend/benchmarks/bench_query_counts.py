@@ -0,0 +1,107 @@
+"""Verifica que as listagens emitem um número constante de consultas, independente do volume.
+
+Cada endpoint é chamado com poucos e com muitos registros; se o número de
+consultas SQL crescer com o volume, há um relacionamento carregado linha a
+linha (N+1) e o script termina com código 1. Rotas que só leem o usuário ou o
+administrador autenticado devem emitir zero consultas (identidade em cache).
+
+Uso (no diretório backend):
+    python -m benchmarks.bench_query_counts --sizes 5,60
+"""
+import argparse
+import sys
+
+from sqlalchemy import event
+
+from benchmarks.common import create_benchmark_app, seed_sales
+
+USER_ENDPOINTS = [
+    '/api/reservations',
+    '/api/reservations?expand=user,vehicle,inspection.vehicle,purchase.review',
+    '/api/users/me/purchases',
+    '/api/users/me/purchases?expand=buyer,vehicle,reservation.inspection,review',
+    '/api/me/reviews',
+    '/api/me/reviews?expand=purchase.vehicle,purchase.buyer',
+    '/api/vehicles/',
+]
+
+ADMIN_ENDPOINTS = [
+    '/api/admin/users',
+    '/api/admin/vehicles',
+    '/api/admin/inspections',
+    '/api/admin/reservations',
+    '/api/admin/logs',
+    '/api/admin/dashboard',
+    '/api/admin/sales/reports',
+    '/api/admin/sales/dashboard',
+    '/api/admin/sales/reviews',
+    '/api/admin/sales/reviews?fields=id,purchase.buyer,purchase.vehicle.marca',
+]
+
+# Só dependem da identidade autenticada: com o usuário/administrador em cache, nenhuma consulta
+CACHED_USER_ENDPOINTS = [
+    '/api/users/profile',
+]
+
+CACHED_ADMIN_ENDPOINTS = [
+    '/api/admin/profile',
+    '/api/admin/cache',
+    '/api/admin/compression',
+]
+
+def count_queries(app, size):
+    """Retorna {endpoint: número de consultas} para o volume informado."""
+    from app import db
+
+    with app.app_context():
+        seed_sales(size)
+        engine = db.engine
+
+    user_client = app.test_client()
+    response = user_client.post('/api/users/login', json={'email': 'bench@example.com', 'password': 'bench-password'})
+    assert response.status_code == 200, response.get_json()
+    admin_client = app.test_client()
+    response = admin_client.post('/api/admin/login', json={'email': 'admin@example.com', 'password': 'bench-password'})
+    assert response.status_code == 200, response.get_json()
+    headers = {'Authorization': f"Bearer {response.get_json()['token']}"}
+
+    statements = []
+    listener = lambda *args: statements.append(args[2])
+    event.listen(engine, 'before_cursor_execute', listener)
+    counts = {}
+    try:
+        for client, endpoints, extra in ((user_client, USER_ENDPOINTS, {}), (admin_client, ADMIN_ENDPOINTS, headers),
+                                         (user_client, CACHED_USER_ENDPOINTS, {}),
+                                         (admin_client, CACHED_ADMIN_ENDPOINTS, headers)):
+            for endpoint in endpoints:
+                del statements[:]
+                response = client.get(endpoint, headers=extra)
+                assert response.status_code == 200, (endpoint, response.get_json())
+                counts[endpoint] = len(statements)
+    finally:
+        event.remove(engine, 'before_cursor_execute', listener)
+    return counts
+
+def run(sizes):
+    results = []
+    for size in sizes:
+        app = create_benchmark_app(SEARCH_CACHE_ENABLED=False, SESSION_COOKIE_SECURE=False)
+        results.append(count_queries(app, size))
+
+    failures = 0
+    header = ''.join(f'{size:>8}' for size in sizes)
+    print(f"{'endpoint':<78}{header}")
+    for endpoint in results[0]:
+        counts = [result[endpoint] for result in results]
+        grew = len(set(counts)) > 1
+        uncached = endpoint in CACHED_USER_ENDPOINTS + CACHED_ADMIN_ENDPOINTS and any(counts)
+        failures += grew or uncached
+        marker = '  <- N+1' if grew else '  <- identidade sem cache' if uncached else ''
+        print(f"{endpoint:<78}{''.join(f'{count:>8}' for count in counts)}{marker}")
+    return failures
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', default='5,60', help='volumes separados por vírgula')
+    args = parser.parse_args()
+    sys.exit(1 if run([int(size) for size in args.sizes.split(',')]) else 0)
\ No newline at end of file
@@ -0,0 +1,105 @@
+"""Disputa de um mesmo veículo por vários usuários ao mesmo tempo.
+
+Cada thread é um usuário que tenta reservar o mesmo veículo no mesmo instante.
+A reserva é decidida pelo UPDATE condicional (is_reserved = 0 -> 1): a cada
+rodada exatamente uma requisição deve receber 201, as demais 409, e o banco deve
+terminar com uma única reserva ativa. Entre as rodadas o veículo é liberado.
+
+Uso (no diretório backend):
+    python -m benchmarks.bench_vehicle_reservation --users 50 --rounds 10
+
+Em SQLite as escritas são serializadas pelo próprio banco; defina BENCH_DATABASE_URL
+para medir no MySQL.
+"""
+import argparse
+import sys
+import threading
+import time
+from collections import Counter
+
+from benchmarks.common import create_benchmark_app, seed_users, percentile
+
+PASSWORD = 'bench-password'
+
+def reserver(client, vehicle_id, start, done, results):
+    start.wait()
+    began = time.perf_counter()
+    response = client.post('/api/reservations/', json={'vehicle_id': vehicle_id, 'amount': 1000})
+    results.append((response.status_code, time.perf_counter() - began))
+    done.wait()
+
+def release(vehicle_id):
+    """Encerra as reservas da rodada e libera o veículo para a próxima."""
+    from app import db
+    from app.models import Reservation, Vehicle
+
+    Reservation.query.filter_by(vehicle_id=vehicle_id, status='active').update({'status': 'cancelled'})
+    db.session.get(Vehicle, vehicle_id).is_reserved = False
+    db.session.commit()
+
+def run(users, rounds):
+    from app import db
+    from app.models import Reservation, Vehicle
+
+    app = create_benchmark_app(SESSION_COOKIE_SECURE=False)
+    with app.app_context():
+        seed_users(users, 'reserver', PASSWORD)
+        db.session.add(Vehicle(marca='Fiat', modelo='Uno', ano=2020, preco=50000))
+        db.session.commit()
+        vehicle_id = Vehicle.query.first().id
+
+    clients = []
+    for index in range(users):
+        client = app.test_client()
+        response = client.post('/api/users/login', json={'email': f'reserver{index}@example.com', 'password': PASSWORD})
+        assert response.status_code == 200, response.get_json()
+        clients.append(client)
+
+    failures = 0
+    results = []
+    elapsed = 0.0
+    for round_number in range(1, rounds + 1):
+        round_results = []
+        start = threading.Barrier(users + 1)
+        done = threading.Barrier(users + 1)
+        threads = [
+            threading.Thread(target=reserver, args=(client, vehicle_id, start, done, round_results))
+            for client in clients
+        ]
+        for thread in threads:
+            thread.start()
+        start.wait()
+        began = time.perf_counter()
+        done.wait()
+        elapsed += time.perf_counter() - began
+        for thread in threads:
+            thread.join()
+
+        with app.app_context():
+            active = Reservation.query.filter_by(vehicle_id=vehicle_id, status='active').count()
+            reserved = db.session.get(Vehicle, vehicle_id).is_reserved
+            release(vehicle_id)
+
+        statuses = Counter(status for status, _ in round_results)
+        if statuses.get(201, 0) != 1 or statuses.get(409, 0) != users - 1 or active != 1 or not reserved:
+            failures += 1
+            print(f"rodada {round_number}: FALHA   201={statuses.get(201, 0)}   409={statuses.get(409, 0)}   "
+                  f"outros={dict((s, c) for s, c in statuses.items() if s not in (201, 409))}   "
+                  f"reservas ativas={active}   veículo reservado={reserved}")
+        results.extend(round_results)
+
+    latencies = [latency for _, latency in results]
+    statuses = Counter(status for status, _ in results)
+    print(f"{users} usuários x {rounds} rodadas disputando um único veículo")
+    print(f"requisições: {len(results)} em {elapsed:.2f}s ({len(results) / elapsed:.0f} req/s)")
+    print(f"latência p50 {percentile(latencies, 0.5) * 1000:.1f} ms   p95 {percentile(latencies, 0.95) * 1000:.1f} ms")
+    print(f"reservadas (201): {statuses.get(201, 0)}   conflito (409): {statuses.get(409, 0)}   "
+          f"rodadas com mais ou menos de uma reserva ativa: {failures}")
+    return failures
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--users', type=int, default=50)
+    parser.add_argument('--rounds', type=int, default=10)
+    args = parser.parse_args()
+    sys.exit(1 if run(args.users, args.rounds) else 0)
\ No newline at end of file
@@ -0,0 +1,105 @@
+"""Utilitários compartilhados pelos benchmarks (banco SQLite temporário e dados sintéticos)."""
+import contextlib
+import io
+import os
+import random
+import sys
+import tempfile
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# A configuração é lida na importação de app.config, então o banco é definido antes de qualquer import do app
+if 'BENCH_DATABASE_URL' in os.environ:
+    os.environ['DATABASE_URL'] = os.environ['BENCH_DATABASE_URL']
+else:
+    os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(tempfile.mkdtemp(prefix='bench-'), 'bench.db')
+os.environ.setdefault('SECRET_KEY', 'benchmark-secret-key-with-32-bytes!')
+
+MARCAS = ['Fiat', 'Volkswagen', 'Chevrolet', 'Ford', 'Citroën', 'Renault', 'Toyota', 'Honda', 'Hyundai', 'Peugeot']
+
+def create_benchmark_app(**config):
+    """Cria a aplicação com as tabelas recriadas do zero no banco de benchmark."""
+    from app import create_app, db
+    # create_app lista as rotas no stdout; não interessa aqui
+    with contextlib.redirect_stdout(io.StringIO()):
+        app = create_app(config)
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+    return app
+
+def seed_vehicles(count, batch_size=20000, seed=42):
+    """Insere veículos sintéticos em lotes (requer contexto de aplicação)."""
+    from app import db
+    from app.models.vehicle import Vehicle
+
+    rng = random.Random(seed)
+    start = datetime(2020, 1, 1)
+    rows = []
+    for index in range(count):
+        rows.append({
+            'marca': MARCAS[rng.randrange(len(MARCAS))],
+            'modelo': f'Modelo {rng.randrange(300)}',
+            'ano': rng.randint(1995, 2026),
+            'preco': round(rng.uniform(15000, 400000), 2),
+            'is_reserved': rng.random() < 0.2,
+            'created_at': start + timedelta(minutes=index)
+        })
+        if len(rows) == batch_size:
+            db.session.execute(db.insert(Vehicle), rows)
+            rows = []
+    if rows:
+        db.session.execute(db.insert(Vehicle), rows)
+    db.session.commit()
+
+def seed_users(count, prefix, password):
+    """Cria ``count`` usuários {prefix}N@example.com com a mesma senha (requer contexto)."""
+    from app import db
+    from app.models import User
+    from werkzeug.security import generate_password_hash
+
+    # Um único hash para todos: os benchmarks medem as rotas, não o login
+    password_hash = generate_password_hash(password)
+    db.session.add_all(
+        User(username=f'{prefix}{index}', email=f'{prefix}{index}@example.com', password_hash=password_hash)
+        for index in range(count)
+    )
+    db.session.commit()
+
+def seed_sales(size):
+    """Cria um usuário e um administrador com ``size`` registros em cada tabela (requer contexto)."""
+    from app import db
+    from app.models import User, Admin, AdminLog, Vehicle, Inspection, Reservation, Purchase, Review
+
+    user = User(username='bench', email='bench@example.com')
+    user.set_password('bench-password')
+    admin = Admin(username='bench-admin', email='admin@example.com', is_super_admin=True)
+    admin.set_password('bench-password')
+    db.session.add_all([user, admin])
+    db.session.flush()
+
+    seed_vehicles(size)
+    vehicles = Vehicle.query.order_by(Vehicle.id).all()
+    start = datetime(2030, 1, 1, 9)
+    for index, vehicle in enumerate(vehicles):
+        inspection = Inspection(user_id=user.id, vehicle_id=vehicle.id, status='approved',
+                                inspection_date=start + timedelta(hours=index))
+        db.session.add(inspection)
+        db.session.flush()
+        reservation = Reservation(user_id=user.id, vehicle_id=vehicle.id, inspection_id=inspection.id,
+                                  amount=1000, status='confirmed')
+        db.session.add(reservation)
+        db.session.flush()
+        purchase = Purchase(user_id=user.id, vehicle_id=vehicle.id, reservation_id=reservation.id,
+                            final_price=vehicle.preco)
+        db.session.add(purchase)
+        db.session.flush()
+        db.session.add(Review(purchase_id=purchase.id, vehicle_rating=5, service_rating=4))
+        db.session.add(AdminLog(admin_id=admin.id, action='BENCH', description=f'Registro {index}'))
+        db.session.add(User(username=f'user{index}', email=f'user{index}@example.com', password_hash='x'))
+    db.session.commit()
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
\ No newline at end of file
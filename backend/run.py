@@ -1,9 +1,9 @@
-from dotenv import load_dotenv
-load_dotenv()  
-
-from app import create_app
-
-app = create_app()
-
-if __name__ == "__main__":
+from dotenv import load_dotenv
+load_dotenv()  
+
+from app import create_app
+
+app = create_app()
+
+if __name__ == "__main__":
     app.run(host='127.0.0.1', port=8080, debug=True)
\ No newline at end of file
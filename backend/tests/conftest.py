@@ -0,0 +1,57 @@
+"""Fixtures compartilhadas pelos testes (banco SQLite temporário, recriado a cada teste)."""
+import contextlib
+import io
+import os
+import sys
+import tempfile
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# A configuração é lida na importação de app.config, então o banco é definido antes de qualquer import do app
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(tempfile.mkdtemp(prefix='tests-'), 'tests.db')
+os.environ.setdefault('SECRET_KEY', 'test-secret-key-with-at-least-32-bytes')
+
+TEST_CONFIG = {
+    'TESTING': True,
+    'SESSION_COOKIE_SECURE': False,
+    # Hash barato e na própria requisição: os testes medem as rotas, não o custo da senha
+    'PASSWORD_HASH_METHOD': 'pbkdf2:sha256:1000',
+    'PASSWORD_HASH_WORKERS': 0,
+    'AUDIT_LOG_ASYNC': False,
+    'RESERVATION_SWEEP_INTERVAL_SECONDS': 0,
+    'SEARCH_CACHE_ENABLED': False
+}
+
+def create_test_app(**config):
+    """Cria a aplicação com as tabelas recriadas do zero (config: valores extras)."""
+    from app import create_app, db
+
+    # create_app lista as rotas no stdout; não interessa aqui
+    with contextlib.redirect_stdout(io.StringIO()):
+        app = create_app({**TEST_CONFIG, **config})
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+    return app
+
+def login(client, email, password, admin=False):
+    """Autentica o cliente; para administradores retorna o header Authorization."""
+    response = client.post('/api/admin/login' if admin else '/api/users/login', json={'email': email, 'password': password})
+    assert response.status_code == 200, response.get_json()
+    if admin:
+        return {'Authorization': f"Bearer {response.get_json()['token']}"}
+    return {}
+
+@pytest.fixture
+def make_app():
+    return create_test_app
+
+@pytest.fixture
+def app(make_app):
+    return make_app()
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
\ No newline at end of file
@@ -0,0 +1,39 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app import db
+from app.models import Admin
+from app.utils.audit_log import audit_log
+from tests.conftest import login
+
+PASSWORD = 'test-password'
+
+@pytest.fixture
+def admin_client(app):
+    with app.app_context():
+        admin = Admin(username='viewer', email='viewer@example.com')
+        admin.set_password(PASSWORD)
+        admin.set_permissions(['view_reports'])
+        db.session.add(admin)
+        db.session.commit()
+        admin_id = admin.id
+    client = app.test_client()
+    return client, login(client, 'viewer@example.com', PASSWORD, admin=True), admin_id
+
+@pytest.mark.parametrize('endpoint', ['/api/admin/cache', '/api/admin/compression', '/api/admin/reservations/sweeper'])
+def test_stats_endpoints_require_permission(admin_client, endpoint):
+    client, headers, _ = admin_client
+    assert client.get(endpoint, headers=headers).status_code == 403
+
+def test_last_login_update_invalidates_cached_admin(app, admin_client):
+    client, headers, admin_id = admin_client
+    client.get('/api/admin/profile', headers=headers)
+
+    # O escritor de auditoria grava last_login com um UPDATE direto, fora do ORM
+    later = datetime.utcnow() + timedelta(days=1)
+    with app.app_context():
+        audit_log.touch_last_login(admin_id, later)
+
+    profile = client.get('/api/admin/profile', headers=headers).get_json()['admin']
+    assert profile['last_login'].startswith(later.date().isoformat())
\ No newline at end of file
@@ -0,0 +1,105 @@
+"""As listagens emitem o mesmo número de consultas com poucos e com muitos registros (sem N+1)."""
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+
+from tests.conftest import create_test_app, login
+
+PASSWORD = 'test-password'
+SIZES = (5, 60)
+
+USER_ENDPOINTS = [
+    '/api/reservations',
+    '/api/reservations?expand=user,vehicle,inspection.vehicle,purchase.review',
+    '/api/users/me/purchases',
+    '/api/users/me/purchases?expand=buyer,vehicle,reservation.inspection,review',
+    '/api/me/reviews',
+    '/api/me/reviews?expand=purchase.vehicle,purchase.buyer',
+    '/api/vehicles/',
+]
+
+ADMIN_ENDPOINTS = [
+    '/api/admin/users',
+    '/api/admin/vehicles',
+    '/api/admin/inspections',
+    '/api/admin/reservations',
+    '/api/admin/logs',
+    '/api/admin/dashboard',
+    '/api/admin/sales/reports',
+    '/api/admin/sales/dashboard',
+    '/api/admin/sales/reviews',
+    '/api/admin/sales/reviews?fields=id,purchase.buyer,purchase.vehicle.marca',
+]
+
+def seed(size):
+    """Cria um usuário e um administrador com ``size`` registros em cada tabela (requer contexto)."""
+    from app import db
+    from app.models import User, Admin, AdminLog, Vehicle, Inspection, Reservation, Purchase, Review
+
+    user = User(username='tester', email='tester@example.com')
+    user.set_password(PASSWORD)
+    admin = Admin(username='test-admin', email='admin@example.com', is_super_admin=True)
+    admin.set_password(PASSWORD)
+    db.session.add_all([user, admin])
+    db.session.flush()
+
+    start = datetime(2030, 1, 1, 9)
+    for index in range(size):
+        vehicle = Vehicle(marca='Fiat', modelo=f'Modelo {index}', ano=2020, preco=50000 + index)
+        db.session.add(vehicle)
+        db.session.flush()
+        inspection = Inspection(user_id=user.id, vehicle_id=vehicle.id, status='approved',
+                                inspection_date=start + timedelta(hours=index))
+        db.session.add(inspection)
+        db.session.flush()
+        reservation = Reservation(user_id=user.id, vehicle_id=vehicle.id, inspection_id=inspection.id,
+                                  amount=1000, status='confirmed')
+        db.session.add(reservation)
+        db.session.flush()
+        purchase = Purchase(user_id=user.id, vehicle_id=vehicle.id, reservation_id=reservation.id,
+                            final_price=vehicle.preco)
+        db.session.add(purchase)
+        db.session.flush()
+        db.session.add(Review(purchase_id=purchase.id, vehicle_rating=5, service_rating=4))
+        db.session.add(AdminLog(admin_id=admin.id, action='TEST', description=f'Registro {index}'))
+        db.session.add(User(username=f'user{index}', email=f'user{index}@example.com', password_hash='x'))
+    db.session.commit()
+
+def count_queries(size):
+    """Retorna {endpoint: número de consultas} com ``size`` registros por tabela."""
+    from app import db
+
+    app = create_test_app()
+    with app.app_context():
+        seed(size)
+        engine = db.engine
+
+    user_client = app.test_client()
+    login(user_client, 'tester@example.com', PASSWORD)
+    admin_client = app.test_client()
+    headers = login(admin_client, 'admin@example.com', PASSWORD, admin=True)
+
+    statements = []
+    listener = lambda *args: statements.append(args[2])
+    event.listen(engine, 'before_cursor_execute', listener)
+    counts = {}
+    try:
+        for client, endpoints, extra in ((user_client, USER_ENDPOINTS, {}), (admin_client, ADMIN_ENDPOINTS, headers)):
+            for endpoint in endpoints:
+                del statements[:]
+                response = client.get(endpoint, headers=extra)
+                assert response.status_code == 200, (endpoint, response.get_json())
+                counts[endpoint] = len(statements)
+    finally:
+        event.remove(engine, 'before_cursor_execute', listener)
+    return counts
+
+@pytest.fixture(scope='module')
+def query_counts():
+    return {size: count_queries(size) for size in SIZES}
+
+@pytest.mark.parametrize('endpoint', USER_ENDPOINTS + ADMIN_ENDPOINTS)
+def test_query_count_does_not_grow_with_rows(query_counts, endpoint):
+    counts = [query_counts[size][endpoint] for size in SIZES]
+    assert len(set(counts)) == 1, f'{endpoint}: {dict(zip(SIZES, counts))} consultas'
\ No newline at end of file
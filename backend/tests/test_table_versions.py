@@ -0,0 +1,34 @@
+from sqlalchemy.pool import QueuePool
+
+from app import db
+from app.models import TableVersion, Vehicle
+from app.utils.table_versions import record_table_change
+
+def vehicle_version():
+    return db.session.scalar(db.select(TableVersion.version).where(TableVersion.name == 'vehicle'))
+
+def test_commit_with_single_connection_pool_bumps_version(make_app):
+    # Com uma única conexão no pool, o incremento não pode pedir outra: esperaria o timeout e falharia
+    app = make_app(SQLALCHEMY_ENGINE_OPTIONS={
+        'poolclass': QueuePool, 'pool_size': 1, 'max_overflow': 0, 'pool_timeout': 1
+    })
+    with app.app_context():
+        db.session.add(Vehicle(marca='Fiat', modelo='Uno', ano=2010, preco=15000))
+        db.session.commit()
+        assert vehicle_version() == 1
+
+        db.session.execute(db.update(Vehicle).values(preco=16000))
+        record_table_change(db.session, 'vehicle')
+        db.session.commit()
+        assert vehicle_version() == 2
+
+def test_rollback_discards_version_bump(app):
+    with app.app_context():
+        db.session.add(Vehicle(marca='Fiat', modelo='Uno', ano=2010, preco=15000))
+        db.session.commit()
+
+        db.session.add(Vehicle(marca='Ford', modelo='Ka', ano=2012, preco=20000))
+        db.session.flush()
+        db.session.rollback()
+        db.session.commit()
+        assert vehicle_version() == 1
\ No newline at end of file
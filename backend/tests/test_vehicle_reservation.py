@@ -0,0 +1,64 @@
+"""Vários usuários disputam o mesmo veículo ao mesmo tempo: só uma reserva vence."""
+import threading
+from collections import Counter
+
+import pytest
+
+from app import db
+from app.models import Reservation, User, Vehicle
+from tests.conftest import login
+
+PASSWORD = 'test-password'
+USERS = 20
+
+@pytest.fixture
+def contenders(make_app):
+    # Uma conexão por usuário: ninguém espera o pool, todos chegam juntos ao UPDATE condicional
+    app = make_app(SQLALCHEMY_ENGINE_OPTIONS={'pool_size': USERS, 'max_overflow': 0})
+    with app.app_context():
+        for index in range(USERS):
+            user = User(username=f'reserver{index}', email=f'reserver{index}@example.com')
+            user.set_password(PASSWORD)
+            db.session.add(user)
+        db.session.add_all([
+            Vehicle(marca='Fiat', modelo='Uno', ano=2020, preco=50000),
+            Vehicle(marca='Ford', modelo='Ka', ano=2021, preco=55000)
+        ])
+        db.session.commit()
+        vehicle_ids = list(db.session.scalars(db.select(Vehicle.id).order_by(Vehicle.id)))
+
+    clients = []
+    for index in range(USERS):
+        client = app.test_client()
+        login(client, f'reserver{index}@example.com', PASSWORD)
+        clients.append(client)
+    return app, clients, vehicle_ids
+
+def race(clients, vehicle_id):
+    """Dispara a reserva de todos os clientes no mesmo instante; retorna os status recebidos."""
+    barrier = threading.Barrier(len(clients))
+    statuses = []
+
+    def reserve(client):
+        barrier.wait()
+        response = client.post('/api/reservations/', json={'vehicle_id': vehicle_id, 'amount': 1000})
+        statuses.append(response.status_code)
+
+    threads = [threading.Thread(target=reserve, args=(client,)) for client in clients]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return Counter(statuses)
+
+def test_exactly_one_reservation_per_contested_vehicle(contenders):
+    app, clients, vehicle_ids = contenders
+    for vehicle_id in vehicle_ids:
+        statuses = race(clients, vehicle_id)
+        assert statuses == {201: 1, 409: USERS - 1}, (vehicle_id, statuses)
+
+    with app.app_context():
+        for vehicle_id in vehicle_ids:
+            active = Reservation.query.filter_by(vehicle_id=vehicle_id, status='active').count()
+            assert active == 1
+            assert db.session.get(Vehicle, vehicle_id).is_reserved
\ No newline at end of file
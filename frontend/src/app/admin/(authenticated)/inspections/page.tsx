@@ -26,16 +26,22 @@ export default function InspectionsPage() {
   const [inspections, setInspections] = useState<Inspection[]>([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState('');
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [statusFilter, setStatusFilter] = useState<string>('all');
 
   useEffect(() => {
     fetchInspections();
   }, []);
 
-  const fetchInspections = async () => {
+  // A API devolve uma página por vez; next_cursor indica que há mais registros
+  const fetchInspections = async (cursor?: string) => {
     try {
-      const response = await apiAdmin.get('/api/admin/inspections');
-      setInspections(response.data.inspections);
+      const response = await apiAdmin.get('/api/admin/inspections', {
+        params: cursor ? { cursor } : undefined
+      });
+      setInspections(prev => cursor ? [...prev, ...response.data.inspections] : response.data.inspections);
+      setNextCursor(response.data.next_cursor);
     } catch (err: any) {
       setError(err.response?.data?.error || 'Erro ao carregar vistorias');
       console.error('Erro ao carregar vistorias:', err);
@@ -44,6 +50,13 @@ export default function InspectionsPage() {
     }
   };
 
+  const handleLoadMore = async () => {
+    if (!nextCursor) return;
+    setLoadingMore(true);
+    await fetchInspections(nextCursor);
+    setLoadingMore(false);
+  };
+
   const filteredInspections = inspections.filter(inspection => 
     statusFilter === 'all' || inspection.status === statusFilter
   );
@@ -136,7 +149,7 @@ export default function InspectionsPage() {
         <div>
           <h1 className="text-2xl font-bold text-gray-900">🔍 Gerenciar Vistorias</h1>
           <p className="text-gray-600 mt-2">
-            {inspections.length} vistoria{inspections.length !== 1 ? 's' : ''} agendada{inspections.length !== 1 ? 's' : ''}
+            {inspections.length}{nextCursor ? '+' : ''} vistoria{inspections.length !== 1 ? 's' : ''} agendada{inspections.length !== 1 ? 's' : ''}
           </p>
         </div>
         
@@ -167,6 +180,18 @@ export default function InspectionsPage() {
         searchKey="vehicle"
         emptyMessage="Nenhuma vistoria encontrada"
       />
+
+      {nextCursor && (
+        <div className="mt-6 text-center">
+          <button
+            onClick={handleLoadMore}
+            disabled={loadingMore}
+            className="bg-blue-600 text-white px-6 py-2 rounded-lg hover:bg-blue-700 font-medium disabled:opacity-50 disabled:cursor-not-allowed"
+          >
+            {loadingMore ? 'Carregando...' : 'Carregar mais vistorias'}
+          </button>
+        </div>
+      )}
     </div>
   );
 }
\ No newline at end of file
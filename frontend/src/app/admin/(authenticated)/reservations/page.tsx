@@ -10,7 +10,7 @@ interface Reservation {
   vehicle_id: number;
   inspection_id: number | null;
   amount: number;
-  status: 'active' | 'completed' | 'cancelled';
+  status: 'active' | 'completed' | 'cancelled' | 'expired';
   created_at: string;
   user?: {
     username: string;
@@ -30,16 +30,22 @@ export default function ReservationsPage() {
   const [reservations, setReservations] = useState<Reservation[]>([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState('');
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [statusFilter, setStatusFilter] = useState<string>('all');
 
   useEffect(() => {
     fetchReservations();
   }, []);
 
-  const fetchReservations = async () => {
+  // A API devolve uma página por vez; next_cursor indica que há mais registros
+  const fetchReservations = async (cursor?: string) => {
     try {
-      const response = await apiAdmin.get('/api/admin/reservations');
-      setReservations(response.data.reservations);
+      const response = await apiAdmin.get('/api/admin/reservations', {
+        params: cursor ? { cursor } : undefined
+      });
+      setReservations(prev => cursor ? [...prev, ...response.data.reservations] : response.data.reservations);
+      setNextCursor(response.data.next_cursor);
     } catch (err: any) {
       setError(err.response?.data?.error || 'Erro ao carregar reservas');
       console.error('Erro ao carregar reservas:', err);
@@ -48,6 +54,13 @@ export default function ReservationsPage() {
     }
   };
 
+  const handleLoadMore = async () => {
+    if (!nextCursor) return;
+    setLoadingMore(true);
+    await fetchReservations(nextCursor);
+    setLoadingMore(false);
+  };
+
   const filteredReservations = reservations.filter(reservation => 
     statusFilter === 'all' || reservation.status === statusFilter
   );
@@ -56,7 +69,8 @@ export default function ReservationsPage() {
     const statusConfig = {
       active: { label: '🟢 Ativa', color: 'bg-green-100 text-green-800' },
       completed: { label: '✅ Concluída', color: 'bg-blue-100 text-blue-800' },
-      cancelled: { label: '❌ Cancelada', color: 'bg-red-100 text-red-800' }
+      cancelled: { label: '❌ Cancelada', color: 'bg-red-100 text-red-800' },
+      expired: { label: '⌛ Expirada', color: 'bg-gray-100 text-gray-800' }
     };
     
     const config = statusConfig[status as keyof typeof statusConfig] || statusConfig.active;
@@ -177,6 +191,7 @@ export default function ReservationsPage() {
             <option value="active">Ativas</option>
             <option value="completed">Concluídas</option>
             <option value="cancelled">Canceladas</option>
+            <option value="expired">Expiradas</option>
           </select>
         </div>
       </div>
@@ -219,6 +234,18 @@ export default function ReservationsPage() {
         searchKey="user"
         emptyMessage="Nenhuma reserva encontrada"
       />
+
+      {nextCursor && (
+        <div className="mt-6 text-center">
+          <button
+            onClick={handleLoadMore}
+            disabled={loadingMore}
+            className="bg-blue-600 text-white px-6 py-2 rounded-lg hover:bg-blue-700 font-medium disabled:opacity-50 disabled:cursor-not-allowed"
+          >
+            {loadingMore ? 'Carregando...' : 'Carregar mais reservas'}
+          </button>
+        </div>
+      )}
     </div>
   );
 }
\ No newline at end of file
@@ -16,16 +16,22 @@ export default function UsersPage() {
   const [users, setUsers] = useState<User[]>([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState('');
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const router = useRouter();
 
   useEffect(() => {
     fetchUsers();
   }, []);
 
-  const fetchUsers = async () => {
+  // A API devolve uma página por vez; next_cursor indica que há mais registros
+  const fetchUsers = async (cursor?: string) => {
     try {
-      const response = await apiAdmin.get('/api/admin/users');
-      setUsers(response.data.users);
+      const response = await apiAdmin.get('/api/admin/users', {
+        params: cursor ? { cursor } : undefined
+      });
+      setUsers(prev => cursor ? [...prev, ...response.data.users] : response.data.users);
+      setNextCursor(response.data.next_cursor);
     } catch (err: any) {
       setError(err.response?.data?.error || 'Erro ao carregar usuários');
       console.error('Erro ao carregar usuários:', err);
@@ -34,6 +40,13 @@ export default function UsersPage() {
     }
   };
 
+  const handleLoadMore = async () => {
+    if (!nextCursor) return;
+    setLoadingMore(true);
+    await fetchUsers(nextCursor);
+    setLoadingMore(false);
+  };
+
   const handleEditUser = (user: User) => {
     router.push(`/admin/users/${user.id}`);
   };
@@ -93,7 +106,7 @@ export default function UsersPage() {
       <div className="mb-6">
         <h1 className="text-2xl font-bold text-gray-900">👥 Gerenciar Usuários</h1>
         <p className="text-gray-600 mt-2">
-          {users.length} usuário{users.length !== 1 ? 's' : ''} cadastrado{users.length !== 1 ? 's' : ''} no sistema
+          {users.length}{nextCursor ? '+' : ''} usuário{users.length !== 1 ? 's' : ''} cadastrado{users.length !== 1 ? 's' : ''} no sistema
         </p>
       </div>
 
@@ -110,6 +123,18 @@ export default function UsersPage() {
         searchKey="username"
         emptyMessage="Nenhum usuário encontrado"
       />
+
+      {nextCursor && (
+        <div className="mt-6 text-center">
+          <button
+            onClick={handleLoadMore}
+            disabled={loadingMore}
+            className="bg-blue-600 text-white px-6 py-2 rounded-lg hover:bg-blue-700 font-medium disabled:opacity-50 disabled:cursor-not-allowed"
+          >
+            {loadingMore ? 'Carregando...' : 'Carregar mais usuários'}
+          </button>
+        </div>
+      )}
     </div>
   );
 }
\ No newline at end of file
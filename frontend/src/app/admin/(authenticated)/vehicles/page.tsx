@@ -20,16 +20,22 @@ export default function VehiclesPage() {
   const [vehicles, setVehicles] = useState<Vehicle[]>([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState('');
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const router = useRouter();
 
   useEffect(() => {
     fetchVehicles();
   }, []);
 
-  const fetchVehicles = async () => {
+  // A API devolve uma página por vez; next_cursor indica que há mais registros
+  const fetchVehicles = async (cursor?: string) => {
     try {
-      const response = await apiAdmin.get('/api/admin/vehicles');
-      setVehicles(response.data.vehicles);
+      const response = await apiAdmin.get('/api/admin/vehicles', {
+        params: cursor ? { cursor } : undefined
+      });
+      setVehicles(prev => cursor ? [...prev, ...response.data.vehicles] : response.data.vehicles);
+      setNextCursor(response.data.next_cursor);
     } catch (err: any) {
       setError(err.response?.data?.error || 'Erro ao carregar veículos');
       console.error('Erro ao carregar veículos:', err);
@@ -38,6 +44,13 @@ export default function VehiclesPage() {
     }
   };
 
+  const handleLoadMore = async () => {
+    if (!nextCursor) return;
+    setLoadingMore(true);
+    await fetchVehicles(nextCursor);
+    setLoadingMore(false);
+  };
+
   const handleAddVehicle = () => {
     router.push('/admin/vehicles/new');
   };
@@ -119,7 +132,7 @@ export default function VehiclesPage() {
         <div>
           <h1 className="text-2xl font-bold text-gray-900">🚗 Gerenciar Veículos</h1>
           <p className="text-gray-600 mt-2">
-            {vehicles.length} veículo{vehicles.length !== 1 ? 's' : ''} no sistema
+            {vehicles.length}{nextCursor ? '+' : ''} veículo{vehicles.length !== 1 ? 's' : ''} no sistema
           </p>
         </div>
         <button 
@@ -143,6 +156,18 @@ export default function VehiclesPage() {
         searchKey="modelo"
         emptyMessage="Nenhum veículo encontrado"
       />
+
+      {nextCursor && (
+        <div className="mt-6 text-center">
+          <button
+            onClick={handleLoadMore}
+            disabled={loadingMore}
+            className="bg-blue-600 text-white px-6 py-2 rounded-lg hover:bg-blue-700 font-medium disabled:opacity-50 disabled:cursor-not-allowed"
+          >
+            {loadingMore ? 'Carregando...' : 'Carregar mais veículos'}
+          </button>
+        </div>
+      )}
     </div>
   );
 }
\ No newline at end of file
@@ -6,7 +6,7 @@ import Button from './ui/Button';
 
 interface Reservation {
   id: number;
-  status: 'active' | 'completed' | 'cancelled';
+  status: 'active' | 'completed' | 'cancelled' | 'expired';
 }
 
 interface ReservationActionsProps {
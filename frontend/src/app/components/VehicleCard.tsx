@@ -12,6 +12,7 @@ interface Vehicle {
   preco: number;
   is_reserved: boolean;
   photo_url: string | null;
+  thumbnail_url?: string | null;
   created_at: string;
 }
 
@@ -24,7 +25,7 @@ const VehicleCard: React.FC<VehicleCardProps> = ({ vehicle }) => {
     <div className="bg-white rounded-lg shadow-md overflow-hidden">
       {vehicle.photo_url ? (
         <img
-          src={vehicle.photo_url}
+          src={vehicle.thumbnail_url || vehicle.photo_url}
           alt={`${vehicle.marca} ${vehicle.modelo}`}
           className="w-full h-48 object-cover"
         />
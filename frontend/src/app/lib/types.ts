@@ -13,6 +13,7 @@ export interface Vehicle {
   preco: number;
   is_reserved: boolean;
   photo_url: string | null;
+  thumbnail_url?: string | null;
   created_at: string;
 }
 
@@ -25,7 +25,7 @@ const ConfirmReservationPage: React.FC = () => {
   const handleConfirm = async () => {
     try {
       console.log('Confirmando reserva:', { reservationId });
-      await api.patch(`/api/reservations/${reservationId}/confirm`, {});
+      await api.post(`/api/reservations/${reservationId}/checkout`, {});
       router.push('/dashboard');
     } catch (err: any) {
       setError(err.message || 'Erro ao confirmar reserva.');
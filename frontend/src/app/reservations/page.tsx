@@ -11,7 +11,7 @@ interface Reservation {
   vehicle_id: number;
   amount: number;
   inspection_id?: number;
-  status: 'active' | 'completed' | 'cancelled';
+  status: 'active' | 'completed' | 'cancelled' | 'expired';
   created_at: string;
   vehicle: {
     id: number;
@@ -85,7 +85,7 @@ const ReservationsPage: React.FC = () => {
                   Valor do Sinal: R${reservation.amount.toFixed(2)}
                 </p>
                 <p className="text-[var(--foreground)]">
-                  Status: {reservation.status === 'active' ? 'Ativa' : reservation.status === 'completed' ? 'Concluída' : 'Cancelada'}
+                  Status: {reservation.status === 'active' ? 'Ativa' : reservation.status === 'completed' ? 'Concluída' : reservation.status === 'expired' ? 'Expirada' : 'Cancelada'}
                 </p>
                 <p className="text-[var(--foreground)]">
                   Data: {new Date(reservation.created_at).toLocaleDateString('pt-BR')}